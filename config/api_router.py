@@ -2,6 +2,7 @@ from django.conf import settings
 from rest_framework.routers import DefaultRouter, SimpleRouter
 
 from demanage.boards.views import BoardViewSet
+from demanage.organizations.api.views import OrganizationViewSet
 from demanage.users.api.views import UserViewSet
 
 if settings.DEBUG:
@@ -11,6 +12,7 @@ else:
 
 router.register("users", UserViewSet)
 router.register("boards", BoardViewSet)
+router.register("organizations", OrganizationViewSet)
 
 
 # api:{basename}-[detail/list]
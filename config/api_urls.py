@@ -23,4 +23,6 @@ urlpatterns = [
     # Endpoints
     path("", include("demanage.invitations.api_urls", namespace="invitations")),
     path("", include("demanage.boards.urls")),
+    path("", include("demanage.activity.api.urls")),
+    path("", include("demanage.imports.api_urls", namespace="imports")),
 ]
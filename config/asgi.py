@@ -0,0 +1,38 @@
+"""
+ASGI config for Demanage project.
+
+It exposes the ASGI callable as a module-level variable named ``application``.
+It serves board event streams (Server-Sent Events) only and runs as a separate
+process (see `compose/production/django/events/start`): the API is served by
+the WSGI application (`config.wsgi`).
+
+For more information on this file, see
+https://docs.djangoproject.com/en/dev/howto/deployment/asgi/
+
+"""
+import os
+import sys
+from pathlib import Path
+
+import django
+
+# This allows easy placement of apps within the interior
+# demanage directory.
+ROOT_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(ROOT_DIR / "demanage"))
+# We defer to a DJANGO_SETTINGS_MODULE already in the environment.
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.production")
+
+django.setup(set_prefix=False)
+
+# Import stream application here, so apps are loaded first
+from demanage.events import streams  # noqa isort:skip
+
+
+# This application object is used by any ASGI server configured to use this file.
+async def application(scope, receive, send):
+    if scope["type"] == "http" and streams.match(scope):
+        await streams.stream_application(scope, receive, send)
+    elif scope["type"] == "http":
+        await send({"type": "http.response.start", "status": 404, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
@@ -86,6 +86,9 @@ LOCAL_APPS = [
     "demanage.members.apps.MembersConfig",
     "demanage.invitations.apps.InvitationsConfig",
     "demanage.boards.apps.BoardsConfig",
+    "demanage.events.apps.EventsConfig",
+    "demanage.activity.apps.ActivityConfig",
+    "demanage.imports.apps.ImportsConfig",
 ]
 # https://docs.djangoproject.com/en/dev/ref/settings/#installed-apps
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
@@ -101,6 +104,10 @@ MIGRATION_MODULES = {"sites": "demanage.contrib.sites.migrations"}
 AUTHENTICATION_BACKENDS = [
     "django.contrib.auth.backends.ModelBackend",
     "allauth.account.auth_backends.AuthenticationBackend",
+    # Membership permissions are implied by Member rows (not guardian rows)
+    "demanage.members.backends.MembershipPermissionBackend",
+    # Board permissions bundled by board roles (one row per user and board)
+    "demanage.boards.backends.BoardRoleBackend",
     "guardian.backends.ObjectPermissionBackend",
 ]
 # https://docs.djangoproject.com/en/dev/ref/settings/#auth-user-model
@@ -144,6 +151,7 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.common.BrokenLinkEmailsMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "demanage.activity.middleware.ActivityMiddleware",
 ]
 
 # STATIC
@@ -287,6 +295,25 @@ CELERY_TASK_TIME_LIMIT = 5 * 60
 CELERY_TASK_SOFT_TIME_LIMIT = 60
 # http://docs.celeryproject.org/en/latest/userguide/configuration.html#beat-scheduler
 CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
+# https://docs.celeryproject.org/en/stable/userguide/periodic-tasks.html#beat-entries
+CELERY_BEAT_SCHEDULE = {
+    "ensure-activity-partitions": {
+        "task": "demanage.activity.tasks.ensure_activity_partitions",
+        "schedule": 24 * 60 * 60,
+    },
+    "drop-expired-activity-partitions": {
+        "task": "demanage.activity.tasks.drop_expired_activity_partitions",
+        "schedule": 24 * 60 * 60,
+    },
+    "purge-board-tombstones": {
+        "task": "demanage.boards.tasks.purge_board_tombstones",
+        "schedule": 24 * 60 * 60,
+    },
+    "reconcile-organization-counters": {
+        "task": "demanage.organizations.tasks.reconcile_organization_counters",
+        "schedule": 60 * 60,
+    },
+}
 
 # django-allauth
 # ------------------------------------------------------------------------------
@@ -333,3 +360,24 @@ SPECTACULAR_SETTINGS = {
 CORS_URLS_REGEX = r"^/api/.*$"
 # Your stuff...
 # ------------------------------------------------------------------------------
+# Boards
+BOARDS_RESPONSE_CACHE_ENABLED = env.bool("BOARDS_RESPONSE_CACHE_ENABLED", True)
+BOARDS_RESPONSE_CACHE_TIMEOUT = env.int("BOARDS_RESPONSE_CACHE_TIMEOUT", 5 * 60)
+BOARDS_SNAPSHOT_TIMEOUT = env.int("BOARDS_SNAPSHOT_TIMEOUT", 60 * 60)
+# Boards with more cards are cloned in background (see demanage.boards.clone)
+BOARDS_CLONE_ASYNC_CARDS = env.int("BOARDS_CLONE_ASYNC_CARDS", 1000)
+# Delta sync (see demanage.boards.sync)
+BOARDS_SYNC_OVERLAP = env.int("BOARDS_SYNC_OVERLAP", 5)
+BOARDS_SYNC_MAX_RESULTS = env.int("BOARDS_SYNC_MAX_RESULTS", 1000)
+BOARDS_TOMBSTONE_RETENTION_DAYS = env.int("BOARDS_TOMBSTONE_RETENTION_DAYS", 30)
+# Organizations
+ORGANIZATIONS_LIST_CACHE_TIMEOUT = env.int("ORGANIZATIONS_LIST_CACHE_TIMEOUT", 10 * 60)
+# Board event streams (see demanage.events)
+EVENTS_BACKEND = env(
+    "EVENTS_BACKEND", default="demanage.events.backends.InProcessPubSub"
+)
+EVENTS_HEARTBEAT_INTERVAL = env.int("EVENTS_HEARTBEAT_INTERVAL", 15)
+EVENTS_RECHECK_INTERVAL = env.int("EVENTS_RECHECK_INTERVAL", 5 * 60)
+# Activity log partitions (see demanage.activity.partitions)
+ACTIVITY_PARTITIONS_AHEAD = env.int("ACTIVITY_PARTITIONS_AHEAD", 3)
+ACTIVITY_RETENTION_MONTHS = env.int("ACTIVITY_RETENTION_MONTHS", 12)
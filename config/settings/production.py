@@ -209,3 +209,8 @@ sentry_sdk.init(
 
 # Your stuff...
 # ------------------------------------------------------------------------------
+# Board event streams are delivered between workers with Redis pub/sub
+EVENTS_BACKEND = env(
+    "EVENTS_BACKEND", default="demanage.events.backends.RedisPubSub"
+)
+EVENTS_REDIS_URL = env("REDIS_URL")
@@ -0,0 +1,13 @@
+from demanage.pagination import KeysetPagination
+
+
+class ActivityPagination(KeysetPagination):
+    """
+    Response data cursor (keyset) pagination for activity, newest first.
+
+    Filter on `created` lets Postgres prune partitions of older months.
+    """
+
+    ordering = ("-created", "-id")
+    page_size = 30
+    max_page_size = 100
@@ -0,0 +1,15 @@
+from rest_framework import serializers
+
+from demanage.activity.models import Activity
+
+
+class ActivitySerializer(serializers.ModelSerializer):
+    """
+    Serializer to dict for activity entry.
+    """
+
+    actor = serializers.SlugRelatedField(slug_field="username", read_only=True)
+
+    class Meta:
+        model = Activity
+        fields = ["id", "created", "actor", "board", "verb", "target", "data"]
@@ -0,0 +1,19 @@
+from django.urls import path
+
+from demanage.activity.api.views import (
+    board_activity_list_view,
+    organization_activity_list_view,
+)
+
+urlpatterns = [
+    path(
+        "boards/<slug:slug>/activity/",
+        board_activity_list_view,
+        name="board-activity-list",
+    ),
+    path(
+        "organizations/<slug:slug>/activity/",
+        organization_activity_list_view,
+        name="organization-activity-list",
+    ),
+]
@@ -0,0 +1,53 @@
+from django.db.models.query import QuerySet
+from django.utils.translation import gettext_lazy as _
+from rest_framework import generics
+from rest_framework.authentication import SessionAuthentication, TokenAuthentication
+from rest_framework.exceptions import NotFound, PermissionDenied
+
+from demanage.activity.api.pagination import ActivityPagination
+from demanage.activity.api.serializers import ActivitySerializer
+from demanage.activity.models import Activity
+from demanage.boards.models import Board
+from demanage.organizations.models import Organization
+
+
+class BoardActivityListAPIView(generics.ListAPIView):
+    """
+    Activity of the board visible to the user (newest first).
+    """
+
+    serializer_class = ActivitySerializer
+    authentication_classes = [SessionAuthentication, TokenAuthentication]
+    pagination_class = ActivityPagination
+
+    def get_queryset(self) -> QuerySet:
+        board = generics.get_object_or_404(Board, slug=self.kwargs["slug"])
+        if not self.request.user.can_view_board(board):
+            raise NotFound(_("Board is not found"))
+
+        return Activity.objects.filter(board=board).select_related("actor")
+
+
+class OrganizationActivityListAPIView(generics.ListAPIView):
+    """
+    Activity of the organization (newest first), representative only.
+    """
+
+    serializer_class = ActivitySerializer
+    authentication_classes = [SessionAuthentication, TokenAuthentication]
+    pagination_class = ActivityPagination
+
+    def get_queryset(self) -> QuerySet:
+        organization = generics.get_object_or_404(
+            Organization, slug=self.kwargs["slug"]
+        )
+        if organization.representative_id != self.request.user.pk:
+            raise PermissionDenied
+
+        return Activity.objects.filter(organization=organization).select_related(
+            "actor"
+        )
+
+
+board_activity_list_view = BoardActivityListAPIView.as_view()
+organization_activity_list_view = OrganizationActivityListAPIView.as_view()
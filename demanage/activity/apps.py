@@ -0,0 +1,16 @@
+from django.apps import AppConfig
+from django.utils.translation import gettext_lazy as _
+
+
+class ActivityConfig(AppConfig):
+    """
+    Application config for activity (audit log).
+    """
+
+    name = "demanage.activity"
+    verbose_name = _("Activity")
+    label = "activity"
+    default_auto_field = "django.db.models.BigAutoField"
+
+    def ready(self):
+        import demanage.activity.signals  # noqa F401
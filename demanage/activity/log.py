@@ -0,0 +1,84 @@
+"""
+Recording of activity entries.
+
+Entries are recorded after the transaction commits (rolled back changes are
+not logged). During a request they are buffered and inserted with one
+`bulk_create` when the response is ready (see `ActivityMiddleware`), outside
+of a request they are inserted right after commit.
+"""
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+from django.db import DatabaseError, transaction
+
+from .models import Activity
+
+logger = logging.getLogger(__name__)
+
+_local = threading.local()
+
+
+def record(
+    verb: str,
+    organization_id: int,
+    board_id: Optional[int] = None,
+    target: str = "",
+    data: Optional[Dict[str, Any]] = None,
+    actor=None,
+) -> None:
+    """
+    Record the activity of the actor (request user by default).
+    """
+    if actor is None:
+        actor = get_request_user()
+
+    activity = Activity(
+        actor=actor,
+        organization_id=organization_id,
+        board_id=board_id,
+        verb=verb,
+        target=target,
+        data=data or {},
+    )
+
+    def commit():
+        buffer = getattr(_local, "buffer", None)
+        if buffer is None:
+            flush([activity])
+        else:
+            buffer.append(activity)
+
+    transaction.on_commit(commit)
+
+
+def start_buffer(request=None) -> None:
+    _local.buffer = []
+    _local.request = request
+
+
+def flush_buffer() -> None:
+    buffer = getattr(_local, "buffer", None)
+    _local.buffer = None
+    _local.request = None
+    if buffer:
+        flush(buffer)
+
+
+def flush(activities: List[Activity]) -> None:
+    try:
+        Activity.objects.bulk_create(activities)
+    except DatabaseError:
+        # Audit log must not break the request
+        logger.exception("Failed to write %s activity entries", len(activities))
+
+
+def get_request_user():
+    """
+    Return authenticated user of the current request (set by DRF as well).
+    """
+    request = getattr(_local, "request", None)
+    user = getattr(request, "user", None)
+    if user is None or not user.is_authenticated:
+        return None
+    return user
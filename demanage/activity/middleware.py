@@ -0,0 +1,18 @@
+from . import log
+
+
+class ActivityMiddleware:
+    """
+    Buffer activity entries recorded during the request and write them in
+    one batch when the response is ready.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        log.start_buffer(request)
+        try:
+            return self.get_response(request)
+        finally:
+            log.flush_buffer()
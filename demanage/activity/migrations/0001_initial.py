@@ -0,0 +1,67 @@
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+def create_partitions(apps, schema_editor):
+    from demanage.activity.partitions import ensure_partitions
+
+    ensure_partitions(connection=schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("boards", "0007_list_card"),
+        ("organizations", "0006_organization_name_trigram_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Activity",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False, verbose_name="ID")),
+                ("created", models.DateTimeField(default=django.utils.timezone.now, verbose_name="Created")),
+                ("verb", models.CharField(max_length=50, verbose_name="Verb")),
+                ("target", models.CharField(blank=True, max_length=255, verbose_name="Target")),
+                ("data", models.JSONField(default=dict, verbose_name="Data")),
+                ("actor", models.ForeignKey(db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name="+", to=settings.AUTH_USER_MODEL, verbose_name="Actor")),
+                ("board", models.ForeignKey(db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name="+", to="boards.board", verbose_name="Board")),
+                ("organization", models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name="+", to="organizations.organization", verbose_name="Organization")),
+            ],
+            options={
+                "verbose_name": "Activity",
+                "verbose_name_plural": "Activities",
+                "db_table": "activity_activity",
+                "ordering": ["-created", "-id"],
+                "managed": False,
+                "default_permissions": [],
+            },
+        ),
+        # Partitioned table: primary key must contain the partition key
+        migrations.RunSQL(
+            sql="""
+            CREATE TABLE activity_activity (
+                id bigserial NOT NULL,
+                created timestamp with time zone NOT NULL,
+                actor_id integer NULL,
+                organization_id integer NOT NULL,
+                board_id bigint NULL,
+                verb varchar(50) NOT NULL,
+                target varchar(255) NOT NULL,
+                data jsonb NOT NULL,
+                PRIMARY KEY (id, created)
+            ) PARTITION BY RANGE (created);
+            CREATE INDEX activity_board_created_idx
+                ON activity_activity (board_id, created DESC, id DESC);
+            CREATE INDEX activity_org_created_idx
+                ON activity_activity (organization_id, created DESC, id DESC);
+            """,
+            reverse_sql="DROP TABLE activity_activity;",
+        ),
+        migrations.RunPython(create_partitions, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("activity", "0001_initial"),
+    ]
+
+    operations = [
+        # Rows without a monthly partition are kept instead of failing inserts
+        migrations.RunSQL(
+            sql="CREATE TABLE activity_activity_default "
+            "PARTITION OF activity_activity DEFAULT;",
+            reverse_sql="DROP TABLE activity_activity_default;",
+        ),
+    ]
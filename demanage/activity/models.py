@@ -0,0 +1,57 @@
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from demanage.boards.models import Board
+from demanage.organizations.models import Organization
+
+
+class Activity(models.Model):
+    """
+    Model representing audit log entry (who did what and when).
+
+    Table is append-only and range-partitioned by month on `created`
+    (see `partitions` module), it is created by raw SQL migration. Related
+    objects can be deleted while the entries remain (no FK constraints).
+    """
+
+    id = models.BigAutoField(verbose_name="ID", primary_key=True)
+    created = models.DateTimeField(verbose_name=_("Created"), default=timezone.now)
+    actor = models.ForeignKey(
+        verbose_name=_("Actor"),
+        to=settings.AUTH_USER_MODEL,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        related_name="+",
+    )
+    organization = models.ForeignKey(
+        verbose_name=_("Organization"),
+        to=Organization,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+    )
+    board = models.ForeignKey(
+        verbose_name=_("Board"),
+        to=Board,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        related_name="+",
+    )
+    verb = models.CharField(verbose_name=_("Verb"), max_length=50)
+    target = models.CharField(verbose_name=_("Target"), max_length=255, blank=True)
+    data = models.JSONField(verbose_name=_("Data"), default=dict)
+
+    class Meta:
+        managed = False
+        db_table = "activity_activity"
+        verbose_name = _("Activity")
+        verbose_name_plural = _("Activities")
+        ordering = ["-created", "-id"]
+        default_permissions = []
+
+    def __str__(self):
+        return f"{self.actor_id} {self.verb} {self.target}"
@@ -0,0 +1,118 @@
+"""
+Monthly range partitions of the activity table.
+
+Partitions are created ahead of time and expired ones are dropped as whole
+tables (no row deletion, no table bloat). Rows without a monthly partition
+(e.g. the task did not run) are kept in the DEFAULT partition and moved to
+the monthly one when it is created.
+"""
+import datetime
+import re
+from typing import List, Optional
+
+from django.db import connection as default_connection
+from django.db import transaction
+from django.utils import timezone
+
+TABLE = "activity_activity"
+DEFAULT_PARTITION = f"{TABLE}_default"
+PARTITION_REGEX = re.compile(rf"^{TABLE}_y(?P<year>\d{{4}})m(?P<month>\d{{2}})$")
+
+
+def month_start(value: datetime.date, shift: int = 0) -> datetime.date:
+    """
+    Return first day of the month of the value shifted by `shift` months.
+    """
+    index = value.year * 12 + value.month - 1 + shift
+    return datetime.date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: datetime.date) -> str:
+    return f"{TABLE}_y{month.year:04d}m{month.month:02d}"
+
+
+def ensure_partitions(months_ahead: int = 3, connection=None) -> List[str]:
+    """
+    Create partitions of the current and `months_ahead` next months.
+
+    Return names of created partitions.
+    """
+    connection = connection or default_connection
+    existing = set(get_partitions(connection))
+    today = timezone.now().date()
+    created = []
+    for shift in range(months_ahead + 1):
+        start = month_start(today, shift)
+        name = partition_name(start)
+        if name in existing:
+            continue
+        create_partition(start, connection)
+        created.append(name)
+    return created
+
+
+def create_partition(month: datetime.date, connection=None) -> None:
+    """
+    Create partition of the month, moving its rows out of the DEFAULT partition
+    (partition can't be attached while the default one contains its rows).
+    """
+    connection = connection or default_connection
+    name = partition_name(month)
+    start = f"'{month.isoformat()} 00:00:00+00'"
+    end = f"'{month_start(month, 1).isoformat()} 00:00:00+00'"
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TEMPORARY TABLE {name}_moved (LIKE {TABLE}) ON COMMIT DROP"
+        )
+        cursor.execute(
+            f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+            f"WHERE created >= {start} AND created < {end} RETURNING *) "
+            f"INSERT INTO {name}_moved SELECT * FROM moved"
+        )
+        cursor.execute(
+            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {TABLE} "
+            f"FOR VALUES FROM ({start}) TO ({end})"
+        )
+        cursor.execute(f"INSERT INTO {TABLE} SELECT * FROM {name}_moved")
+        cursor.execute(f"DROP TABLE {name}_moved")
+
+
+def drop_partitions(retention_months: int, connection=None) -> List[str]:
+    """
+    Drop partitions entirely older than `retention_months` months.
+
+    Return names of dropped partitions.
+    """
+    connection = connection or default_connection
+    cutoff = month_start(timezone.now().date(), -retention_months)
+    dropped = []
+    with connection.cursor() as cursor:
+        for name in get_partitions(connection):
+            month = get_partition_month(name)
+            if month is not None and month_start(month, 1) <= cutoff:
+                cursor.execute(f"DROP TABLE {name}")
+                dropped.append(name)
+        cursor.execute(
+            f"DELETE FROM {DEFAULT_PARTITION} WHERE created < %s", [cutoff]
+        )
+    return dropped
+
+
+def get_partitions(connection=None) -> List[str]:
+    connection = connection or default_connection
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON pg_inherits.inhparent = parent.oid "
+            "JOIN pg_class child ON pg_inherits.inhrelid = child.oid "
+            "WHERE parent.relname = %s ORDER BY child.relname",
+            [TABLE],
+        )
+        return [name for (name,) in cursor.fetchall()]
+
+
+def get_partition_month(name: str) -> Optional[datetime.date]:
+    matched = PARTITION_REGEX.match(name)
+    if matched is None:
+        return None
+    return datetime.date(int(matched["year"]), int(matched["month"]), 1)
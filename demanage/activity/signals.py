@@ -0,0 +1,29 @@
+"""
+Signal receivers recording membership activity (all write paths, including
+invitation join).
+"""
+from typing import Type
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from demanage.members.models import Member
+
+from .log import record
+
+
+@receiver(post_save, sender=Member)
+def member_post_save_receiver(
+    sender: Type[Member], instance: Member, created: bool, **kwargs
+):
+    if created:
+        record(
+            "member.joined",
+            instance.organization_id,
+            target=instance.user.username,
+        )
+
+
+@receiver(post_delete, sender=Member)
+def member_post_delete_receiver(sender: Type[Member], instance: Member, **kwargs):
+    record("member.left", instance.organization_id, target=instance.user.username)
@@ -0,0 +1,21 @@
+from django.conf import settings
+
+from config import celery_app
+
+from . import partitions
+
+
+@celery_app.task()
+def ensure_activity_partitions():
+    """
+    Create activity partitions of the following months.
+    """
+    return partitions.ensure_partitions(settings.ACTIVITY_PARTITIONS_AHEAD)
+
+
+@celery_app.task()
+def drop_expired_activity_partitions():
+    """
+    Drop activity partitions older than the retention period.
+    """
+    return partitions.drop_partitions(settings.ACTIVITY_RETENTION_MONTHS)
@@ -0,0 +1,36 @@
+import pytest
+from django.urls import reverse
+
+from demanage.activity.models import Activity
+from demanage.boards.tests.factories import BoardFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_board_activity_is_paginated_newest_first(api_client_factory, organization):
+    board = BoardFactory(organization=organization)
+    for verb in ["board.created", "board.updated", "board.updated"]:
+        Activity.objects.create(organization=organization, board=board, verb=verb)
+    api_client = api_client_factory(organization.representative)
+    url = reverse("api:board-activity-list", kwargs={"slug": board.slug})
+
+    response = api_client.get(url, {"page_size": 2})
+
+    assert response.status_code == 200
+    assert [item["verb"] for item in response.data["results"]] == [
+        "board.updated",
+        "board.updated",
+    ]
+    response = api_client.get(response.data["next"])
+    assert [item["verb"] for item in response.data["results"]] == ["board.created"]
+
+
+def test_organization_activity_is_representative_only(api_client_factory, member):
+    api_client = api_client_factory(member.user)
+    url = reverse(
+        "api:organization-activity-list", kwargs={"slug": member.organization.slug}
+    )
+
+    response = api_client.get(url)
+
+    assert response.status_code == 403
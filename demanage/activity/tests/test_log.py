@@ -0,0 +1,34 @@
+import pytest
+from django.db import transaction
+from django.urls import reverse
+
+from demanage.activity.log import record
+from demanage.activity.models import Activity
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+def test_board_create_is_recorded(organization, board_build_dict, api_client_factory):
+    api_client = api_client_factory(organization.representative)
+
+    response = api_client.post(reverse("api:board-list"), board_build_dict)
+
+    activity = Activity.objects.get()
+    assert activity.verb == "board.created"
+    assert activity.actor == organization.representative
+    assert activity.target == response.data["slug"]
+
+
+def test_rolled_back_activity_is_not_recorded(organization):
+    with pytest.raises(RuntimeError):
+        with transaction.atomic():
+            record("board.created", organization.pk)
+            raise RuntimeError
+
+    assert not Activity.objects.exists()
+
+
+def test_member_join_is_recorded(member):
+    activity = Activity.objects.get(verb="member.joined")
+    assert activity.organization_id == member.organization_id
+    assert activity.target == member.user.username
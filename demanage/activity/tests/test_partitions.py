@@ -0,0 +1,69 @@
+import datetime
+
+import pytest
+from django.db import connection
+
+from demanage.activity import partitions
+from demanage.activity.models import Activity
+
+pytestmark = pytest.mark.django_db
+
+
+def test_month_start_shifts_over_years():
+    assert partitions.month_start(datetime.date(2021, 12, 24), 1) == datetime.date(
+        2022, 1, 1
+    )
+    assert partitions.month_start(datetime.date(2022, 1, 5), -13) == datetime.date(
+        2020, 12, 1
+    )
+
+
+def test_partition_name_round_trip():
+    month = datetime.date(2022, 3, 1)
+    assert partitions.get_partition_month(partitions.partition_name(month)) == month
+
+
+def test_ensure_partitions_is_idempotent():
+    partitions.ensure_partitions(2)
+    assert partitions.ensure_partitions(2) == []
+    assert len(partitions.get_partitions()) >= 3
+
+
+def test_drop_partitions_drops_only_expired(organization):
+    old = datetime.date(2000, 1, 1)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TABLE {partitions.partition_name(old)} PARTITION OF "
+            f"{partitions.TABLE} FOR VALUES FROM ('2000-01-01') TO ('2000-02-01')"
+        )
+    Activity.objects.create(
+        organization=organization,
+        verb="board.created",
+        created=datetime.datetime(2000, 1, 10, tzinfo=datetime.timezone.utc),
+    )
+
+    dropped = partitions.drop_partitions(12)
+
+    assert dropped == [partitions.partition_name(old)]
+    assert not Activity.objects.exists()
+    assert partitions.get_partitions()
+
+
+def test_rows_without_partition_are_moved_from_default_partition(organization):
+    month = partitions.month_start(datetime.date.today(), 6)
+    Activity.objects.create(
+        organization=organization,
+        verb="board.created",
+        created=datetime.datetime.combine(
+            month, datetime.time(12), tzinfo=datetime.timezone.utc
+        ),
+    )
+
+    partitions.ensure_partitions(6)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT count(*) FROM {partitions.partition_name(month)}")
+        assert cursor.fetchone() == (1,)
+        cursor.execute(f"SELECT count(*) FROM {partitions.DEFAULT_PARTITION}")
+        assert cursor.fetchone() == (0,)
+    assert Activity.objects.get().verb == "board.created"
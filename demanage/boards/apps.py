@@ -13,4 +13,4 @@ class BoardsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
 
     def ready(self):
-        pass
+        import demanage.boards.signals  # noqa F401
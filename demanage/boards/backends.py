@@ -0,0 +1,30 @@
+from typing import Set
+
+from . import roles
+from .models import Board
+
+
+class BoardRoleBackend:
+    """
+    Authorization backend answering board permissions bundled by the user role
+    on the board (`BoardRole`), see `roles` module.
+    """
+
+    def authenticate(self, request, **credentials):
+        return None
+
+    def has_perm(self, user_obj, perm: str, obj=None) -> bool:
+        if not isinstance(obj, Board) or not user_obj.is_active:
+            return False
+        app_label, _, codename = perm.rpartition(".")
+        if app_label not in ("", obj._meta.app_label):
+            return False
+        return roles.has_permission(roles.get_role(user_obj, obj), codename)
+
+    def get_all_permissions(self, user_obj, obj=None) -> Set[str]:
+        if not isinstance(obj, Board) or not user_obj.is_active:
+            return set()
+        return {
+            f"{obj._meta.app_label}.{codename}"
+            for codename in roles.get_permissions(roles.get_role(user_obj, obj))
+        }
@@ -0,0 +1,175 @@
+"""
+Bulk create / partial update / delete of boards.
+
+Items are validated in one pass and written with `bulk_create`/`bulk_update`
+(signals are not sent so `after_bulk_write` does what board signals do and
+sends `boards_written` for other apps, e.g. events).
+Result of each item is reported separately: `{"status": ..., "data"/"errors": ...}`.
+"""
+from typing import Any, Dict, List
+
+from django.dispatch import Signal
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework import status
+
+from demanage.activity.log import record
+from demanage.organizations import counters
+
+from . import cache, snapshot, visibility
+from .models import Board
+from .serializers import BoardSerializer
+
+BULK_MAX_ITEMS = 1000
+BULK_BATCH_SIZE = 500
+
+Result = Dict[str, Any]
+
+# Sent by `after_bulk_write` with `boards` and `created` arguments
+boards_written = Signal()
+
+
+def after_bulk_write(boards: List[Board], created: bool = False) -> None:
+    """
+    Refresh visibility, organization counters and invalidate cache and snapshots
+    of boards written in bulk.
+    """
+    if not boards:
+        return
+
+    board_ids = [board.pk for board in boards]
+    visibility.refresh(Board.objects.filter(pk__in=board_ids))
+    organization_ids = {board.organization_id for board in boards}
+    counters.reconcile(organization_ids)
+    for organization_id in organization_ids:
+        cache.bump_organization(organization_id)
+    snapshot.invalidate_many(board_ids)
+    boards_written.send(sender=Board, boards=boards, created=created)
+
+
+def create_boards(items: List[Any], context: dict) -> List[Result]:
+    results: List[Result] = [{} for _ in items]
+    boards: List[Board] = []
+    indexes: List[int] = []
+
+    for index, item in enumerate(items):
+        serializer = BoardSerializer(data=item, context=context)
+        if not serializer.is_valid():
+            results[index] = _error(status.HTTP_400_BAD_REQUEST, serializer.errors)
+            continue
+        boards.append(Board(**serializer.validated_data))
+        indexes.append(index)
+
+    Board.generate_slugs(boards)
+    Board.objects.bulk_create(boards, batch_size=BULK_BATCH_SIZE)
+    after_bulk_write(boards, created=True)
+
+    for index, board in zip(indexes, boards):
+        record("board.created", board.organization_id, board.pk, board.slug)
+        results[index] = {
+            "status": status.HTTP_201_CREATED,
+            "data": BoardSerializer(board, context=context).data,
+        }
+    return results
+
+
+def update_boards(items: List[Any], queryset, context: dict) -> List[Result]:
+    """
+    Partially update boards identified by `slug` key of the items.
+    """
+    user = context["request"].user
+    results: List[Result] = [{} for _ in items]
+    slugs = [item.get("slug") for item in items if isinstance(item, dict)]
+    boards = {
+        board.slug: board
+        for board in queryset.filter(slug__in=slugs).select_related("organization")
+    }
+
+    updated: List[Board] = []
+    indexes: List[int] = []
+    fields = {"modified"}
+    now = timezone.now()
+    for index, item in enumerate(items):
+        if not isinstance(item, dict) or "slug" not in item:
+            results[index] = _error(
+                status.HTTP_400_BAD_REQUEST, {"slug": [_("This field is required.")]}
+            )
+            continue
+
+        board = boards.get(item["slug"])
+        if board is None:
+            results[index] = _error(status.HTTP_404_NOT_FOUND, _("Not found."))
+            continue
+
+        if board.organization.representative_id != user.pk:
+            results[index] = _error(
+                status.HTTP_403_FORBIDDEN,
+                _("You do not have permission to perform this action."),
+            )
+            continue
+
+        serializer = BoardSerializer(board, data=item, partial=True, context=context)
+        if not serializer.is_valid():
+            results[index] = _error(status.HTTP_400_BAD_REQUEST, serializer.errors)
+            continue
+
+        data = serializer.validated_data
+        for name in BoardSerializer.Meta.create_or_read_only_fields:
+            data.pop(name, None)
+        for name, value in data.items():
+            setattr(board, name, value)
+        fields.update(data.keys())
+        board.modified = now  # not set by bulk_update
+        updated.append(board)
+        record(
+            "board.updated",
+            board.organization_id,
+            board.pk,
+            board.slug,
+            {"fields": sorted(data)},
+        )
+        indexes.append(index)
+
+    Board.objects.bulk_update(updated, sorted(fields), batch_size=BULK_BATCH_SIZE)
+    after_bulk_write(updated)
+
+    for index, board in zip(indexes, updated):
+        results[index] = {
+            "status": status.HTTP_200_OK,
+            "data": BoardSerializer(board, context=context).data,
+        }
+    return results
+
+
+def delete_boards(slugs: List[Any], queryset, context: dict) -> List[Result]:
+    user = context["request"].user
+    results: List[Result] = [{} for _ in slugs]
+    boards = {
+        board.slug: board
+        for board in queryset.filter(
+            slug__in=[slug for slug in slugs if isinstance(slug, str)]
+        ).select_related("organization")
+    }
+
+    deleted: List[int] = []
+    for index, slug in enumerate(slugs):
+        board = boards.get(slug) if isinstance(slug, str) else None
+        if board is None:
+            results[index] = _error(status.HTTP_404_NOT_FOUND, _("Not found."))
+        elif board.organization.representative_id != user.pk:
+            results[index] = _error(
+                status.HTTP_403_FORBIDDEN,
+                _("You do not have permission to perform this action."),
+            )
+        else:
+            deleted.append(board.pk)
+            record("board.deleted", board.organization_id, board.pk, board.slug)
+            results[index] = {"status": status.HTTP_204_NO_CONTENT}
+
+    # Cascades visibility, signals invalidate cache
+    Board.objects.filter(pk__in=deleted).delete()
+    return results
+
+
+def _error(status_code: int, errors: Any) -> Result:
+    return {"status": status_code, "errors": errors}
@@ -0,0 +1,119 @@
+"""
+Per-user versioned response cache for board list and detail.
+
+Cache key consists of the user, the request path (with query) and versions of
+the organizations user can see boards in. Any write to boards, board
+permissions or membership of organization bumps organization version (see
+`demanage.boards.signals`) so invalidation is O(1).
+"""
+import hashlib
+from typing import Callable, Dict, Iterable, List
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from demanage.members.models import Member
+from demanage.organizations.models import Organization
+from demanage.utils.cache import bump_version, get_versions
+
+from .models import BoardVisibility
+
+ORGANIZATION_VERSION_KEY = "boards:version:organization:{}"
+RESPONSE_KEY = "boards:response:{user_id}:{digest}"
+HITS_KEY = "boards:response-cache:hits"
+MISSES_KEY = "boards:response-cache:misses"
+
+
+def is_enabled() -> bool:
+    return settings.BOARDS_RESPONSE_CACHE_ENABLED
+
+
+def bump_organization(organization_id: int) -> None:
+    """
+    Invalidate cached board responses depending on the organization.
+    """
+    bump_version(ORGANIZATION_VERSION_KEY.format(organization_id))
+
+
+def get_organization_ids(user) -> List[int]:
+    """
+    Return organizations where user is representative, member or sees a board.
+    """
+    represented = Organization.objects.filter(representative=user).values_list(
+        "id", flat=True
+    )
+    membered = Member.objects.filter(user=user).values_list(
+        "organization_id", flat=True
+    )
+    visible = BoardVisibility.objects.filter(user=user).values_list(
+        "board__organization_id", flat=True
+    )
+    return sorted(represented.union(membered, visible))
+
+
+def get_organization_versions(organization_ids: Iterable[int]) -> List[str]:
+    """
+    Return `"<id>:<version>"` of the organizations (e.g. for fingerprints).
+    """
+    organization_ids = list(organization_ids)
+    versions = get_versions(
+        ORGANIZATION_VERSION_KEY.format(pk) for pk in organization_ids
+    )
+    return [
+        f"{pk}:{versions[ORGANIZATION_VERSION_KEY.format(pk)]}"
+        for pk in organization_ids
+    ]
+
+
+def get_response_key(request: Request) -> str:
+    organization_ids = get_organization_ids(request.user)
+    fingerprint = "|".join(
+        [request.get_full_path()] + get_organization_versions(organization_ids)
+    )
+    return RESPONSE_KEY.format(
+        user_id=request.user.pk,
+        digest=hashlib.md5(fingerprint.encode("utf-8")).hexdigest(),
+    )
+
+
+def cached_response(request: Request, build: Callable[[], Response]) -> Response:
+    """
+    Return cached response data for the request or build (and cache) response.
+    """
+    if not is_enabled() or request.user.is_superuser:
+        return build()
+
+    key = get_response_key(request)
+    data = cache.get(key)
+    if data is not None:
+        _count(HITS_KEY)
+        response = Response(data)
+        response["X-Cache"] = "HIT"
+        return response
+
+    _count(MISSES_KEY)
+    response = build()
+    if response.status_code == 200:
+        cache.set(key, response.data, settings.BOARDS_RESPONSE_CACHE_TIMEOUT)
+    response["X-Cache"] = "MISS"
+    return response
+
+
+def get_stats() -> Dict[str, int]:
+    """
+    Return response cache hit/miss counters.
+    """
+    counters = cache.get_many([HITS_KEY, MISSES_KEY])
+    return {
+        "hits": counters.get(HITS_KEY, 0),
+        "misses": counters.get(MISSES_KEY, 0),
+    }
+
+
+def _count(key: str) -> None:
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, None)
@@ -0,0 +1,131 @@
+"""
+Deep copy of a board (e.g. of a template board) with bulk writes.
+
+Board, lists, cards and (optionally) `view_board` grants and roles of the
+target organization people are copied with a fixed number of `bulk_create`
+calls regardless of the board size (rows are written in batches). Boards with
+more than `BOARDS_CLONE_ASYNC_CARDS` cards are copied by Celery task (the board
+is created empty and filled by the task).
+"""
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+
+from demanage.members.models import Member
+from demanage.organizations.models import Organization
+
+from . import snapshot
+from .bulk import after_bulk_write
+from .models import Board, BoardRole, BoardUserObjectPermission, Card, List
+
+CLONE_BATCH_SIZE = 1000
+
+
+def create_board(
+    source: Board, organization: Organization, title: str, public: Optional[bool]
+) -> Board:
+    """
+    Create (empty) copy of the board.
+    """
+    board = Board(
+        organization=organization,
+        title=title,
+        description=source.description,
+        public=source.public if public is None else public,
+    )
+    Board.generate_slugs([board])
+    Board.objects.bulk_create([board])
+    after_bulk_write([board], created=True)
+    return board
+
+
+def copy_content(source_pk: int, board_pk: int, permissions: bool = False) -> int:
+    """
+    Copy lists, cards (and `view_board` grants and roles) of the source board to
+    the board.
+
+    Return number of copied cards.
+    """
+    with transaction.atomic():
+        board = Board.objects.get(pk=board_pk)
+        lists = List.objects.filter(board_id=source_pk).order_by("rank", "id")
+        list_ids = [item.pk for item in lists]
+        copies = List.objects.bulk_create(
+            [List(board=board, title=item.title, rank=item.rank) for item in lists],
+            batch_size=CLONE_BATCH_SIZE,
+        )
+        copy_ids: Dict[int, int] = {
+            list_id: copy.pk for list_id, copy in zip(list_ids, copies)
+        }
+
+        cards = Card.objects.filter(list_id__in=list_ids).values_list(
+            "list_id", "title", "description", "rank"
+        )
+        copied = Card.objects.bulk_create(
+            (
+                Card(
+                    list_id=copy_ids[list_id],
+                    title=title,
+                    description=description,
+                    rank=rank,
+                )
+                for list_id, title, description, rank in cards.iterator(
+                    chunk_size=CLONE_BATCH_SIZE
+                )
+            ),
+            batch_size=CLONE_BATCH_SIZE,
+        )
+
+        if permissions:
+            copy_permissions(source_pk, board)
+        snapshot.invalidate(board.pk)  # content is written without signals
+    return len(copied)
+
+
+def copy_permissions(source_pk: int, board: Board) -> None:
+    """
+    Copy `view_board` grants and roles of the source board to the board.
+
+    Only grants of the board organization members (and representative) are
+    copied: source board may be of other organization.
+    """
+    people = Q(user_id=board.organization.representative_id) | Q(
+        user_id__in=Member.objects.filter(
+            organization_id=board.organization_id
+        ).values("user_id")
+    )
+    grants = BoardUserObjectPermission.objects.filter(
+        people, content_object_id=source_pk, permission__codename="view_board"
+    ).values_list("user_id", "permission_id")
+    BoardUserObjectPermission.objects.bulk_create(
+        [
+            BoardUserObjectPermission(
+                content_object=board,
+                user_id=user_id,
+                permission_id=permission_id,
+            )
+            for user_id, permission_id in grants
+        ],
+        batch_size=CLONE_BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+    BoardRole.objects.bulk_create(
+        [
+            BoardRole(board=board, user_id=user_id, role=role)
+            for user_id, role in BoardRole.objects.filter(
+                people, board_id=source_pk
+            ).values_list("user_id", "role")
+        ],
+        batch_size=CLONE_BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+    after_bulk_write([board])  # grants are written without signals
+
+
+def is_large(source: Board) -> bool:
+    return (
+        Card.objects.filter(list__board=source).count()
+        > settings.BOARDS_CLONE_ASYNC_CARDS
+    )
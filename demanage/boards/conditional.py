@@ -0,0 +1,93 @@
+"""
+Conditional GET (`ETag` / `Last-Modified`) for board endpoints.
+
+Validators are computed from an aggregate over the visible queryset (or from
+the object) and versions of the organizations (see `cache` module) without
+serializing it, matching requests are answered with 304. Lists are validated
+by `ETag` only.
+"""
+import calendar
+import hashlib
+from datetime import datetime
+from typing import Optional, Tuple
+
+from django.db.models import Count, Max
+from django.db.models.query import QuerySet
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework.request import Request
+
+from . import cache
+from .models import Board
+
+Validators = Tuple[str, Optional[datetime]]
+
+
+def make_etag(request: Request, *parts) -> str:
+    """
+    Strong ETag of the request path, user and the state of the data.
+    """
+    fingerprint = "|".join(
+        [request.get_full_path(), str(request.user.pk)] + [str(part) for part in parts]
+    )
+    return quote_etag(hashlib.md5(fingerprint.encode("utf-8")).hexdigest())
+
+
+def list_validators(request: Request, queryset: QuerySet) -> Validators:
+    """
+    Compute validators of the board list from the filtered queryset.
+
+    Any update bumps `Max(modified)`, writes to boards, their permissions and
+    organizations (e.g. renamed organization slug) bump organization versions.
+    No `Last-Modified`: date of the last change can't reflect deleted or hidden
+    boards (`If-Modified-Since` would be answered with stale 304).
+    """
+    queryset = queryset.order_by()
+    state = queryset.aggregate(last_modified=Max("modified"), count=Count("id"))
+    organization_ids = sorted(
+        queryset.values_list("organization_id", flat=True).distinct()
+    )
+    etag = make_etag(
+        request,
+        state["count"],
+        state["last_modified"],
+        *cache.get_organization_versions(organization_ids),
+    )
+    return etag, None
+
+
+def detail_validators(request: Request, board: Board) -> Validators:
+    versions = cache.get_organization_versions([board.organization_id])
+    return make_etag(request, board.pk, board.modified, *versions), board.modified
+
+
+def get_not_modified_response(
+    request: Request, validators: Validators
+) -> Optional[HttpResponse]:
+    """
+    Return 304 (or 412) response if request preconditions match validators.
+    """
+    etag, last_modified = validators
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=_timestamp(last_modified),
+    )
+    if response is not None:
+        set_validators(response, validators)
+    return response
+
+
+def set_validators(response: HttpResponse, validators: Validators) -> HttpResponse:
+    etag, last_modified = validators
+    response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(_timestamp(last_modified))
+    return response
+
+
+def _timestamp(value: Optional[datetime]) -> Optional[int]:
+    if value is None:
+        return None
+    return calendar.timegm(value.utctimetuple())
@@ -0,0 +1,140 @@
+from django.contrib.auth.models import Permission
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand
+from django.db.models import BigIntegerField
+from django.db.models.functions import Cast
+from guardian.models import UserObjectPermission
+from guardian.shortcuts import get_objects_for_user
+
+from demanage.boards.bulk import after_bulk_write
+from demanage.boards.models import Board, BoardUserObjectPermission
+from demanage.organizations.models import Organization
+from demanage.users.models import User
+from demanage.utils.benchmark import format_result, measure
+
+PREFIX = "bench-board-permissions"
+
+
+class Command(BaseCommand):
+    """
+    Compare board listing by `view_board` permission stored in guardian's generic
+    table (before, `object_pk` varchar) and in `BoardUserObjectPermission`
+    (after, direct foreign key) on the same grants.
+
+    Generic rows are seeded for the benchmark only and deleted afterwards.
+
+    Example: `manage.py bench_board_permissions --boards 20000 --users 50`
+    """
+
+    help = "Benchmark board listing on generic vs direct foreign key permissions."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--boards", type=int, default=20000)
+        parser.add_argument("--users", type=int, default=50)
+        parser.add_argument("--repeat", type=int, default=50)
+
+    def handle(self, *args, boards: int, users: int, repeat: int, **options):
+        user, board = self.seed(boards, users)
+        content_type = ContentType.objects.get_for_model(Board)
+        generic = UserObjectPermission.objects.filter(
+            content_type=content_type, permission__codename="view_board"
+        )
+        direct = BoardUserObjectPermission.objects.filter(
+            permission__codename="view_board"
+        )
+
+        def list_boards_generic():
+            object_ids = (
+                generic.filter(user=user)
+                .annotate(board_id=Cast("object_pk", BigIntegerField()))
+                .values("board_id")
+            )
+            return list(Board.objects.filter(pk__in=object_ids).values_list("id"))
+
+        def list_boards_direct():
+            object_ids = direct.filter(user=user).values("content_object_id")
+            return list(Board.objects.filter(pk__in=object_ids).values_list("id"))
+
+        def list_boards_guardian():
+            return list(get_objects_for_user(user, "boards.view_board").values("id"))
+
+        def board_permissions_generic():
+            return list(generic.filter(object_pk=str(board.pk)).values_list("user_id"))
+
+        def board_permissions_direct():
+            return list(direct.filter(content_object=board).values_list("user_id"))
+
+        assert sorted(list_boards_generic()) == sorted(list_boards_direct())
+
+        self.stdout.write(
+            f"{direct.count()} board permissions, {repeat} repeats "
+            f"(generic table holds {generic.count()} rows)"
+        )
+        try:
+            for name, func in [
+                ("list boards of user (before)", list_boards_generic),
+                ("list boards of user (after)", list_boards_direct),
+                ("get_objects_for_user (after)", list_boards_guardian),
+                ("permissions of board (before)", board_permissions_generic),
+                ("permissions of board (after)", board_permissions_direct),
+            ]:
+                self.stdout.write(format_result(name, measure(func, repeat)))
+        finally:
+            generic.filter(object_pk__in=self.board_ids()).delete()
+
+    def seed(self, count: int, users: int):
+        """
+        Grant `view_board` on every board to every seeded user (both tables).
+        """
+        representative, _ = User.objects.get_or_create(username=PREFIX)
+        organization, _ = Organization.objects.get_or_create(
+            slug=PREFIX, defaults={"name": PREFIX, "representative": representative}
+        )
+        Board.objects.filter(organization=organization).delete()
+        boards = [
+            Board(organization=organization, title=f"Board {index}")
+            for index in range(count)
+        ]
+        Board.generate_slugs(boards)
+        Board.objects.bulk_create(boards, batch_size=5000)
+
+        grantees = [
+            User.objects.get_or_create(username=f"{PREFIX}-{index}")[0]
+            for index in range(users)
+        ]
+        permission = Permission.objects.get(
+            content_type__app_label="boards", codename="view_board"
+        )
+        BoardUserObjectPermission.objects.bulk_create(
+            (
+                BoardUserObjectPermission(
+                    content_object=board, user=user, permission=permission
+                )
+                for board in boards
+                for user in grantees
+            ),
+            batch_size=5000,
+        )
+        UserObjectPermission.objects.bulk_create(
+            (
+                UserObjectPermission(
+                    content_type=permission.content_type,
+                    object_pk=str(board.pk),
+                    user=user,
+                    permission=permission,
+                )
+                for board in boards
+                for user in grantees
+            ),
+            batch_size=5000,
+        )
+        after_bulk_write(boards)
+        return grantees[0], boards[0]
+
+    def board_ids(self):
+        return [
+            str(pk)
+            for pk in Board.objects.filter(organization__slug=PREFIX).values_list(
+                "id", flat=True
+            )
+        ]
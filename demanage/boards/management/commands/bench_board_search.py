@@ -0,0 +1,76 @@
+import random
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from demanage.boards.models import Board
+from demanage.boards.search_filters import BoardSearchFilter
+from demanage.organizations.models import Organization
+from demanage.users.models import User
+from demanage.utils.benchmark import format_result, measure
+
+WORDS = (
+    "agile backlog roadmap release sprint design marketing sales support "
+    "hiring onboarding finance budget research mobile web platform infra "
+    "security analytics growth content partner launch quarterly weekly"
+).split()
+
+
+class Command(BaseCommand):
+    """
+    Compare regex/per-row full text search with stored search vector search.
+
+    Example: `manage.py bench_board_search --seed 1000000 --term roadmap`
+    """
+
+    help = "Benchmark board search filter (optionally seeding boards)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seed", type=int, default=0, help="Boards to create.")
+        parser.add_argument("--term", default="roadmap", help="Search term.")
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, seed: int, term: str, repeat: int, **options):
+        if seed:
+            self.seed(seed)
+
+        legacy = Board.objects.filter(
+            Q(title__iregex=term) | Q(description__search=term)
+        )
+        request = Request(APIRequestFactory().get("/", {"search": term}))
+        stored = BoardSearchFilter().filter_queryset(request, Board.objects.all(), None)
+
+        self.stdout.write(f"{Board.objects.count()} boards, term {term!r}")
+        for name, queryset in [
+            ("regex + per row tsvector", legacy),
+            ("stored tsvector", stored),
+        ]:
+            page = measure(lambda: list(queryset[:10]), repeat)
+            count = measure(queryset.count, repeat)
+            self.stdout.write(format_result(f"{name} page", page))
+            self.stdout.write(format_result(f"{name} count", count))
+
+    def seed(self, count: int, batch_size: int = 10000):
+        user, _ = User.objects.get_or_create(username="bench-board-search")
+        organization, _ = Organization.objects.get_or_create(
+            slug="bench-board-search",
+            defaults={"name": "Bench board search", "representative": user},
+        )
+
+        for offset in range(0, count, batch_size):
+            boards = []
+            for _ in range(min(batch_size, count - offset)):
+                title = " ".join(random.sample(WORDS, 3))
+                boards.append(
+                    Board(
+                        organization=organization,
+                        title=title,
+                        description=" ".join(random.choices(WORDS, k=30)),
+                    )
+                )
+            Board.generate_slugs(boards)
+            # Search vector is filled in by the database trigger
+            Board.objects.bulk_create(boards, batch_size=batch_size)
+            self.stdout.write(f"Seeded {offset + len(boards)}/{count} boards")
@@ -0,0 +1,73 @@
+from django.core.management.base import BaseCommand
+
+from demanage.boards.bulk import after_bulk_write
+from demanage.boards.models import Board
+from demanage.boards.serializers import BoardSerializer
+from demanage.fast_serializers import compile_serializer
+from demanage.organizations.models import Organization
+from demanage.users.models import User
+from demanage.utils.benchmark import format_result, measure
+
+
+class Command(BaseCommand):
+    """
+    Compare `BoardSerializer` with compiled (values based) serializer on a page
+    of boards.
+
+    Example: `manage.py bench_board_serializers --page-size 30`
+    """
+
+    help = "Benchmark board list serialization (model serializer vs compiled)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--page-size", type=int, default=30)
+        parser.add_argument("--repeat", type=int, default=200)
+
+    def handle(self, *args, page_size: int, repeat: int, **options):
+        organization = self.seed(page_size)
+        boards = Board.objects.filter(organization=organization).order_by("-created")
+        compiled = compile_serializer(BoardSerializer())
+
+        def model_serializer():
+            return BoardSerializer(boards[:page_size], many=True).data
+
+        def compiled_serializer():
+            rows = boards.values(*compiled.paths)[:page_size]
+            return compiled.serialize(rows)
+
+        assert model_serializer() == compiled_serializer()
+
+        self.stdout.write(f"Page of {page_size} boards, {repeat} repeats")
+        results = {}
+        for name, func in [
+            ("BoardSerializer", model_serializer),
+            ("compiled serializer", compiled_serializer),
+        ]:
+            results[name] = measure(func, repeat)
+            self.stdout.write(format_result(name, results[name]))
+
+        speedup = (
+            results["BoardSerializer"]["p50"] / results["compiled serializer"]["p50"]
+        )
+        self.stdout.write(f"Speedup (p50): {speedup:.1f}x")
+
+    def seed(self, count: int) -> Organization:
+        user, _ = User.objects.get_or_create(username="bench-board-serializers")
+        organization, _ = Organization.objects.get_or_create(
+            slug="bench-board-serializers",
+            defaults={"name": "Bench board serializers", "representative": user},
+        )
+        Board.objects.filter(organization=organization).delete()
+        boards = [
+            Board(
+                organization=organization,
+                title=f"Board {index}",
+                description="Lorem ipsum dolor sit amet. " * 8,
+                public=bool(index % 2),
+            )
+            for index in range(count)
+        ]
+        Board.generate_slugs(boards)
+        Board.objects.bulk_create(boards)
+        after_bulk_write(boards)
+        return organization
@@ -0,0 +1,77 @@
+from django.core.management.base import BaseCommand
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from demanage.boards import snapshot
+from demanage.boards.models import Board, Card, List
+from demanage.boards.ranks import spread_ranks
+from demanage.boards.views import BoardViewSet
+from demanage.organizations.models import Organization
+from demanage.users.models import User
+from demanage.utils.benchmark import format_result, measure
+
+
+class Command(BaseCommand):
+    """
+    Measure board snapshot endpoint with cold (rebuilt) and cached document.
+
+    Example: `manage.py bench_board_snapshot --cards 5000`
+    """
+
+    help = "Benchmark board snapshot endpoint on a seeded board."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--cards", type=int, default=5000)
+        parser.add_argument("--lists", type=int, default=10)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, cards: int, lists: int, repeat: int, **options):
+        board = self.seed(cards, lists)
+        view = BoardViewSet.as_view({"get": "snapshot"})
+        request = APIRequestFactory().get(f"/api/boards/{board.slug}/snapshot/")
+        force_authenticate(request, board.organization.representative)
+
+        def get():
+            response = view(request, slug=board.slug)
+            assert response.status_code == 200, response.status_code
+
+        def get_cold():
+            snapshot.invalidate(board.pk)
+            get()
+
+        self.stdout.write(f"Board {board.slug!r}: {lists} lists, {cards} cards")
+        for name, func in [
+            ("snapshot (rebuilt)", get_cold),
+            ("snapshot (cached)", get),
+        ]:
+            self.stdout.write(format_result(name, measure(func, repeat)))
+
+    def seed(self, cards: int, lists: int) -> Board:
+        user, _ = User.objects.get_or_create(username="bench-board-snapshot")
+        organization, _ = Organization.objects.get_or_create(
+            slug="bench-board-snapshot",
+            defaults={"name": "Bench board snapshot", "representative": user},
+        )
+        Board.objects.filter(organization=organization).delete()
+        board = Board.objects.create(
+            organization=organization, title=f"Snapshot {cards}", public=False
+        )
+
+        board_lists = List.objects.bulk_create(
+            List(board=board, title=f"List {index}", rank=rank)
+            for index, rank in enumerate(spread_ranks(lists))
+        )
+        per_list = -(-cards // lists)
+        ranks = spread_ranks(per_list)
+        Card.objects.bulk_create(
+            (
+                Card(
+                    list=board_lists[index % lists],
+                    title=f"Card {index}",
+                    description="Lorem ipsum dolor sit amet. " * 4,
+                    rank=ranks[index // lists],
+                )
+                for index in range(cards)
+            ),
+            batch_size=1000,
+        )
+        return board
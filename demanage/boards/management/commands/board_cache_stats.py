@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from demanage.boards import cache
+
+
+class Command(BaseCommand):
+    """
+    Print board response cache hit/miss counters.
+    """
+
+    help = "Print board response cache hit/miss counters."
+
+    def handle(self, *args, **options):
+        stats = cache.get_stats()
+        total = stats["hits"] + stats["misses"]
+        ratio = stats["hits"] / total if total else 0
+        self.stdout.write(
+            f"hits {stats['hits']}  misses {stats['misses']}  hit ratio {ratio:.1%}"
+        )
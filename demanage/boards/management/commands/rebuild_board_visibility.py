@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from demanage.boards import visibility
+from demanage.boards.models import Board, BoardVisibility
+from demanage.organizations.models import Organization
+
+
+class Command(BaseCommand):
+    """
+    Rebuild materialized board visibility from scratch or check it for drift.
+    """
+
+    help = "Rebuild (or check with --check) board visibility table."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report drift, exit with error if any is found.",
+        )
+
+    def handle(self, *args, check: bool = False, **options):
+        missing_total = 0
+        stale_total = 0
+
+        # Rebuild organization by organization to keep memory bounded
+        for organization_id in Organization.objects.values_list("id", flat=True):
+            boards = Board.objects.filter(organization_id=organization_id)
+            if check:
+                expected = visibility.expected_pairs(boards)
+                stored = visibility.stored_pairs(boards)
+                missing, stale = expected - stored, stored - expected
+            else:
+                with transaction.atomic():
+                    missing, stale = visibility.refresh(boards)
+
+            missing_total += len(missing)
+            stale_total += len(stale)
+
+        verb = "found" if check else "fixed"
+        self.stdout.write(
+            f"{missing_total} missing and {stale_total} stale rows {verb}, "
+            f"{BoardVisibility.objects.count()} rows total."
+        )
+
+        if check and (missing_total or stale_total):
+            raise CommandError("Board visibility drift detected.")
@@ -0,0 +1,54 @@
+# Generated by Django 3.1.13 on 2026-10-18 12:00
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+POPULATE_BOARD_VISIBILITY = """
+INSERT INTO boards_boardvisibility (user_id, board_id)
+SELECT o.representative_id, b.id
+FROM boards_board b
+JOIN organizations_organization o ON o.id = b.organization_id
+UNION
+SELECT m.user_id, b.id
+FROM boards_board b
+JOIN members_member m ON m.organization_id = b.organization_id
+WHERE b.public
+UNION
+SELECT p.user_id, b.id
+FROM guardian_userobjectpermission p
+JOIN auth_permission ap ON ap.id = p.permission_id
+JOIN django_content_type ct ON ct.id = p.content_type_id
+JOIN boards_board b ON p.object_pk = b.id::text
+WHERE ct.app_label = 'boards' AND ct.model = 'board' AND ap.codename = 'view_board'
+ON CONFLICT DO NOTHING;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('guardian', '0001_initial'),
+        ('members', '0002_auto_20211116_2105'),
+        ('boards', '0002_auto_20211224_0205'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BoardVisibility',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False, verbose_name='ID')),
+                ('board', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='visibility', to='boards.board', verbose_name='Board')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='board_visibility', to=settings.AUTH_USER_MODEL, verbose_name='User')),
+            ],
+            options={
+                'verbose_name': 'Board visibility',
+                'verbose_name_plural': 'Board visibilities',
+                'default_permissions': [],
+                'unique_together': {('user', 'board')},
+            },
+        ),
+        migrations.RunSQL(POPULATE_BOARD_VISIBILITY, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.1.13 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0003_boardvisibility'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='board',
+            index=models.Index(fields=['created', 'id'], name='boards_created_id_idx'),
+        ),
+    ]
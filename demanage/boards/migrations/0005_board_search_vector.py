@@ -0,0 +1,48 @@
+# Generated by Django 3.1.13 on 2026-10-18 12:00
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+CREATE_SEARCH_VECTOR_TRIGGER = """
+CREATE FUNCTION boards_board_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(NEW.description, '')), 'B');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER boards_board_search_vector_trigger
+BEFORE INSERT OR UPDATE OF title, description ON boards_board
+FOR EACH ROW EXECUTE PROCEDURE boards_board_search_vector_update();
+
+UPDATE boards_board SET title = title;
+"""
+
+DROP_SEARCH_VECTOR_TRIGGER = """
+DROP TRIGGER IF EXISTS boards_board_search_vector_trigger ON boards_board;
+DROP FUNCTION IF EXISTS boards_board_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0004_board_created_id_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='board',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, help_text='Weighted title and description, maintained by database trigger.', null=True, verbose_name='Search vector'),
+        ),
+        migrations.RunSQL(CREATE_SEARCH_VECTOR_TRIGGER, DROP_SEARCH_VECTOR_TRIGGER),
+        migrations.AddIndex(
+            model_name='board',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='boards_search_vector_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 3.1.13 on 2026-10-18 12:00
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0005_board_search_vector'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        # Expression index matches `title__istartswith` (UPPER("title"::text) LIKE ...)
+        migrations.RunSQL(
+            'CREATE INDEX boards_title_trgm_idx ON boards_board '
+            'USING gin (UPPER(title::text) gin_trgm_ops);',
+            'DROP INDEX IF EXISTS boards_title_trgm_idx;',
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 3.1.13 on 2026-10-18 12:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django_extensions.db.fields
+
+
+# Ranks are compared byte-wise regardless of database locale
+SET_RANK_COLLATION = """
+ALTER TABLE boards_list ALTER COLUMN rank TYPE varchar(255) COLLATE "C";
+ALTER TABLE boards_card ALTER COLUMN rank TYPE varchar(255) COLLATE "C";
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0006_board_title_trigram_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='List',
+            fields=[
+                ('created', django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name='created')),
+                ('modified', django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name='modified')),
+                ('id', models.BigAutoField(primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=50, verbose_name='Title')),
+                ('rank', models.CharField(editable=False, help_text='Fractional ordering key (see `ranks` module), C collation.', max_length=255, verbose_name='Rank')),
+                ('board', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='lists', to='boards.board', verbose_name='Board')),
+            ],
+            options={
+                'verbose_name': 'List',
+                'verbose_name_plural': 'Lists',
+                'ordering': ['rank', 'id'],
+                'default_permissions': [],
+            },
+        ),
+        migrations.CreateModel(
+            name='Card',
+            fields=[
+                ('created', django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name='created')),
+                ('modified', django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name='modified')),
+                ('id', models.BigAutoField(primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=100, verbose_name='Title')),
+                ('description', models.TextField(blank=True, verbose_name='Description')),
+                ('rank', models.CharField(editable=False, help_text='Fractional ordering key (see `ranks` module), C collation.', max_length=255, verbose_name='Rank')),
+                ('list', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='cards', to='boards.list', verbose_name='List')),
+            ],
+            options={
+                'verbose_name': 'Card',
+                'verbose_name_plural': 'Cards',
+                'ordering': ['rank', 'id'],
+                'default_permissions': [],
+            },
+        ),
+        migrations.RunSQL(SET_RANK_COLLATION, migrations.RunSQL.noop),
+        migrations.AddIndex(
+            model_name='list',
+            index=models.Index(fields=['board', 'rank', 'id'], name='boards_list_rank_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='card',
+            index=models.Index(fields=['list', 'rank', 'id'], name='boards_card_rank_idx'),
+        ),
+    ]
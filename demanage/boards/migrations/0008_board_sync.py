@@ -0,0 +1,50 @@
+# Generated by Django 3.1.13 on 2026-10-18 12:00
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('boards', '0007_list_card'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='boardvisibility',
+            name='created',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False, help_text='When board became visible to the user (delta sync).', verbose_name='Created'),
+        ),
+        migrations.AddIndex(
+            model_name='board',
+            index=models.Index(fields=['modified', 'id'], name='boards_modified_id_idx'),
+        ),
+        migrations.CreateModel(
+            name='BoardTombstone',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False, verbose_name='ID')),
+                ('board_id', models.BigIntegerField(verbose_name='Board ID')),
+                ('slug', models.SlugField(db_index=False, verbose_name='Slug')),
+                ('reason', models.CharField(choices=[('deleted', 'Deleted'), ('revoked', 'Access revoked')], max_length=10, verbose_name='Reason')),
+                ('created', models.DateTimeField(default=django.utils.timezone.now, editable=False, verbose_name='Created')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='User')),
+            ],
+            options={
+                'verbose_name': 'Board tombstone',
+                'verbose_name_plural': 'Board tombstones',
+                'default_permissions': [],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='boardtombstone',
+            index=models.Index(fields=['user', 'created'], name='boards_tombstone_user_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='boardtombstone',
+            index=models.Index(fields=['created'], name='boards_tombstone_created_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 3.1.13 on 2026-10-18 12:00
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('boards', '0009_boarduserobjectpermission'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BoardRole',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False, verbose_name='ID')),
+                ('role', models.CharField(choices=[('viewer', 'Viewer'), ('editor', 'Editor'), ('admin', 'Admin')], max_length=10, verbose_name='Role')),
+                ('board', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='roles', to='boards.board', verbose_name='Board')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='board_roles', to=settings.AUTH_USER_MODEL, verbose_name='User')),
+            ],
+            options={
+                'verbose_name': 'Board role',
+                'verbose_name_plural': 'Board roles',
+                'default_permissions': [],
+                'unique_together': {('user', 'board')},
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.1.13 on 2026-10-18 12:30
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0010_boardrole'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='board',
+            options={'default_permissions': ['view'], 'get_latest_by': 'modified', 'ordering': ['title'], 'permissions': [('add_list', 'Can create new list in the board'), ('add_card', 'Can create new card in the board'), ('change_board', 'Can change the board'), ('manage_board', 'Can manage permissions and roles of the board')], 'verbose_name': 'Board', 'verbose_name_plural': 'Boards'},
+        ),
+    ]
@@ -1,10 +1,19 @@
+from typing import Iterable, Set
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 from django_extensions.db.models import TimeStampedModel
+from guardian.models import UserObjectPermissionBase
 from shortuuid import random
 
+# Text search configuration of the board search vector (see migration trigger)
+SEARCH_CONFIG = "english"
+
 
 class Board(TimeStampedModel):
     """
@@ -57,31 +66,304 @@ class Board(TimeStampedModel):
         default=None,
         blank=False,
     )
+    search_vector = SearchVectorField(
+        verbose_name=_("Search vector"),
+        help_text=_("Weighted title and description, maintained by database trigger."),
+        editable=False,
+        null=True,
+    )
 
     class Meta:
         verbose_name = _("Board")
         verbose_name_plural = _("Boards")
         unique_together = []
         ordering = ["title"]
+        indexes = [
+            # Cursor pagination keyset
+            models.Index(fields=["created", "id"], name="boards_created_id_idx"),
+            # Delta sync watermark scan
+            models.Index(fields=["modified", "id"], name="boards_modified_id_idx"),
+            # Full text search
+            GinIndex(fields=["search_vector"], name="boards_search_vector_idx"),
+        ]
         default_permissions = ["view"]
         permissions = [
             ("add_list", "Can create new list in the board"),
             ("add_card", "Can create new card in the board"),
+            ("change_board", "Can change the board"),
+            ("manage_board", "Can manage permissions and roles of the board"),
         ]
         get_latest_by = "modified"
 
     def clean(self):
         pass
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        board = super().from_db(db, field_names, values)
+        # Public flag as stored (organization counters track its changes)
+        board.saved_public = board.__dict__.get("public")
+        return board
+
     def save(self, *args, **kwargs):
         # Generate slug board is created
         if self._state.adding:
-            self.slug = f"{slugify(self.title)}-{random(6)}"
+            self.slug = self.generate_slug(self.title)
+        elif getattr(self, "saved_public", None) is None and "public" in self.__dict__:
+            # Public flag was deferred when loaded: read the stored one before
+            # it's overwritten
+            self.saved_public = (
+                Board.objects.filter(pk=self.pk)
+                .values_list("public", flat=True)
+                .first()
+            )
 
         super().save(*args, **kwargs)
+        update_fields = kwargs.get("update_fields")
+        if "public" in self.__dict__ and (
+            update_fields is None or "public" in update_fields
+        ):
+            self.saved_public = self.public
+
+    @staticmethod
+    def generate_slug(title: str) -> str:
+        return f"{slugify(title)}-{random(6)}"
+
+    @classmethod
+    def generate_slugs(cls, boards: Iterable["Board"]) -> None:
+        """
+        Generate slugs for the batch of boards (e.g. before `bulk_create`).
+
+        Slugs are unique in the batch and checked against existing ones with
+        a single query.
+        """
+        boards = list(boards)
+        slugs = [cls.generate_slug(board.title) for board in boards]
+        taken = set(
+            cls.objects.filter(slug__in=slugs).values_list("slug", flat=True)
+        )
+        used: Set[str] = set()
+        for board, slug in zip(boards, slugs):
+            while slug in taken or slug in used:
+                slug = cls.generate_slug(board.title)
+            used.add(slug)
+            board.slug = slug
 
     def __str__(self):
         return self.title
 
     def get_absolute_url(self):
         return reverse("api:boards-detail", kwargs={"slug": self.slug})
+
+
+class BoardUserObjectPermission(UserObjectPermissionBase):
+    """
+    Model representing user object permission on the board.
+
+    Direct foreign key (instead of guardian's generic `object_pk` varchar) is
+    joined without cast, guardian shortcuts and checker use it for boards.
+    """
+
+    content_object = models.ForeignKey(
+        verbose_name=_("Board"),
+        to=Board,
+        on_delete=models.CASCADE,
+        related_name="user_permissions",
+    )
+
+    class Meta(UserObjectPermissionBase.Meta):
+        verbose_name = _("Board user permission")
+        verbose_name_plural = _("Board user permissions")
+        indexes = [
+            # Permissions of the board (user permissions are unique together)
+            models.Index(
+                fields=["content_object", "permission"],
+                name="boards_userperm_board_idx",
+            ),
+        ]
+        default_permissions = []
+
+
+class BoardRole(models.Model):
+    """
+    Model representing role of the user on the board.
+
+    Role bundles board permissions (see `demanage.boards.roles`), one row per
+    user and board regardless of the number of permissions.
+    """
+
+    class Role(models.TextChoices):
+        VIEWER = "viewer", _("Viewer")
+        EDITOR = "editor", _("Editor")
+        ADMIN = "admin", _("Admin")
+
+    id = models.BigAutoField(verbose_name="ID", primary_key=True)
+    user = models.ForeignKey(
+        verbose_name=_("User"),
+        to="users.User",
+        on_delete=models.CASCADE,
+        related_name="board_roles",
+    )
+    board = models.ForeignKey(
+        verbose_name=_("Board"),
+        to=Board,
+        on_delete=models.CASCADE,
+        related_name="roles",
+    )
+    role = models.CharField(
+        verbose_name=_("Role"), max_length=10, choices=Role.choices
+    )
+
+    class Meta:
+        verbose_name = _("Board role")
+        verbose_name_plural = _("Board roles")
+        unique_together = [["user", "board"]]  # (user_id, board_id) index
+        default_permissions = []
+
+    def __str__(self):
+        return f"{self.user} is {self.role} of {self.board}"
+
+
+class BoardVisibility(models.Model):
+    """
+    Model representing materialized board visibility (user can view board).
+
+    Rows are maintained by signals (see `demanage.boards.signals`) and can be
+    rebuilt with `manage.py rebuild_board_visibility`.
+    """
+
+    id = models.BigAutoField(verbose_name="ID", primary_key=True)
+    user = models.ForeignKey(
+        verbose_name=_("User"),
+        to="users.User",
+        on_delete=models.CASCADE,
+        related_name="board_visibility",
+    )
+    board = models.ForeignKey(
+        verbose_name=_("Board"),
+        to=Board,
+        on_delete=models.CASCADE,
+        related_name="visibility",
+    )
+    created = models.DateTimeField(
+        verbose_name=_("Created"),
+        help_text=_("When board became visible to the user (delta sync)."),
+        default=timezone.now,
+        editable=False,
+    )
+
+    class Meta:
+        verbose_name = _("Board visibility")
+        verbose_name_plural = _("Board visibilities")
+        unique_together = [["user", "board"]]  # (user_id, board_id) index
+        default_permissions = []
+
+    def __str__(self):
+        return f"{self.board} visible to {self.user}"
+
+
+class BoardTombstone(models.Model):
+    """
+    Model representing board deleted or hidden from the user (delta sync).
+
+    Tombstones are kept for `BOARDS_TOMBSTONE_RETENTION_DAYS` (see `sync` module).
+    """
+
+    class Reason(models.TextChoices):
+        DELETED = "deleted", _("Deleted")
+        REVOKED = "revoked", _("Access revoked")
+
+    id = models.BigAutoField(verbose_name="ID", primary_key=True)
+    user = models.ForeignKey(
+        verbose_name=_("User"),
+        to="users.User",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    board_id = models.BigIntegerField(verbose_name=_("Board ID"))
+    slug = models.SlugField(verbose_name=_("Slug"), db_index=False)
+    reason = models.CharField(
+        verbose_name=_("Reason"), max_length=10, choices=Reason.choices
+    )
+    created = models.DateTimeField(
+        verbose_name=_("Created"), default=timezone.now, editable=False
+    )
+
+    class Meta:
+        verbose_name = _("Board tombstone")
+        verbose_name_plural = _("Board tombstones")
+        indexes = [
+            models.Index(fields=["user", "created"], name="boards_tombstone_user_idx"),
+            models.Index(fields=["created"], name="boards_tombstone_created_idx"),
+        ]
+        default_permissions = []
+
+    def __str__(self):
+        return f"{self.slug} {self.reason} for {self.user}"
+
+
+class List(TimeStampedModel):
+    """
+    Model representing list of cards in the board.
+    """
+
+    id = models.BigAutoField(verbose_name="ID", primary_key=True)
+    board = models.ForeignKey(
+        verbose_name=_("Board"),
+        to=Board,
+        on_delete=models.CASCADE,
+        related_name="lists",
+    )
+    title = models.CharField(verbose_name=_("Title"), max_length=50, blank=False)
+    rank = models.CharField(
+        verbose_name=_("Rank"),
+        help_text=_("Fractional ordering key (see `ranks` module), C collation."),
+        max_length=255,
+        editable=False,
+    )
+
+    class Meta:
+        verbose_name = _("List")
+        verbose_name_plural = _("Lists")
+        ordering = ["rank", "id"]
+        indexes = [
+            models.Index(fields=["board", "rank", "id"], name="boards_list_rank_idx"),
+        ]
+        default_permissions = []
+
+    def __str__(self):
+        return self.title
+
+
+class Card(TimeStampedModel):
+    """
+    Model representing card in the list.
+    """
+
+    id = models.BigAutoField(verbose_name="ID", primary_key=True)
+    list = models.ForeignKey(
+        verbose_name=_("List"),
+        to=List,
+        on_delete=models.CASCADE,
+        related_name="cards",
+    )
+    title = models.CharField(verbose_name=_("Title"), max_length=100, blank=False)
+    description = models.TextField(verbose_name=_("Description"), blank=True)
+    rank = models.CharField(
+        verbose_name=_("Rank"),
+        help_text=_("Fractional ordering key (see `ranks` module), C collation."),
+        max_length=255,
+        editable=False,
+    )
+
+    class Meta:
+        verbose_name = _("Card")
+        verbose_name_plural = _("Cards")
+        ordering = ["rank", "id"]
+        indexes = [
+            models.Index(fields=["list", "rank", "id"], name="boards_card_rank_idx"),
+        ]
+        default_permissions = []
+
+    def __str__(self):
+        return self.title
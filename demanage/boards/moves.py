@@ -0,0 +1,70 @@
+"""
+Positioning of lists and cards among siblings with fractional ranks.
+
+Placing an item reads at most two neighbour rows and writes only the item row.
+Siblings are rebalanced in the background when ranks grow too long.
+"""
+from typing import Optional
+
+from django.db import transaction
+from django.db.models import Model
+from django.db.models.query import QuerySet
+
+from . import ranks
+from .models import Card, List
+from .tasks import rebalance_cards, rebalance_lists
+
+
+def rank_after(siblings: QuerySet, previous: Optional[Model]) -> str:
+    """
+    Return rank placing an item right after `previous` (None means first).
+    """
+    if previous is None:
+        following = siblings.order_by("rank", "id").values_list("rank", flat=True)
+        return ranks.rank_between(None, following.first())
+
+    following = (
+        siblings.filter(rank__gt=previous.rank)
+        .order_by("rank", "id")
+        .values_list("rank", flat=True)
+    )
+    return ranks.rank_between(previous.rank, following.first())
+
+
+def rank_last(siblings: QuerySet) -> str:
+    """
+    Return rank placing an item after all siblings.
+    """
+    last = siblings.order_by("-rank", "-id").values_list("rank", flat=True).first()
+    return ranks.rank_between(last, None)
+
+
+def place_list(board_list: List, previous: Optional[List]) -> List:
+    siblings = List.objects.filter(board_id=board_list.board_id).exclude(
+        pk=board_list.pk
+    )
+    board_list.rank = rank_after(siblings, previous)
+    return board_list
+
+
+def place_card(card: Card, previous: Optional[Card]) -> Card:
+    siblings = Card.objects.filter(list_id=card.list_id).exclude(pk=card.pk)
+    card.rank = rank_after(siblings, previous)
+    return card
+
+
+def schedule_rebalance(item: Model) -> None:
+    """
+    Rebalance item siblings in the background if the item rank is too long.
+
+    Task is sent after commit, so the worker sees the move.
+    """
+    if not ranks.needs_rebalance(item.rank):
+        return
+
+    if isinstance(item, List):
+        board_id = item.board_id
+        transaction.on_commit(lambda: rebalance_lists.delay(board_id))
+    else:
+        list_id = item.list_id
+        transaction.on_commit(lambda: rebalance_cards.delay(list_id))
@@ -1,5 +1,7 @@
 from rest_framework import pagination
 
+from demanage.pagination import KeysetPagination
+
 
 class BoardPagination(pagination.PageNumberPagination):
     """
@@ -10,3 +12,13 @@ class BoardPagination(pagination.PageNumberPagination):
     max_page_size = 30
     page_query_param = "page"
     page_size_query_param = "page_size"
+
+
+class BoardCursorPagination(KeysetPagination):
+    """
+    Response data cursor (keyset) pagination for board.
+    """
+
+    ordering = ("-created", "-id")
+    page_size = 10
+    max_page_size = 30
@@ -28,14 +28,41 @@ class BoardPermission(permissions.BasePermission):
         - update specific board (public or private)
         - delete specific board (public or private)
         """
-        if view.action == "retrieve":
-            # If object is visible (filtered from queryset) user can see it
+        if view.action in ["retrieve", "snapshot", "clone"]:
+            # If object is visible (filtered from queryset) user can see (copy) it
             return True
 
-        if view.action in ["update", "partial_update"]:
+        if view.action == "update":
             return obj.organization.representative == request.user
 
+        if view.action == "partial_update":
+            # Board admin can't move the board (organization is the representative's)
+            return obj.organization.representative == request.user or (
+                request.user.has_perm("boards.change_board", obj)  # board admin
+            )
+
         if view.action == "destroy":
             return obj.organization.representative == request.user
 
         return False
+
+
+class BoardItemPermission(permissions.BasePermission):
+    """
+    Authorization for board lists and cards.
+
+    Items of visible board can be read, representative or user with
+    `item_permission` on the board can create, change, move and delete them.
+    """
+
+    def has_permission(self, request: Request, view: ViewSet) -> bool:
+        if not request.user.is_authenticated:
+            return False
+
+        if request.method in permissions.SAFE_METHODS:
+            return True
+
+        board = view.get_board()
+        return board.organization.representative_id == request.user.pk or (
+            request.user.has_perm(f"boards.{view.item_permission}", board)
+        )
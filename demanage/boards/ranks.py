@@ -0,0 +1,117 @@
+"""
+Fractional (lexorank-style) ordering keys for lists and cards.
+
+Rank is a base 36 fraction written without "0." prefix and trailing zeros
+(e.g. "i" = 18/36). Between any two ranks there is another one, so moving an
+item updates only the item row. Ranks grow when items are repeatedly inserted
+at the same place, `spread_ranks` generates short evenly spaced ranks for
+rebalancing.
+"""
+import math
+from typing import List, Optional
+
+DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+BASE = len(DIGITS)
+
+# Rebalance siblings in the background when a rank grows over this length
+REBALANCE_LENGTH = 24
+
+
+def rank_between(before: Optional[str], after: Optional[str]) -> str:
+    """
+    Return rank strictly between `before` and `after` (None means no bound).
+    """
+    if before is not None and after is not None and not before < after:
+        raise ValueError(f"Rank {before!r} must be less than {after!r}.")
+
+    # Appending and prepending step by one digit (keeps ranks short)
+    if before is not None and after is None:
+        return _increment(before)
+    if before is None and after is not None:
+        return _decrement(after)
+
+    return _midpoint(before or "", after)
+
+
+def spread_ranks(count: int) -> List[str]:
+    """
+    Return `count` short, evenly spaced ascending ranks.
+    """
+    if count <= 0:
+        return []
+
+    width = max(1, math.ceil(math.log(count + 1, BASE))) + 1
+    span = BASE ** width
+    return [
+        _encode(span * position // (count + 1), width).rstrip("0")
+        for position in range(1, count + 1)
+    ]
+
+
+def rank_from_number(value: float, width: int = 12, scale: int = 16) -> str:
+    """
+    Map a non negative number to a rank preserving order (e.g. Trello `pos`).
+    """
+    number = max(1, int(round(value * scale)))
+    return _encode(min(number, BASE ** width - 1), width).rstrip("0")
+
+
+def needs_rebalance(rank: str) -> bool:
+    return len(rank) > REBALANCE_LENGTH
+
+
+def _encode(number: int, width: int) -> str:
+    digits = []
+    for _ in range(width):
+        number, digit = divmod(number, BASE)
+        digits.append(DIGITS[digit])
+    return "".join(reversed(digits))
+
+
+def _increment(rank: str) -> str:
+    """
+    Return short rank greater than the rank.
+    """
+    for position in range(len(rank) + 1):
+        digit = DIGITS.index(rank[position]) if position < len(rank) else 0
+        if digit < BASE - 1:
+            return rank[:position] + DIGITS[digit + 1]
+    raise AssertionError("unreachable")
+
+
+def _decrement(rank: str) -> str:
+    """
+    Return short rank less than the rank (and greater than zero).
+    """
+    for position, char in enumerate(rank):
+        digit = DIGITS.index(char)
+        if digit > 1:
+            return rank[:position] + DIGITS[digit - 1]
+        if digit == 1 and position == len(rank) - 1:
+            return rank[:position] + "0" + DIGITS[-1]
+    return _midpoint("", rank)
+
+
+def _midpoint(before: str, after: Optional[str]) -> str:
+    """
+    Midpoint of two fractions, `before` may be "" (zero), `after` None (one).
+    """
+    if after is not None:
+        # Skip common prefix (`before` is padded with zeros)
+        length = 0
+        while length < len(after) and (
+            before[length] if length < len(before) else "0"
+        ) == after[length]:
+            length += 1
+        if length > 0:
+            return after[:length] + _midpoint(before[length:], after[length:])
+
+    digit_before = DIGITS.index(before[0]) if before else 0
+    digit_after = DIGITS.index(after[0]) if after is not None else BASE
+    if digit_after - digit_before > 1:
+        return DIGITS[(digit_before + digit_after) // 2]
+
+    # Digits are consecutive
+    if after is not None and len(after) > 1:
+        return after[:1]
+    return DIGITS[digit_before] + _midpoint(before[1:], None)
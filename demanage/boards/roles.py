@@ -0,0 +1,69 @@
+"""
+Board roles (viewer, editor, admin).
+
+Role is stored as one `BoardRole` row per user and board and resolved to board
+permissions in memory through a bitmask: checking any number of permissions
+costs one `(user_id, board_id)` index lookup, cached on the user object for
+the request (see `demanage.boards.backends.BoardRoleBackend`).
+"""
+from typing import Dict, List, Optional
+
+from .models import Board, BoardRole
+
+# Permission codenames (bit is the position)
+PERMISSIONS = ["view_board", "add_list", "add_card", "change_board", "manage_board"]
+PERMISSION_BITS: Dict[str, int] = {
+    codename: 1 << position for position, codename in enumerate(PERMISSIONS)
+}
+
+VIEWER = PERMISSION_BITS["view_board"]
+EDITOR = VIEWER | PERMISSION_BITS["add_list"] | PERMISSION_BITS["add_card"]
+ADMIN = EDITOR | PERMISSION_BITS["change_board"] | PERMISSION_BITS["manage_board"]
+
+ROLE_MASKS: Dict[str, int] = {
+    BoardRole.Role.VIEWER: VIEWER,
+    BoardRole.Role.EDITOR: EDITOR,
+    BoardRole.Role.ADMIN: ADMIN,
+}
+
+ROLE_CACHE_ATTRIBUTE = "_board_role_cache"
+
+
+def get_mask(role: Optional[str]) -> int:
+    return ROLE_MASKS.get(role, 0) if role else 0
+
+
+def get_permissions(role: Optional[str]) -> List[str]:
+    """
+    Return permission codenames of the role.
+    """
+    mask = get_mask(role)
+    return [c for c in PERMISSIONS if mask & PERMISSION_BITS[c]]
+
+
+def has_permission(role: Optional[str], codename: str) -> bool:
+    return bool(get_mask(role) & PERMISSION_BITS.get(codename, 0))
+
+
+def get_role(user, board: Board) -> Optional[str]:
+    """
+    Return role of the user on the board (fetched once per user object).
+    """
+    if not user.is_authenticated:
+        return None
+
+    roles: Dict[int, Optional[str]] = user.__dict__.setdefault(
+        ROLE_CACHE_ATTRIBUTE, {}
+    )
+    if board.pk not in roles:
+        roles[board.pk] = (
+            BoardRole.objects.filter(user=user, board=board)
+            .values_list("role", flat=True)
+            .first()
+        )
+    return roles[board.pk]
+
+
+def clear_cache(role: BoardRole) -> None:
+    if BoardRole.user.is_cached(role):
+        role.user.__dict__.pop(ROLE_CACHE_ATTRIBUTE, None)
@@ -1,10 +1,78 @@
+import re
+from typing import List, Optional
+
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank
+from django.db.models import F
+from django.db.models.query import QuerySet
 from rest_framework.filters import SearchFilter
 from rest_framework.request import Request
 from rest_framework.views import APIView
 
+from .models import SEARCH_CONFIG, Board
+
 
 class BoardSearchFilter(SearchFilter):
+    """
+    Full text search over stored (trigger maintained) board search vector.
+
+    Results are ranked with `SearchRank` (title is weighted over description).
+    """
+
     search_param = "search"
 
-    def get_search_fields(self, view: APIView, request: Request):
-        return ["$title", "@description"]
+    def get_search_query(self, request: Request) -> Optional[SearchQuery]:
+        """
+        Build prefix matching query from the search terms: `term1:* & term2:*`.
+        """
+        words: List[str] = []
+        for term in self.get_search_terms(request):
+            words.extend(re.findall(r"\w+", term))
+
+        if not words:
+            return None
+
+        return SearchQuery(
+            " & ".join(f"{word}:*" for word in words),
+            config=SEARCH_CONFIG,
+            search_type="raw",
+        )
+
+    def filter_queryset(
+        self, request: Request, queryset: QuerySet, view: APIView
+    ) -> QuerySet:
+        query = self.get_search_query(request)
+        if query is None:
+            return queryset
+
+        return (
+            queryset.filter(search_vector=query)
+            .annotate(search_rank=SearchRank(F("search_vector"), query))
+            .order_by("-search_rank", "id")
+        )
+
+    def add_headlines(self, request: Request, boards: List[Board]) -> List[Board]:
+        """
+        Set highlighted description snippet (`search_headline`) on the page of boards.
+
+        Headlines are computed for the page only (not for all matched rows).
+        """
+        query = self.get_search_query(request)
+        if query is None or not boards:
+            return boards
+
+        headlines = dict(
+            Board.objects.filter(pk__in=[board.pk for board in boards])
+            .annotate(
+                search_headline=SearchHeadline(
+                    "description",
+                    query,
+                    config=SEARCH_CONFIG,
+                    start_sel="<b>",
+                    stop_sel="</b>",
+                )
+            )
+            .values_list("pk", "search_headline")
+        )
+        for board in boards:
+            board.search_headline = headlines.get(board.pk, "")
+        return boards
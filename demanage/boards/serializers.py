@@ -1,8 +1,9 @@
 from rest_framework import serializers
 
+from demanage.fieldsets import SparseFieldsetsMixin
 from demanage.organizations.models import Organization
 
-from .models import Board
+from .models import Board, Card, List
 
 
 class OrganizationSlugRelatedField(serializers.SlugRelatedField):
@@ -11,8 +12,15 @@ class OrganizationSlugRelatedField(serializers.SlugRelatedField):
         user = self.context["request"].user
         return Organization.objects.filter(representative=user)
 
+    def to_internal_value(self, data):
+        # Resolve each slug once per context (bulk validation shares context)
+        resolved = self.context.setdefault("organizations_by_slug", {})
+        if data not in resolved:
+            resolved[data] = super().to_internal_value(data)
+        return resolved[data]
 
-class BoardSerializer(serializers.ModelSerializer):
+
+class BoardSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
     """
     Serializer to dict for board.
     """
@@ -41,3 +49,60 @@ class BoardSerializer(serializers.ModelSerializer):
         extra_kwargs = {
             "slug": {"read_only": True},
         }
+
+
+class BoardSearchSerializer(BoardSerializer):
+    """
+    Serializer to dict for board found with full text search.
+    """
+
+    rank = serializers.FloatField(source="search_rank", read_only=True)
+    headline = serializers.CharField(source="search_headline", read_only=True)
+
+    class Meta(BoardSerializer.Meta):
+        fields = BoardSerializer.Meta.fields + ["rank", "headline"]
+
+
+class BoardListSerializer(serializers.ModelSerializer):
+    """
+    Serializer to dict for board list.
+    """
+
+    class Meta:
+        model = List
+        fields = ["id", "title", "rank", "created", "modified"]
+        read_only_fields = ["rank"]
+
+
+class CardSerializer(serializers.ModelSerializer):
+    """
+    Serializer to dict for list card.
+    """
+
+    class Meta:
+        model = Card
+        fields = ["id", "list", "title", "description", "rank", "created", "modified"]
+        read_only_fields = ["list", "rank"]
+
+
+class MoveSerializer(serializers.Serializer):
+    """
+    Deserializer of the new position: item is placed right after `previous`
+    sibling (or first if null) in the target `list` (cards only).
+    """
+
+    previous = serializers.IntegerField(allow_null=True)
+    list = serializers.IntegerField(required=False)
+
+
+class CloneSerializer(serializers.Serializer):
+    """
+    Deserializer of the board copy: target `organization`, `title` (defaults to
+    the source title), `public` (defaults to the source) and whether to copy
+    `view_board` grants.
+    """
+
+    organization = OrganizationSlugRelatedField(slug_field="slug")
+    title = serializers.CharField(max_length=50, required=False)
+    public = serializers.BooleanField(required=False, allow_null=True, default=None)
+    permissions = serializers.BooleanField(default=False)
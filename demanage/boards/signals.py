@@ -0,0 +1,168 @@
+"""
+Signal receivers keeping board visibility (`BoardVisibility`) up to date,
+invalidating board response cache, patching board snapshots and leaving
+tombstones of deleted boards.
+"""
+import threading
+from typing import Type
+
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from demanage.members.models import Member
+from demanage.organizations.models import Organization
+
+from . import cache, roles, snapshot, sync, visibility
+from .models import Board, BoardRole, BoardUserObjectPermission, Card, List
+
+# Boards and lists being deleted by the current thread (their permissions and
+# cards are deleted in cascade)
+_deleting = threading.local()
+
+
+@receiver(post_save, sender=Board)
+def board_post_save_receiver(sender: Type[Board], instance: Board, **kwargs):
+    """
+    Refresh board visibility when board is created or public flag is changed
+    and invalidate organization boards responses.
+    """
+    visibility.refresh_board(instance.pk)
+    cache.bump_organization(instance.organization_id)
+    snapshot.invalidate(instance.pk)
+
+
+@receiver(pre_delete, sender=Board)
+def board_pre_delete_receiver(sender: Type[Board], instance: Board, **kwargs):
+    """
+    Leave tombstones of the board for users who could see it (delta sync).
+    """
+    _get_deleting("boards").add(instance.pk)
+    sync.bury_board(instance)
+
+
+@receiver(post_delete, sender=Board)
+def board_post_delete_receiver(sender: Type[Board], instance: Board, **kwargs):
+    _get_deleting("boards").discard(instance.pk)
+    cache.bump_organization(instance.organization_id)
+    snapshot.invalidate(instance.pk)
+
+
+@receiver(post_save, sender=Organization)
+def organization_post_save_receiver(
+    sender: Type[Organization], instance: Organization, created: bool, **kwargs
+):
+    """
+    Refresh organization boards visibility (representative can be changed) and
+    invalidate snapshots (documents contain organization slug).
+    """
+    if not created:
+        visibility.refresh_organization(instance.pk)
+        cache.bump_organization(instance.pk)
+        snapshot.invalidate_many(
+            Board.objects.filter(organization=instance).values_list("id", flat=True)
+        )
+
+
+@receiver(post_save, sender=Member)
+@receiver(post_delete, sender=Member)
+def member_visibility_receiver(sender: Type[Member], instance: Member, **kwargs):
+    """
+    Refresh member visibility of public boards after member joined or left.
+    """
+    visibility.refresh_organization(instance.organization_id, instance.user_id)
+    cache.bump_organization(instance.organization_id)
+
+
+@receiver(post_save, sender=BoardUserObjectPermission)
+@receiver(post_delete, sender=BoardUserObjectPermission)
+def user_object_permission_visibility_receiver(
+    sender: Type[BoardUserObjectPermission],
+    instance: BoardUserObjectPermission,
+    **kwargs,
+):
+    """
+    Refresh board visibility after `view_board` permission is assigned or removed.
+    """
+    if is_board_deleting(instance.content_object_id):
+        return  # visibility is deleted in cascade
+
+    if instance.permission.codename != "view_board":
+        return
+
+    boards = Board.objects.filter(pk=instance.content_object_id)
+    visibility.refresh(boards, [instance.user_id])
+    for organization_id in boards.values_list("organization_id", flat=True):
+        cache.bump_organization(organization_id)
+
+
+@receiver(post_save, sender=BoardRole)
+@receiver(post_delete, sender=BoardRole)
+def board_role_visibility_receiver(
+    sender: Type[BoardRole], instance: BoardRole, **kwargs
+):
+    """
+    Refresh board visibility after role is assigned or removed.
+    """
+    roles.clear_cache(instance)
+    if is_board_deleting(instance.board_id):
+        return  # visibility is deleted in cascade
+
+    boards = Board.objects.filter(pk=instance.board_id)
+    visibility.refresh(boards, [instance.user_id])
+    for organization_id in boards.values_list("organization_id", flat=True):
+        cache.bump_organization(organization_id)
+
+
+@receiver(post_save, sender=List)
+def list_post_save_receiver(sender: Type[List], instance: List, **kwargs):
+    snapshot.save_list(instance)
+
+
+@receiver(pre_delete, sender=List)
+def list_pre_delete_receiver(sender: Type[List], instance: List, **kwargs):
+    _get_deleting("lists").add(instance.pk)
+
+
+@receiver(post_delete, sender=List)
+def list_post_delete_receiver(sender: Type[List], instance: List, **kwargs):
+    """
+    Remove the list with its cards from the board snapshot.
+    """
+    _get_deleting("lists").discard(instance.pk)
+    snapshot.delete_list(instance)
+
+
+@receiver(post_save, sender=Card)
+def card_post_save_receiver(sender: Type[Card], instance: Card, **kwargs):
+    snapshot.save_card(instance, instance.list.board_id)
+
+
+@receiver(post_delete, sender=Card)
+def card_post_delete_receiver(sender: Type[Card], instance: Card, **kwargs):
+    """
+    Remove the card from the board snapshot (unless whole list is deleted).
+    """
+    if is_list_deleting(instance.list_id):
+        return
+
+    snapshot.delete_card(instance, instance.list.board_id)
+
+
+def is_list_deleting(list_id: int) -> bool:
+    """
+    Return whether the list is being deleted (with its cards) by this thread.
+    """
+    return list_id in _get_deleting("lists")
+
+
+def is_board_deleting(board_id: int) -> bool:
+    """
+    Return whether the board is being deleted (with its permissions) by this thread.
+    """
+    return board_id in _get_deleting("boards")
+
+
+def _get_deleting(kind: str) -> set:
+    if not hasattr(_deleting, kind):
+        setattr(_deleting, kind, set())
+    return getattr(_deleting, kind)
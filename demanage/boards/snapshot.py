@@ -0,0 +1,185 @@
+"""
+Precomputed JSON document of the board with its lists and cards (snapshot).
+
+Document is built with a fixed number of queries and cached per board as
+rendered JSON. List and card signals patch the cached document in place (see
+`demanage.boards.signals`) instead of rebuilding it. User permissions are not
+part of the document, they are spliced into the rendered JSON per request.
+"""
+import json
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from guardian.core import ObjectPermissionChecker
+from rest_framework.utils.encoders import JSONEncoder
+
+from . import roles
+from .models import Board, Card
+from .models import List as BoardList
+from .serializers import BoardListSerializer, BoardSerializer, CardSerializer
+
+SNAPSHOT_KEY = "boards:snapshot:{}"
+LOCK_KEY = "boards:snapshot-lock:{}"
+LOCK_TIMEOUT = 10
+
+REPRESENTATIVE_PERMISSIONS = [
+    "add_card",
+    "add_list",
+    "change_board",
+    "manage_board",
+    "view_board",
+]
+
+Document = Dict[str, Any]
+
+
+def build(board: Board) -> Document:
+    """
+    Build snapshot document of the board (two queries).
+
+    Lists and cards are kept in dicts by id so they can be patched.
+    """
+    lists = {
+        board_list.pk: dict(BoardListSerializer(board_list).data, cards={})
+        for board_list in BoardList.objects.filter(board=board)
+    }
+    for card in Card.objects.filter(list__board=board):
+        lists[card.list_id]["cards"][card.pk] = dict(CardSerializer(card).data)
+    return {"board": dict(BoardSerializer(board).data), "lists": lists}
+
+
+def render(document: Document) -> bytes:
+    """
+    Render the document to JSON with lists and cards ordered by rank.
+    """
+    lists = []
+    for board_list in sorted(document["lists"].values(), key=_position):
+        cards = sorted(board_list["cards"].values(), key=_position)
+        lists.append(dict(board_list, cards=cards))
+    content = {"board": document["board"], "lists": lists}
+    return json.dumps(content, cls=JSONEncoder, separators=(",", ":")).encode()
+
+
+def get_content(board: Board) -> bytes:
+    """
+    Return rendered snapshot of the board from cache (or build and cache it).
+    """
+    key = SNAPSHOT_KEY.format(board.pk)
+    cached: Optional[Tuple[Document, bytes]] = cache.get(key)
+    if cached is not None:
+        return cached[1]
+
+    document = build(board)
+    content = render(document)
+    # Don't overwrite a document patched in the meantime
+    cache.add(key, (document, content), settings.BOARDS_SNAPSHOT_TIMEOUT)
+    return content
+
+
+def get_permissions(user, board: Board) -> List[str]:
+    """
+    Return codenames of the effective user permissions on the (visible) board.
+    """
+    if user.is_superuser or board.organization.representative_id == user.pk:
+        return REPRESENTATIVE_PERMISSIONS
+
+    permissions = set(ObjectPermissionChecker(user).get_perms(board))
+    permissions.update(roles.get_permissions(roles.get_role(user, board)))
+    permissions.add("view_board")  # board is visible
+    return sorted(permissions)
+
+
+def get_response_content(user, board: Board) -> bytes:
+    """
+    Return snapshot JSON with user permissions spliced in.
+    """
+    permissions = json.dumps(get_permissions(user, board)).encode()
+    return b'{"permissions":' + permissions + b"," + get_content(board)[1:]
+
+
+def invalidate(board_id: int) -> None:
+    cache.delete(SNAPSHOT_KEY.format(board_id))
+    transaction.on_commit(lambda: cache.delete(SNAPSHOT_KEY.format(board_id)))
+
+
+def invalidate_many(board_ids: Iterable[int]) -> None:
+    keys = [SNAPSHOT_KEY.format(board_id) for board_id in board_ids]
+    if keys:
+        cache.delete_many(keys)
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def patch(board_id: int, change) -> None:
+    """
+    Apply the change to the cached document after transaction commit.
+
+    Documents patched concurrently (lock is taken) are dropped and rebuilt
+    on the next request.
+    """
+
+    def apply():
+        key = SNAPSHOT_KEY.format(board_id)
+        lock = LOCK_KEY.format(board_id)
+        if not cache.add(lock, 1, LOCK_TIMEOUT):
+            cache.delete(key)
+            return
+
+        try:
+            cached = cache.get(key)
+            if cached is None:
+                return
+            document = cached[0]
+            if change(document) is False:
+                cache.delete(key)
+                return
+            content = render(document)
+            cache.set(key, (document, content), settings.BOARDS_SNAPSHOT_TIMEOUT)
+        finally:
+            cache.delete(lock)
+
+    transaction.on_commit(apply)
+
+
+def save_list(board_list: BoardList) -> None:
+    data = dict(BoardListSerializer(board_list).data)
+
+    def change(document: Document):
+        cards = document["lists"].get(board_list.pk, {}).get("cards", {})
+        document["lists"][board_list.pk] = dict(data, cards=cards)
+
+    patch(board_list.board_id, change)
+
+
+def delete_list(board_list: BoardList) -> None:
+    def change(document: Document):
+        document["lists"].pop(board_list.pk, None)
+
+    patch(board_list.board_id, change)
+
+
+def save_card(card: Card, board_id: int) -> None:
+    data = dict(CardSerializer(card).data)
+
+    def change(document: Document):
+        if card.list_id not in document["lists"]:
+            return False
+        # Card could be moved from the other list
+        for board_list in document["lists"].values():
+            board_list["cards"].pop(card.pk, None)
+        document["lists"][card.list_id]["cards"][card.pk] = data
+
+    patch(board_id, change)
+
+
+def delete_card(card: Card, board_id: int) -> None:
+    def change(document: Document):
+        for board_list in document["lists"].values():
+            board_list["cards"].pop(card.pk, None)
+
+    patch(board_id, change)
+
+
+def _position(item: Dict[str, Any]):
+    return item["rank"], item["id"]
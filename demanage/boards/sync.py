@@ -0,0 +1,143 @@
+"""
+Delta sync of boards (`?since=<watermark>`).
+
+Watermark is the server time of the previous sync. Changes since the watermark
+are boards modified (or made visible to the user) after it and tombstones of
+boards deleted or hidden from the user after it. Tombstones are kept for
+`BOARDS_TOMBSTONE_RETENTION_DAYS`, older watermarks are expired (client has to
+fetch all boards).
+"""
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models import Q
+from django.db.models.query import QuerySet
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import Board, BoardTombstone, BoardVisibility
+
+Pair = Tuple[int, int]  # (user_id, board_id)
+
+
+def parse_watermark(value: str) -> Optional[datetime]:
+    """
+    Parse ISO 8601 watermark (naive watermark is in UTC) or return None.
+    """
+    try:
+        watermark = parse_datetime(value)
+    except ValueError:
+        return None
+    if watermark is not None and timezone.is_naive(watermark):
+        watermark = timezone.make_aware(watermark, timezone.utc)
+    return watermark
+
+
+def new_watermark() -> datetime:
+    """
+    Return watermark of the sync starting now.
+
+    Overlap covers rows saved (`modified`) before but committed after the sync.
+    """
+    return timezone.now() - timedelta(seconds=settings.BOARDS_SYNC_OVERLAP)
+
+
+def format_watermark(watermark: datetime) -> str:
+    return watermark.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def is_expired(watermark: datetime) -> bool:
+    return watermark < timezone.now() - get_retention()
+
+
+def get_retention() -> timedelta:
+    return timedelta(days=settings.BOARDS_TOMBSTONE_RETENTION_DAYS)
+
+
+def changed_boards(queryset: QuerySet, user, watermark: datetime) -> QuerySet:
+    """
+    Filter visible boards modified or made visible to the user after watermark.
+    """
+    changed = Q(modified__gt=watermark)
+    if not user.is_superuser:
+        became_visible = BoardVisibility.objects.filter(
+            user=user, created__gt=watermark
+        ).values("board_id")
+        changed |= Q(pk__in=became_visible)
+    return queryset.filter(changed).order_by("modified", "id")
+
+
+def get_tombstones(user, watermark: datetime) -> QuerySet:
+    """
+    Return tombstones of boards deleted or hidden from the user after watermark
+    (which are not visible again).
+    """
+    return (
+        BoardTombstone.objects.filter(user=user, created__gt=watermark)
+        .exclude(
+            board_id__in=BoardVisibility.objects.filter(user=user).values("board_id")
+        )
+        .order_by("created", "id")
+    )
+
+
+def bury(pairs: Iterable[Pair], reason: str) -> List[BoardTombstone]:
+    """
+    Create tombstones of the boards for the users.
+    """
+    pairs = list(pairs)
+    if not pairs:
+        return []
+
+    slugs = dict(
+        Board.objects.filter(pk__in={board_id for _, board_id in pairs}).values_list(
+            "id", "slug"
+        )
+    )
+    return BoardTombstone.objects.bulk_create(
+        [
+            BoardTombstone(
+                user_id=user_id, board_id=board_id, slug=slugs[board_id], reason=reason
+            )
+            for user_id, board_id in pairs
+            if board_id in slugs
+        ]
+    )
+
+
+def bury_board(board: Board) -> List[BoardTombstone]:
+    """
+    Create tombstones of the deleted board for users who could see it
+    (superusers see all boards without visibility rows).
+    """
+    user_ids = set(
+        BoardVisibility.objects.filter(board=board).values_list("user_id", flat=True)
+    )
+    user_ids.update(
+        get_user_model()
+        .objects.filter(is_superuser=True, is_active=True)
+        .values_list("pk", flat=True)
+    )
+    return BoardTombstone.objects.bulk_create(
+        [
+            BoardTombstone(
+                user_id=user_id,
+                board_id=board.pk,
+                slug=board.slug,
+                reason=BoardTombstone.Reason.DELETED,
+            )
+            for user_id in user_ids
+        ]
+    )
+
+
+def purge_tombstones() -> int:
+    """
+    Delete tombstones older than the retention window.
+    """
+    deleted, _ = BoardTombstone.objects.filter(
+        created__lt=timezone.now() - get_retention()
+    ).delete()
+    return deleted
@@ -0,0 +1,62 @@
+from django.db import transaction
+
+from config import celery_app
+
+from . import clone, snapshot, sync
+from .models import Card, List
+from .ranks import spread_ranks
+
+
+def _rebalance(queryset) -> int:
+    with transaction.atomic():
+        items = list(queryset.select_for_update().order_by("rank", "id").only("rank"))
+        for item, rank in zip(items, spread_ranks(len(items))):
+            item.rank = rank
+        queryset.model.objects.bulk_update(items, ["rank"], batch_size=1000)
+    return len(items)
+
+
+@celery_app.task()
+def rebalance_lists(board_pk):
+    """
+    Rewrite ranks of the board lists with short evenly spaced ranks.
+
+    Return number of rebalanced lists.
+    """
+    count = _rebalance(List.objects.filter(board_id=board_pk))
+    snapshot.invalidate(board_pk)  # ranks are written without signals
+    return count
+
+
+@celery_app.task()
+def rebalance_cards(list_pk):
+    """
+    Rewrite ranks of the list cards with short evenly spaced ranks.
+
+    Return number of rebalanced cards.
+    """
+    count = _rebalance(Card.objects.filter(list_id=list_pk))
+    boards = List.objects.filter(pk=list_pk).values_list("board_id", flat=True)
+    for board_pk in boards:
+        snapshot.invalidate(board_pk)  # ranks are written without signals
+    return count
+
+
+@celery_app.task()
+def purge_board_tombstones():
+    """
+    Delete board tombstones older than the retention window.
+
+    Return number of deleted tombstones.
+    """
+    return sync.purge_tombstones()
+
+
+@celery_app.task(soft_time_limit=60 * 60, time_limit=60 * 60 + 60)
+def clone_board_content(source_pk, board_pk, permissions=False):
+    """
+    Copy lists, cards (and grants) of the large source board to its clone.
+
+    Return number of copied cards.
+    """
+    return clone.copy_content(source_pk, board_pk, permissions)
@@ -1,10 +1,11 @@
-from factory import Faker, SubFactory
+from factory import Faker, Sequence, SubFactory
 from factory.declarations import LazyAttribute
 from factory.django import DjangoModelFactory
 
 from demanage.organizations.tests.factories import OrganizationFactory
 
-from ..models import Board
+from ..models import Board, Card, List
+from ..ranks import rank_from_number
 
 
 class BoardFactory(DjangoModelFactory):
@@ -25,3 +26,30 @@ class BoardFactory(DjangoModelFactory):
 
     class Meta:
         model = Board
+
+
+class ListFactory(DjangoModelFactory):
+    """
+    Factory for board list.
+    """
+
+    board = SubFactory(BoardFactory)
+    title = Faker("word")
+    rank = Sequence(lambda n: rank_from_number(n + 1))
+
+    class Meta:
+        model = List
+
+
+class CardFactory(DjangoModelFactory):
+    """
+    Factory for list card.
+    """
+
+    list = SubFactory(ListFactory)
+    title = Faker("sentence", nb_words=3)
+    description = Faker("text")
+    rank = Sequence(lambda n: rank_from_number(n + 1))
+
+    class Meta:
+        model = Card
@@ -1,6 +1,10 @@
 """
 Check that API is working correctly.
 """
+import csv
+import io
+import json
+
 import pytest
 from django.urls import reverse
 from guardian.shortcuts import assign_perm
@@ -8,7 +12,7 @@ from guardian.shortcuts import assign_perm
 from demanage.boards.models import Board
 from demanage.members.models import Member
 
-from .factories import BoardFactory
+from .factories import BoardFactory, CardFactory, ListFactory
 
 pytestmark = pytest.mark.django_db
 
@@ -305,3 +309,274 @@ def test_user_can_not_assign_permission_to_other_board_public_or_private():
 #     assert response.status_code == 200
 #     board.refresh_from_db()
 #     assert board.description == "New description"
+
+
+def test_boards_cursor_pagination_walks_all_pages(api_client_factory, organization):
+    user = organization.representative
+    boards = BoardFactory.create_batch(15, organization=organization)
+    api_client = api_client_factory(user)
+
+    response = api_client.get(reverse("api:board-list"), {"pagination": "cursor"})
+    first_page = response.data["results"]
+    assert "count" not in response.data
+    assert len(first_page) == 10
+    assert response.data["previous"] is None
+
+    response = api_client.get(response.data["next"])
+    second_page = response.data["results"]
+    assert len(second_page) == 5
+    assert response.data["next"] is None
+
+    slugs = [b["slug"] for b in first_page + second_page]
+    assert len(set(slugs)) == 15
+    assert set(slugs) == {b.slug for b in boards}
+
+
+def test_boards_cursor_pagination_follows_ordering_filter(
+    api_client_factory, organization
+):
+    BoardFactory.create_batch(3, organization=organization)
+    api_client = api_client_factory(organization.representative)
+
+    response = api_client.get(
+        reverse("api:board-list"), {"pagination": "cursor", "ordering": "created"}
+    )
+
+    created = [b["created"] for b in response.data["results"]]
+    assert created == sorted(created)
+
+
+def test_boards_cursor_pagination_rejects_other_ordering(
+    api_client_factory, organization
+):
+    BoardFactory.create_batch(3, organization=organization)
+    api_client = api_client_factory(organization.representative)
+
+    response = api_client.get(
+        reverse("api:board-list"), {"pagination": "cursor", "ordering": "title"}
+    )
+
+    assert response.status_code == 400
+    assert "ordering" in response.data
+
+
+def test_boards_sparse_fieldsets(api_client_factory, organization):
+    BoardFactory.create_batch(3, organization=organization)
+    api_client = api_client_factory(organization.representative)
+
+    response = api_client.get(reverse("api:board-list"), {"fields": "slug,title"})
+    assert [set(b) for b in response.data["results"]] == [{"slug", "title"}] * 3
+
+    response = api_client.get(
+        reverse("api:board-list"), {"omit": "description,created,modified"}
+    )
+    assert set(response.data["results"][0]) == {
+        "slug",
+        "organization",
+        "title",
+        "public",
+    }
+
+
+def test_boards_sparse_fieldsets_select_only_requested_columns(
+    api_client_factory, organization, django_assert_max_num_queries
+):
+    BoardFactory.create_batch(3, organization=organization)
+    api_client = api_client_factory(organization.representative)
+
+    with django_assert_max_num_queries(10) as queries:
+        response = api_client.get(
+            reverse("api:board-list"),
+            {"fields": "slug,organization", "pagination": "cursor"},
+        )
+
+    assert response.status_code == 200
+    assert response.data["results"][0]["organization"] == organization.slug
+    select = next(q["sql"] for q in queries.captured_queries if "LIMIT" in q["sql"])
+    assert '"boards_board"."description"' not in select
+    assert '"organizations_organization"."slug"' in select
+
+
+# Test searching
+
+
+def test_search_boards_by_title_word_prefix(api_client_factory, organization):
+    BoardFactory(organization=organization, title="Quarterly roadmap")
+    BoardFactory(organization=organization, title="Hiring pipeline")
+    api_client = api_client_factory(organization.representative)
+
+    response = api_client.get(reverse("api:board-list"), {"search": "roadm"})
+
+    assert response.data["count"] == 1
+    assert response.data["results"][0]["title"] == "Quarterly roadmap"
+    assert "rank" in response.data["results"][0]
+
+
+def test_search_boards_highlights_description(api_client_factory, organization):
+    BoardFactory(
+        organization=organization, title="Plan", description="Launch the new website"
+    )
+    api_client = api_client_factory(organization.representative)
+
+    response = api_client.get(reverse("api:board-list"), {"search": "website"})
+
+    assert "<b>website</b>" in response.data["results"][0]["headline"]
+
+
+def test_search_boards_with_sparse_fieldsets(api_client_factory, organization):
+    BoardFactory(organization=organization, title="Quarterly roadmap")
+    api_client = api_client_factory(organization.representative)
+    url = reverse("api:board-list")
+
+    response = api_client.get(url, {"search": "roadmap", "fields": "slug,title"})
+    assert response.status_code == 200
+    assert set(response.data["results"][0]) == {"slug", "title"}
+
+    response = api_client.get(url, {"search": "roadmap", "omit": "rank,headline"})
+    assert response.status_code == 200
+    assert "headline" not in response.data["results"][0]
+
+
+def test_search_boards_ignores_cursor_pagination(api_client_factory, organization):
+    BoardFactory(organization=organization, title="Roadmap", description="Plan")
+    BoardFactory(organization=organization, title="Plan", description="Roadmap")
+    api_client = api_client_factory(organization.representative)
+
+    response = api_client.get(
+        reverse("api:board-list"), {"search": "roadmap", "pagination": "cursor"}
+    )
+
+    # Ordered by relevance (title match first), page number pagination
+    assert response.data["count"] == 2
+    assert [b["title"] for b in response.data["results"]] == ["Roadmap", "Plan"]
+
+
+# Test suggest
+
+
+def test_suggest_visible_board_titles_by_prefix(
+    api_client_factory, organization, member
+):
+    BoardFactory(organization=organization, title="Roadmap 2022")
+    BoardFactory(organization=organization, title="Hiring")
+    BoardFactory(organization=member.organization, title="Roadmap other", public=False)
+    api_client = api_client_factory(organization.representative)
+
+    response = api_client.get(reverse("api:board-suggest"), {"q": "road"})
+
+    assert response.status_code == 200
+    assert [board["title"] for board in response.data] == ["Roadmap 2022"]
+    assert set(response.data[0].keys()) == {"slug", "title"}
+
+
+def test_suggest_results_are_capped(api_client_factory, organization):
+    BoardFactory.create_batch(15, organization=organization, title="Sprint")
+    api_client = api_client_factory(organization.representative)
+
+    response = api_client.get(reverse("api:board-suggest"), {"q": "spr"})
+
+    assert len(response.data) == 10
+
+
+# Test lists and cards
+
+
+def test_create_lists_are_appended(api_client_factory, board):
+    api_client = api_client_factory(board.organization.representative)
+    url = reverse("api:list-list", kwargs={"slug": board.slug})
+
+    first = api_client.post(url, {"title": "To do"})
+    second = api_client.post(url, {"title": "Done"})
+
+    assert first.status_code == second.status_code == 201
+    assert first.data["rank"] < second.data["rank"]
+
+
+def test_member_without_permission_can_not_create_list(
+    api_client_factory, organization, member
+):
+    board = BoardFactory(organization=organization, public=True)
+    api_client = api_client_factory(member.user)
+
+    response = api_client.post(
+        reverse("api:list-list", kwargs={"slug": board.slug}), {"title": "To do"}
+    )
+
+    assert response.status_code == 403
+
+
+def test_move_card_updates_only_card_row(api_client_factory, board):
+    board_list = ListFactory(board=board)
+    cards = CardFactory.create_batch(50, list=board_list)
+    api_client = api_client_factory(board.organization.representative)
+    url = reverse("api:card-move", kwargs={"slug": board.slug, "pk": cards[-1].pk})
+
+    response = api_client.post(url, {"previous": cards[0].pk}, format="json")
+
+    assert response.status_code == 200
+    moved = list(board_list.cards.values_list("pk", flat=True))
+    assert moved == [cards[0].pk, cards[-1].pk] + [card.pk for card in cards[1:-1]]
+    siblings = board_list.cards.exclude(pk=cards[-1].pk)
+    assert set(siblings.values_list("rank", flat=True)) == {
+        card.rank for card in cards[:-1]
+    }
+
+
+def test_move_card_to_other_list(api_client_factory, board):
+    source = ListFactory(board=board)
+    target = ListFactory(board=board)
+    card = CardFactory(list=source)
+    api_client = api_client_factory(board.organization.representative)
+    url = reverse("api:card-move", kwargs={"slug": board.slug, "pk": card.pk})
+
+    response = api_client.post(
+        url, {"previous": None, "list": target.pk}, format="json"
+    )
+
+    assert response.status_code == 200
+    assert list(target.cards.all()) == [card]
+
+
+# Test export
+
+
+def test_export_ndjson_streams_visible_boards(api_client_factory, member):
+    organization = member.organization
+    BoardFactory.create_batch(3, organization=organization, public=True)
+    BoardFactory(organization=organization, public=False)
+    BoardFactory.create_batch(2, public=True)  # other organization
+    api_client = api_client_factory(member.user)
+
+    response = api_client.get(
+        reverse("api:board-export", kwargs={"fmt": "ndjson"}),
+        {"organization": organization.slug},
+    )
+
+    assert response.status_code == 200
+    assert response.streaming
+    lines = b"".join(response.streaming_content).decode().splitlines()
+    boards = [json.loads(line) for line in lines]
+    assert len(boards) == 3
+    assert {board["organization"] for board in boards} == {organization.slug}
+
+
+def test_export_csv_has_header(api_client_factory, board):
+    api_client = api_client_factory(board.organization.representative)
+
+    response = api_client.get(
+        reverse("api:board-export", kwargs={"fmt": "csv"}),
+        {"organization": board.organization.slug},
+    )
+
+    content = b"".join(response.streaming_content).decode()
+    rows = list(csv.reader(io.StringIO(content)))
+    assert rows[0][:3] == ["slug", "organization", "title"]
+    assert rows[1][0] == board.slug
+
+
+def test_export_requires_organization(api_client_factory, board):
+    api_client = api_client_factory(board.organization.representative)
+
+    response = api_client.get(reverse("api:board-export", kwargs={"fmt": "csv"}))
+
+    assert response.status_code == 400
@@ -0,0 +1,72 @@
+"""
+Check bulk create / update / delete of boards.
+"""
+import pytest
+from django.urls import reverse
+
+from demanage.boards.models import Board, BoardVisibility
+
+from .factories import BoardFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_bulk_create_boards_reports_per_item_results(
+    api_client_factory, organization
+):
+    api_client = api_client_factory(organization.representative)
+    items = [
+        {"organization": organization.slug, "title": f"Board {i}"} for i in range(50)
+    ]
+    items.append({"organization": "unknown", "title": "Invalid"})
+
+    response = api_client.post(reverse("api:board-bulk"), items, format="json")
+
+    assert response.status_code == 207
+    assert [r["status"] for r in response.data] == [201] * 50 + [400]
+    assert Board.objects.filter(organization=organization).count() == 50
+    slugs = {r["data"]["slug"] for r in response.data[:50]}
+    assert len(slugs) == 50
+    # Board signals are not sent by bulk_create
+    assert BoardVisibility.objects.filter(
+        user=organization.representative, board__slug__in=slugs
+    ).count() == 50
+
+
+def test_bulk_update_boards(api_client_factory, organization, member):
+    boards = BoardFactory.create_batch(3, organization=organization, public=True)
+    other = BoardFactory(organization=member.organization)
+    api_client = api_client_factory(organization.representative)
+    items = [{"slug": board.slug, "description": "Bulk"} for board in boards]
+    items.append({"slug": other.slug, "description": "Bulk"})
+
+    response = api_client.patch(reverse("api:board-bulk"), items, format="json")
+
+    assert [r["status"] for r in response.data] == [200, 200, 200, 404]
+    assert set(
+        Board.objects.filter(pk__in=[b.pk for b in boards]).values_list(
+            "description", flat=True
+        )
+    ) == {"Bulk"}
+
+
+def test_bulk_delete_boards(api_client_factory, organization):
+    boards = BoardFactory.create_batch(3, organization=organization)
+    api_client = api_client_factory(organization.representative)
+
+    response = api_client.delete(
+        reverse("api:board-bulk"), [b.slug for b in boards] + ["missing"], format="json"
+    )
+
+    assert [r["status"] for r in response.data] == [204, 204, 204, 404]
+    assert not Board.objects.filter(organization=organization).exists()
+
+
+def test_bulk_rejects_too_many_items(api_client_factory, organization):
+    api_client = api_client_factory(organization.representative)
+
+    response = api_client.post(
+        reverse("api:board-bulk"), [{}] * 1001, format="json"
+    )
+
+    assert response.status_code == 400
@@ -0,0 +1,54 @@
+"""
+Check board responses are cached per user and invalidated by writes.
+"""
+import pytest
+from django.urls import reverse
+
+from demanage.members.tests.factories import MemberFactory
+
+from .factories import BoardFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_second_list_request_is_cache_hit(api_client_factory, organization):
+    BoardFactory(organization=organization)
+    api_client = api_client_factory(organization.representative)
+
+    first = api_client.get(reverse("api:board-list"))
+    second = api_client.get(reverse("api:board-list"))
+
+    assert first["X-Cache"] == "MISS"
+    assert second["X-Cache"] == "HIT"
+    assert first.data == second.data
+
+
+def test_board_create_invalidates_list(api_client_factory, organization):
+    api_client = api_client_factory(organization.representative)
+    assert api_client.get(reverse("api:board-list")).data["count"] == 0
+
+    BoardFactory(organization=organization)
+
+    response = api_client.get(reverse("api:board-list"))
+    assert response["X-Cache"] == "MISS"
+    assert response.data["count"] == 1
+
+
+def test_member_join_invalidates_list(api_client_factory, organization, user):
+    BoardFactory(organization=organization, public=True)
+    api_client = api_client_factory(user)
+    assert api_client.get(reverse("api:board-list")).data["count"] == 0
+
+    MemberFactory(user=user, organization=organization)
+
+    assert api_client.get(reverse("api:board-list")).data["count"] == 1
+
+
+def test_cache_can_be_disabled(settings, api_client_factory, organization):
+    settings.BOARDS_RESPONSE_CACHE_ENABLED = False
+    api_client = api_client_factory(organization.representative)
+
+    api_client.get(reverse("api:board-list"))
+    response = api_client.get(reverse("api:board-list"))
+
+    assert not response.has_header("X-Cache")
@@ -0,0 +1,115 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from guardian.shortcuts import assign_perm
+
+from demanage.members.tests.factories import MemberFactory
+from demanage.organizations.tests.factories import OrganizationFactory
+
+from ..clone import copy_content, create_board
+from ..models import Board, Card
+from .factories import BoardFactory, CardFactory, ListFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def fill(board, lists=2, cards=3):
+    for _ in range(lists):
+        CardFactory.create_batch(cards, list=ListFactory(board=board))
+
+
+def clone_url(board) -> str:
+    return reverse("api:board-clone", kwargs={"slug": board.slug})
+
+
+def test_clone_copies_lists_and_cards(api_client_factory, board):
+    fill(board)
+    api_client = api_client_factory(board.organization.representative)
+
+    response = api_client.post(
+        clone_url(board),
+        {"organization": board.organization.slug, "title": "From template"},
+    )
+
+    assert response.status_code == 201
+    copy = Board.objects.get(slug=response.data["slug"])
+    assert copy.title == "From template"
+    assert list(copy.lists.values_list("title", "rank")) == list(
+        board.lists.values_list("title", "rank")
+    )
+    assert list(
+        Card.objects.filter(list__board=copy).values_list("title", "rank")
+    ) == list(Card.objects.filter(list__board=board).values_list("title", "rank"))
+
+
+def test_clone_queries_do_not_depend_on_board_size(board):
+    small = BoardFactory(organization=board.organization)
+    fill(small, lists=1, cards=1)
+    fill(board, lists=5, cards=20)
+
+    small_copy = create_board(small, small.organization, "Small", None)
+    with CaptureQueriesContext(connection) as small_queries:
+        copy_content(small.pk, small_copy.pk)
+    large_copy = create_board(board, board.organization, "Large", None)
+    with CaptureQueriesContext(connection) as large_queries:
+        copy_content(board.pk, large_copy.pk)
+
+    assert len(large_queries) == len(small_queries)
+    assert Card.objects.filter(list__board=large_copy).count() == 100
+
+
+def test_clone_copies_view_grants(api_client_factory, board):
+    member = MemberFactory(organization=board.organization)
+    assign_perm("view_board", member.user, board)
+    api_client = api_client_factory(board.organization.representative)
+
+    response = api_client.post(
+        clone_url(board),
+        {"organization": board.organization.slug, "permissions": True},
+    )
+
+    copy = Board.objects.get(slug=response.data["slug"])
+    assert member.user.has_perm("boards.view_board", copy)
+    assert copy.visibility.filter(user=member.user).exists()
+
+
+def test_clone_copies_grants_of_target_organization_people_only(board):
+    outsider = MemberFactory(organization=board.organization)
+    assign_perm("view_board", outsider.user, board)
+    organization = OrganizationFactory(
+        representative=board.organization.representative
+    )
+    member = MemberFactory(organization=organization)
+    assign_perm("view_board", member.user, board)
+
+    copy = create_board(board, organization, "Copy", public=False)
+    copy_content(board.pk, copy.pk, permissions=True)
+
+    assert member.user.has_perm("boards.view_board", copy)
+    assert not outsider.user.has_perm("boards.view_board", copy)
+
+
+def test_clone_large_board_in_background(settings, api_client_factory, board, mocker):
+    settings.BOARDS_CLONE_ASYNC_CARDS = 2
+    fill(board)
+    on_commit = mocker.patch("demanage.boards.views.transaction.on_commit")
+    api_client = api_client_factory(board.organization.representative)
+
+    response = api_client.post(
+        clone_url(board), {"organization": board.organization.slug}
+    )
+
+    assert response.status_code == 202
+    assert on_commit.called
+    assert not Card.objects.filter(list__board__slug=response.data["slug"]).exists()
+
+
+def test_clone_to_other_organization_is_invalid(api_client_factory, board):
+    api_client = api_client_factory(board.organization.representative)
+
+    response = api_client.post(
+        clone_url(board), {"organization": OrganizationFactory().slug}
+    )
+
+    assert response.status_code == 400
@@ -0,0 +1,88 @@
+"""
+Check conditional GET (ETag / Last-Modified) on board endpoints.
+"""
+import pytest
+from django.urls import reverse
+
+from .factories import BoardFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_list_not_modified_with_matching_etag(api_client_factory, organization):
+    BoardFactory(organization=organization)
+    api_client = api_client_factory(organization.representative)
+
+    response = api_client.get(reverse("api:board-list"))
+    assert response.status_code == 200
+    assert not response.has_header("Last-Modified")
+
+    response = api_client.get(
+        reverse("api:board-list"), HTTP_IF_NONE_MATCH=response["ETag"]
+    )
+    assert response.status_code == 304
+
+
+def test_list_etag_changes_after_board_deleted(api_client_factory, organization):
+    board, _ = BoardFactory.create_batch(2, organization=organization)
+    api_client = api_client_factory(organization.representative)
+    etag = api_client.get(reverse("api:board-list"))["ETag"]
+
+    board.delete()
+
+    response = api_client.get(reverse("api:board-list"), HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+
+
+def test_list_ignores_if_modified_since(api_client_factory, organization):
+    board, _ = BoardFactory.create_batch(2, organization=organization)
+    api_client = api_client_factory(organization.representative)
+    date = api_client.get(
+        reverse("api:board-detail", kwargs={"slug": board.slug})
+    )["Last-Modified"]
+
+    board.delete()
+
+    response = api_client.get(reverse("api:board-list"), HTTP_IF_MODIFIED_SINCE=date)
+    assert response.status_code == 200
+    assert len(response.data["results"]) == 1
+
+
+def test_detail_not_modified_since_last_modified(api_client_factory, board):
+    api_client = api_client_factory(board.organization.representative)
+    url = reverse("api:board-detail", kwargs={"slug": board.slug})
+
+    response = api_client.get(url)
+    response = api_client.get(url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"])
+
+    assert response.status_code == 304
+
+
+def test_detail_modified_after_update(api_client_factory, board):
+    api_client = api_client_factory(board.organization.representative)
+    url = reverse("api:board-detail", kwargs={"slug": board.slug})
+    etag = api_client.get(url)["ETag"]
+
+    api_client.patch(url, {"description": "Changed"})
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response.data["description"] == "Changed"
+
+
+def test_etags_change_after_organization_renamed(api_client_factory, board):
+    api_client = api_client_factory(board.organization.representative)
+    list_url = reverse("api:board-list")
+    detail_url = reverse("api:board-detail", kwargs={"slug": board.slug})
+    list_etag = api_client.get(list_url)["ETag"]
+    detail_etag = api_client.get(detail_url)["ETag"]
+
+    board.organization.slug = "renamed"
+    board.organization.save()
+
+    response = api_client.get(list_url, HTTP_IF_NONE_MATCH=list_etag)
+    assert response.status_code == 200
+    response = api_client.get(detail_url, HTTP_IF_NONE_MATCH=detail_etag)
+    assert response.status_code == 200
+    assert response.data["organization"] == "renamed"
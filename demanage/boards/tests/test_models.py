@@ -26,4 +26,16 @@ def test_fields_exist():
         "created",
         "modified",
         "organization",
+        "visibility",
+        "search_vector",
+        "lists",
     } == set(board_fields)
+
+
+def test_generate_slugs_for_batch_are_unique():
+    boards = [Board(title="Same title") for _ in range(100)]
+    Board.generate_slugs(boards)
+
+    slugs = {board.slug for board in boards}
+    assert len(slugs) == 100
+    assert all(slug.startswith("same-title-") for slug in slugs)
@@ -0,0 +1,41 @@
+import random
+
+import pytest
+
+from demanage.boards.ranks import needs_rebalance, rank_between, spread_ranks
+
+
+def test_rank_between_bounds():
+    first = rank_between(None, None)
+    assert rank_between(None, first) < first < rank_between(first, None)
+
+
+def test_rank_between_is_strictly_between():
+    assert "a" < rank_between("a", "b") < "b"
+    assert "a" < rank_between("a", "a1") < "a1"
+    assert "az" < rank_between("az", "b") < "b"
+
+
+def test_rank_between_requires_order():
+    with pytest.raises(ValueError):
+        rank_between("b", "a")
+
+
+def test_random_inserts_keep_order():
+    ranks = [rank_between(None, None)]
+    for _ in range(500):
+        index = random.randint(0, len(ranks))
+        before = ranks[index - 1] if index > 0 else None
+        after = ranks[index] if index < len(ranks) else None
+        ranks.insert(index, rank_between(before, after))
+
+    assert ranks == sorted(ranks)
+    assert len(set(ranks)) == len(ranks)
+    assert all(not rank.endswith("0") for rank in ranks)
+
+
+def test_spread_ranks_are_short_and_ordered():
+    ranks = spread_ranks(1000)
+    assert ranks == sorted(ranks)
+    assert len(set(ranks)) == 1000
+    assert not any(needs_rebalance(rank) for rank in ranks)
@@ -0,0 +1,71 @@
+import pytest
+from django.urls import reverse
+
+from demanage.boards import roles
+from demanage.boards.backends import BoardRoleBackend
+from demanage.boards.models import BoardRole, BoardVisibility
+from demanage.users.models import User
+
+from .factories import BoardFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_role_permissions_are_resolved_from_mask():
+    assert roles.get_permissions("viewer") == ["view_board"]
+    assert roles.get_permissions("editor") == ["view_board", "add_list", "add_card"]
+    assert roles.has_permission("admin", "manage_board")
+    assert not roles.has_permission("editor", "change_board")
+    assert not roles.has_permission(None, "view_board")
+
+
+def test_role_permissions_are_checked_with_one_query(
+    member, django_assert_num_queries
+):
+    board = BoardFactory(organization=member.organization, public=False)
+    BoardRole.objects.create(user=member.user, board=board, role="editor")
+    user = User.objects.get(pk=member.user.pk)
+    backend = BoardRoleBackend()
+
+    with django_assert_num_queries(1):
+        assert [
+            backend.has_perm(user, f"boards.{codename}", board)
+            for codename in roles.PERMISSIONS
+        ] == [True, True, True, False, False]
+
+
+def test_role_grants_board_visibility(member):
+    board = BoardFactory(organization=member.organization, public=False)
+
+    role = BoardRole.objects.create(user=member.user, board=board, role="viewer")
+    assert BoardVisibility.objects.filter(user=member.user, board=board).exists()
+
+    role.delete()
+    assert not BoardVisibility.objects.filter(user=member.user, board=board).exists()
+
+
+def test_editor_can_create_list(api_client_factory, member):
+    board = BoardFactory(organization=member.organization, public=False)
+    BoardRole.objects.create(user=member.user, board=board, role="editor")
+    api_client = api_client_factory(member.user)
+
+    response = api_client.post(
+        reverse("api:list-list", kwargs={"slug": board.slug}), {"title": "To do"}
+    )
+
+    assert response.status_code == 201
+
+
+def test_admin_can_partially_update_board(api_client_factory, member):
+    board = BoardFactory(organization=member.organization, public=False)
+    BoardRole.objects.create(user=member.user, board=board, role="admin")
+    api_client = api_client_factory(member.user)
+    url = reverse("api:board-detail", kwargs={"slug": board.slug})
+
+    response = api_client.patch(url, {"title": "Renamed"})
+    assert response.status_code == 200
+
+    response = api_client.put(
+        url, {"title": "Moved", "organization": member.organization.slug}
+    )
+    assert response.status_code == 403
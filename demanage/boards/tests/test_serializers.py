@@ -1,6 +1,11 @@
 import pytest
+from rest_framework.renderers import JSONRenderer
 
-from ..serializers import BoardSerializer
+from demanage.fast_serializers import compile_serializer
+
+from ..models import Board
+from ..serializers import BoardSearchSerializer, BoardSerializer
+from .factories import BoardFactory
 
 pytestmark = pytest.mark.django_db
 
@@ -80,3 +85,23 @@ def test_can_not_create_board_in_other_organization(organization, rq, user, boar
     assert (
         not serializer.is_valid()
     ), "Should not be valid because other organization are not found (not in choice)."
+
+
+def test_compiled_serializer_output_is_identical(organization):
+    BoardFactory.create_batch(3, organization=organization)
+    BoardFactory(organization=organization, description="")
+    boards = Board.objects.order_by("id")
+
+    compiled = compile_serializer(BoardSerializer())
+    rows = boards.values(*compiled.paths)
+
+    renderer = JSONRenderer()
+    expected = renderer.render(BoardSerializer(boards, many=True).data)
+    assert renderer.render(compiled.serialize(rows)) == expected
+    assert renderer.render(
+        [compiled.instance_to_representation(board) for board in boards]
+    ) == expected
+
+
+def test_search_serializer_is_not_compiled():
+    assert compile_serializer(BoardSearchSerializer()) is None
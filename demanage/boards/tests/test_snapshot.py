@@ -0,0 +1,94 @@
+import json
+
+import pytest
+from django.urls import reverse
+
+from .factories import BoardFactory, CardFactory, ListFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def get_snapshot(api_client, board) -> dict:
+    url = reverse("api:board-snapshot", kwargs={"slug": board.slug})
+    response = api_client.get(url)
+    assert response.status_code == 200
+    return json.loads(response.content)
+
+
+def test_snapshot_contains_ordered_lists_and_cards(api_client_factory, board):
+    second = ListFactory(board=board, rank="s")
+    first = ListFactory(board=board, rank="i")
+    cards = [CardFactory(list=first, rank=rank) for rank in ["z", "a", "m"]]
+    api_client = api_client_factory(board.organization.representative)
+
+    document = get_snapshot(api_client, board)
+
+    assert document["board"]["slug"] == board.slug
+    assert [item["id"] for item in document["lists"]] == [first.pk, second.pk]
+    assert [card["id"] for card in document["lists"][0]["cards"]] == [
+        cards[1].pk,
+        cards[2].pk,
+        cards[0].pk,
+    ]
+    assert "add_card" in document["permissions"]
+
+
+def test_snapshot_is_invalidated_on_organization_change(api_client_factory, board):
+    api_client = api_client_factory(board.organization.representative)
+    get_snapshot(api_client, board)  # cache document
+
+    board.organization.slug = "renamed"
+    board.organization.save()
+
+    assert get_snapshot(api_client, board)["board"]["organization"] == "renamed"
+
+
+def test_snapshot_is_invalidated_on_bulk_update(api_client_factory, board):
+    api_client = api_client_factory(board.organization.representative)
+    get_snapshot(api_client, board)  # cache document
+
+    response = api_client.patch(
+        reverse("api:board-bulk"),
+        [{"slug": board.slug, "title": "Renamed", "public": False}],
+        format="json",
+    )
+    assert response.data[0]["status"] == 200
+
+    document = get_snapshot(api_client, board)
+    assert document["board"]["title"] == "Renamed"
+    assert document["board"]["public"] is False
+
+
+def test_snapshot_permissions_of_member(api_client_factory, organization, member):
+    board = BoardFactory(organization=organization, public=True)
+    api_client = api_client_factory(member.user)
+
+    document = get_snapshot(api_client, board)
+
+    assert document["permissions"] == ["view_board"]
+
+
+def test_snapshot_queries_do_not_depend_on_board_size(
+    api_client_factory, board, django_assert_max_num_queries
+):
+    for board_list in ListFactory.create_batch(5, board=board):
+        CardFactory.create_batch(20, list=board_list)
+    api_client = api_client_factory(board.organization.representative)
+
+    with django_assert_max_num_queries(8):
+        get_snapshot(api_client, board)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_snapshot_is_patched_on_card_change(api_client_factory, board):
+    board_list = ListFactory(board=board)
+    card = CardFactory(list=board_list, title="Old")
+    api_client = api_client_factory(board.organization.representative)
+    get_snapshot(api_client, board)  # cache document
+
+    card.title = "New"
+    card.save()
+    CardFactory(list=board_list, rank="zz", title="Added")
+
+    cards = get_snapshot(api_client, board)["lists"][0]["cards"]
+    assert [card["title"] for card in cards] == ["New", "Added"]
@@ -0,0 +1,110 @@
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from demanage.users.tests.factories import UserFactory
+
+from ..models import BoardTombstone
+from ..sync import format_watermark, purge_tombstones
+from .factories import BoardFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def get_changes(api_client, since):
+    return api_client.get(reverse("api:board-list"), {"since": format_watermark(since)})
+
+
+def test_sync_returns_boards_modified_since_watermark(
+    settings, api_client_factory, organization
+):
+    settings.BOARDS_SYNC_OVERLAP = 0
+    board, _ = BoardFactory.create_batch(2, organization=organization)
+    watermark = timezone.now()
+    board.description = "Changed"
+    board.save()
+    api_client = api_client_factory(organization.representative)
+
+    response = get_changes(api_client, watermark)
+
+    assert response.status_code == 200
+    assert [b["slug"] for b in response.data["results"]] == [board.slug]
+    assert response.data["tombstones"] == []
+
+    response = api_client.get(
+        reverse("api:board-list"), {"since": response.data["watermark"]}
+    )
+    assert response.data["results"] == []
+
+
+def test_sync_returns_tombstones_of_deleted_boards(api_client_factory, board):
+    watermark = timezone.now()
+    slug = board.slug
+    board.delete()
+    api_client = api_client_factory(board.organization.representative)
+
+    response = get_changes(api_client, watermark)
+
+    assert response.data["tombstones"] == [{"slug": slug, "reason": "deleted"}]
+
+
+def test_sync_returns_tombstones_of_deleted_boards_to_superuser(
+    api_client_factory, board
+):
+    superuser = UserFactory(is_superuser=True)
+    watermark = timezone.now()
+    slug = board.slug
+    board.delete()
+    api_client = api_client_factory(superuser)
+
+    response = get_changes(api_client, watermark)
+
+    assert response.data["tombstones"] == [{"slug": slug, "reason": "deleted"}]
+
+
+def test_sync_returns_tombstones_of_hidden_boards(api_client_factory, member):
+    board = BoardFactory(organization=member.organization, public=True)
+    watermark = timezone.now()
+    board.public = False
+    board.save()
+    api_client = api_client_factory(member.user)
+
+    response = get_changes(api_client, watermark)
+
+    assert response.data["results"] == []
+    assert response.data["tombstones"] == [{"slug": board.slug, "reason": "revoked"}]
+
+    # Visible again
+    board.public = True
+    board.save()
+    response = get_changes(api_client, watermark)
+    assert [b["slug"] for b in response.data["results"]] == [board.slug]
+    assert response.data["tombstones"] == []
+
+
+def test_sync_expired_watermark_is_gone(settings, api_client_factory, board):
+    settings.BOARDS_TOMBSTONE_RETENTION_DAYS = 1
+    api_client = api_client_factory(board.organization.representative)
+
+    response = get_changes(api_client, timezone.now() - timedelta(days=2))
+
+    assert response.status_code == 410
+
+
+def test_sync_invalid_watermark(api_client_factory, board):
+    api_client = api_client_factory(board.organization.representative)
+
+    response = api_client.get(reverse("api:board-list"), {"since": "yesterday"})
+
+    assert response.status_code == 400
+
+
+def test_purge_tombstones_after_retention(settings, board):
+    settings.BOARDS_TOMBSTONE_RETENTION_DAYS = 1
+    board.delete()
+    BoardTombstone.objects.update(created=timezone.now() - timedelta(days=2))
+
+    assert purge_tombstones() == 1
+    assert not BoardTombstone.objects.exists()
@@ -0,0 +1,37 @@
+import pytest
+
+from demanage.boards import moves
+from demanage.boards.tasks import rebalance_cards
+
+from .factories import CardFactory, ListFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_rebalance_cards_keeps_order(settings):
+    settings.CELERY_TASK_ALWAYS_EAGER = True
+    board_list = ListFactory()
+    cards = [
+        CardFactory(list=board_list, rank="i" + "0" * 30 + str(n)) for n in range(1, 6)
+    ]
+
+    task_result = rebalance_cards.delay(board_list.pk)
+
+    assert task_result.result == 5
+    assert list(board_list.cards.values_list("pk", flat=True)) == [
+        card.pk for card in cards
+    ]
+    ranks = board_list.cards.values_list("rank", flat=True)
+    assert all(len(rank) <= 2 for rank in ranks)
+
+
+def test_rebalance_is_scheduled_after_commit(mocker):
+    card = CardFactory(rank="i" + "0" * 30 + "1")
+    delay = mocker.patch("demanage.boards.moves.rebalance_cards.delay")
+    on_commit = mocker.patch("demanage.boards.moves.transaction.on_commit")
+
+    moves.schedule_rebalance(card)
+
+    delay.assert_not_called()
+    on_commit.call_args[0][0]()
+    delay.assert_called_once_with(card.list_id)
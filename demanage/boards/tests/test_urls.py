@@ -24,3 +24,45 @@ def test_board_permission_detail_url():
         )
         == "/api/boards/board/permissions/view_board/nezort11/"
     )
+
+
+def test_board_suggest_url():
+    assert reverse("api:board-suggest") == "/api/boards/suggest/"
+
+
+def test_board_bulk_url():
+    assert reverse("api:board-bulk") == "/api/boards/bulk/"
+
+
+def test_list_move_url():
+    assert (
+        reverse("api:list-move", kwargs={"slug": "board", "pk": 1})
+        == "/api/boards/board/lists/1/move/"
+    )
+
+
+def test_card_list_url():
+    assert (
+        reverse("api:card-list", kwargs={"slug": "board", "list_pk": 1})
+        == "/api/boards/board/lists/1/cards/"
+    )
+
+
+def test_board_snapshot_url():
+    assert (
+        reverse("api:board-snapshot", kwargs={"slug": "board"})
+        == "/api/boards/board/snapshot/"
+    )
+
+
+def test_board_export_url():
+    assert (
+        reverse("api:board-export", kwargs={"fmt": "csv"}) == "/api/boards/export/csv/"
+    )
+
+
+def test_board_clone_url():
+    assert (
+        reverse("api:board-clone", kwargs={"slug": "board"})
+        == "/api/boards/board/clone/"
+    )
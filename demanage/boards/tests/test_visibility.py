@@ -0,0 +1,82 @@
+"""
+Check that materialized board visibility follows the source tables.
+"""
+import pytest
+from django.core.management import call_command
+from guardian.shortcuts import assign_perm, remove_perm
+
+from demanage.boards import visibility
+from demanage.boards.models import Board, BoardUserObjectPermission, BoardVisibility
+
+from .factories import BoardFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def is_visible(user, board) -> bool:
+    return BoardVisibility.objects.filter(user=user, board=board).exists()
+
+
+def test_representative_can_view_created_board(board):
+    assert is_visible(board.organization.representative, board)
+
+
+def test_member_can_view_public_board(member):
+    board = BoardFactory(public=True, organization=member.organization)
+    assert is_visible(member.user, board)
+
+
+def test_member_can_not_view_private_board(member):
+    board = BoardFactory(public=False, organization=member.organization)
+    assert not is_visible(member.user, board)
+
+
+def test_member_loses_public_board_after_leaving(member):
+    board = BoardFactory(public=True, organization=member.organization)
+    member.delete()
+    assert not is_visible(member.user, board)
+
+
+def test_member_loses_board_made_private(member):
+    board = BoardFactory(public=True, organization=member.organization)
+    board.public = False
+    board.save()
+    assert not is_visible(member.user, board)
+
+
+def test_view_permission_is_materialized(member):
+    board = BoardFactory(public=False, organization=member.organization)
+    assign_perm("view_board", member.user, board)
+    assert is_visible(member.user, board)
+
+    remove_perm("view_board", member.user, board)
+    assert not is_visible(member.user, board)
+
+
+def test_view_permission_is_stored_with_board_foreign_key(member, mocker):
+    board = BoardFactory(public=False, organization=member.organization)
+    assign_perm("view_board", member.user, board)
+    assert BoardUserObjectPermission.objects.filter(
+        content_object=board, user=member.user
+    ).exists()
+
+    # Permissions are deleted in cascade without refreshing visibility
+    refresh = mocker.spy(visibility, "refresh")
+    board.delete()
+    assert not BoardUserObjectPermission.objects.exists()
+    refresh.assert_not_called()
+
+
+def test_refresh_repairs_drift(member):
+    board = BoardFactory(public=True, organization=member.organization)
+    BoardVisibility.objects.filter(board=board).delete()
+
+    added, removed = visibility.refresh(Board.objects.filter(pk=board.pk))
+
+    assert (member.user.pk, board.pk) in added
+    assert not removed
+    assert is_visible(member.user, board)
+
+
+def test_rebuild_command_check_passes_without_drift(board):
+    call_command("rebuild_board_visibility", "--check")
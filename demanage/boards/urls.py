@@ -1,8 +1,18 @@
 from django.urls import path
 
+from demanage.boards.views import (
+    card_detail_view,
+    card_list_view,
+    card_move_view,
+    list_detail_view,
+    list_list_view,
+    list_move_view,
+)
 from demanage.permissions.views import (
     board_permission_detail_view,
     board_permission_list_view,
+    board_role_detail_view,
+    board_role_list_view,
 )
 
 urlpatterns = [
@@ -11,9 +21,38 @@ urlpatterns = [
         board_permission_list_view,
         name="board-permission-list",
     ),
+    # Roles (before permission detail, "roles" is not a permission code)
+    path(
+        "boards/<slug:slug>/permissions/roles/",
+        board_role_list_view,
+        name="board-role-list",
+    ),
+    path(
+        "boards/<slug:slug>/permissions/roles/<str:username>/",
+        board_role_detail_view,
+        name="board-role-detail",
+    ),
     path(
         "boards/<slug:slug>/permissions/<str:code>/<str:username>/",
         board_permission_detail_view,
         name="board-permission-detail",
     ),
+    path("boards/<slug:slug>/lists/", list_list_view, name="list-list"),
+    path(
+        "boards/<slug:slug>/lists/<int:pk>/", list_detail_view, name="list-detail"
+    ),
+    path(
+        "boards/<slug:slug>/lists/<int:pk>/move/", list_move_view, name="list-move"
+    ),
+    path(
+        "boards/<slug:slug>/lists/<int:list_pk>/cards/",
+        card_list_view,
+        name="card-list",
+    ),
+    path(
+        "boards/<slug:slug>/cards/<int:pk>/", card_detail_view, name="card-detail"
+    ),
+    path(
+        "boards/<slug:slug>/cards/<int:pk>/move/", card_move_view, name="card-move"
+    ),
 ]
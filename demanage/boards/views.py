@@ -1,21 +1,52 @@
+from typing import Optional
+
+from django.conf import settings
+from django.db import transaction
 from django.db.models.query import QuerySet
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.translation import gettext_lazy as _
 from django_filters.rest_framework.backends import DjangoFilterBackend
-from guardian.shortcuts import get_objects_for_user
-from rest_framework import viewsets
+from rest_framework import status, viewsets
 from rest_framework.authentication import TokenAuthentication
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, ParseError, PermissionDenied
+from rest_framework.generics import get_object_or_404
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from demanage.activity.log import record
+from demanage.fast_serializers import CompiledSerializerMixin, compile_serializer
+from demanage.fieldsets import SparseFieldsetsViewMixin
+from demanage.pagination import CursorPaginationMixin
 
+from . import bulk, cache, conditional, exports, moves, sync
+from .clone import copy_content, create_board, is_large
 from .filters import BoardFilter
-from .models import Board
+from .models import Board, Card, List
 from .ordering_filters import BoardOrderingFilter
-from .pagination import BoardPagination
-from .permissions import BoardPermission
+from .pagination import BoardCursorPagination, BoardPagination
+from .permissions import BoardItemPermission, BoardPermission
 from .search_filters import BoardSearchFilter
-from .serializers import BoardSerializer
+from .serializers import (
+    BoardListSerializer,
+    BoardSearchSerializer,
+    BoardSerializer,
+    CardSerializer,
+    CloneSerializer,
+    MoveSerializer,
+)
+from .snapshot import get_response_content
+from .tasks import clone_board_content
 
-# from rest_framework.decorators import action
+SUGGEST_MAX_RESULTS = 10
 
 
-class BoardViewSet(viewsets.ModelViewSet):
+class BoardViewSet(
+    SparseFieldsetsViewMixin,
+    CompiledSerializerMixin,
+    CursorPaginationMixin,
+    viewsets.ModelViewSet,
+):
     """
     ViewSet for board.
     """
@@ -35,6 +66,7 @@ class BoardViewSet(viewsets.ModelViewSet):
 
     # Result correction
     pagination_class = BoardPagination
+    cursor_pagination_class = BoardCursorPagination
     filter_backends = [
         DjangoFilterBackend,
         BoardSearchFilter,
@@ -42,23 +74,258 @@ class BoardViewSet(viewsets.ModelViewSet):
     ]
     filterset_class = BoardFilter
 
+    # Selected besides serialized fields (conditional request validators)
+    sparse_required_fields = ["modified"]
+
     def get_queryset(self) -> QuerySet:
         """
         1. Return all boards in organizations where user is representative.
         2. Return public boards in organization where user is member.
         3. Return private boards in organization where user has permission to view them.
+
+        Rules are materialized in the board visibility table (see `visibility` module).
         """
         user = self.request.user
-        # Boards where user is representative
-        represented_boards = Board.objects.filter(organization__representative=user)
-        # Get all public board in organization that request user is member of
-        public_membered_boards = Board.objects.filter(
-            public=True, organization__members__user=user
+        if user.is_superuser:
+            return Board.objects.all()
+
+        return Board.objects.filter(visibility__user=user)
+
+    def perform_create(self, serializer: BoardSerializer) -> None:
+        board = serializer.save()
+        record("board.created", board.organization_id, board.pk, board.slug)
+
+    def perform_update(self, serializer: BoardSerializer) -> None:
+        board = serializer.save()
+        record(
+            "board.updated",
+            board.organization_id,
+            board.pk,
+            board.slug,
+            {"fields": sorted(serializer.validated_data)},
+        )
+
+    def perform_destroy(self, instance: Board) -> None:
+        record("board.deleted", instance.organization_id, instance.pk, instance.slug)
+        instance.delete()
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        if "since" in request.query_params:
+            return self.delta_sync(request)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        validators = conditional.list_validators(request, queryset)
+        not_modified = conditional.get_not_modified_response(request, validators)
+        if not_modified is not None:
+            return not_modified
+
+        build = super().list
+        response = cache.cached_response(
+            request, lambda: build(request, *args, **kwargs)
+        )
+        return conditional.set_validators(response, validators)
+
+    def retrieve(self, request: Request, *args, **kwargs) -> Response:
+        instance = self.get_object()
+        validators = conditional.detail_validators(request, instance)
+        not_modified = conditional.get_not_modified_response(request, validators)
+        if not_modified is not None:
+            return not_modified
+
+        response = cache.cached_response(
+            request, lambda: Response(self.serialize_instance(instance))
+        )
+        return conditional.set_validators(response, validators)
+
+    def delta_sync(self, request: Request) -> Response:
+        """
+        Boards changed and tombstones of boards deleted or hidden since
+        `?since=<watermark>` with the watermark of the next sync.
+
+        Responds with 410 when the watermark is older than tombstone retention
+        or there are too many changes (client has to fetch all boards).
+        """
+        watermark = sync.parse_watermark(request.query_params["since"])
+        if watermark is None:
+            raise ParseError("since query param must be ISO 8601 date and time!")
+        if sync.is_expired(watermark):
+            return Response(
+                {"detail": _("Watermark is expired, fetch all boards.")},
+                status=status.HTTP_410_GONE,
+            )
+
+        next_watermark = sync.new_watermark()  # before changes are read
+        limit = settings.BOARDS_SYNC_MAX_RESULTS
+        boards = sync.changed_boards(
+            self.filter_queryset(self.get_queryset()), request.user, watermark
+        )
+        # Not the search serializer (search headlines are added to list pages)
+        compiled = compile_serializer(
+            BoardSerializer(context=self.get_serializer_context())
+        )
+        results = compiled.serialize(boards.values(*compiled.paths)[: limit + 1])
+        if len(results) > limit:
+            return Response(
+                {"detail": _("Too many changes, fetch all boards.")},
+                status=status.HTTP_410_GONE,
+            )
+
+        tombstones = sync.get_tombstones(request.user, watermark).values(
+            "slug", "reason"
+        )
+        return Response(
+            {
+                "watermark": sync.format_watermark(next_watermark),
+                "results": results,
+                "tombstones": list(tombstones),
+            }
+        )
+
+    def is_searching(self) -> bool:
+        return (
+            self.action == "list"
+            and BoardSearchFilter().get_search_query(self.request) is not None
+        )
+
+    def get_serializer_class(self):
+        if self.is_searching():
+            return BoardSearchSerializer
+        return super().get_serializer_class()
+
+    def uses_cursor_pagination(self) -> bool:
+        # Search results are ordered by relevance (not by the keyset)
+        return not self.is_searching() and super().uses_cursor_pagination()
+
+    def get_compiled_serializer(self):
+        if self.is_searching():
+            return None  # headlines are added to the page of instances
+        return super().get_compiled_serializer()
+
+    def paginate_queryset(self, queryset):
+        page = super().paginate_queryset(queryset)
+        if page is not None and self.is_searching():
+            BoardSearchFilter().add_headlines(self.request, page)
+        return page
+
+    @action(detail=False, methods=["GET"], url_path="suggest", url_name="suggest")
+    def suggest(self, request: Request) -> Response:
+        """
+        Typeahead of visible board titles (`?q=` title prefix).
+
+        Prefix lookup is backed by trigram GIN index on `UPPER(title)`.
+        """
+        query = request.query_params.get("q", "").strip()[:50]
+        if not query:
+            return Response([])
+
+        boards = (
+            self.get_queryset()
+            .filter(title__istartswith=query)
+            .order_by("title")
+            .values("slug", "title")[:SUGGEST_MAX_RESULTS]
+        )
+        return Response(list(boards))
+
+    @action(
+        detail=False,
+        methods=["GET"],
+        url_path=r"export/(?P<fmt>ndjson|csv)",
+        url_name="export",
+    )
+    def export(self, request: Request, fmt: str) -> StreamingHttpResponse:
+        """
+        Stream all visible boards of the organization (`?organization=<slug>`)
+        as NDJSON or CSV.
+        """
+        slug = request.query_params.get("organization")
+        if not slug:
+            raise ParseError("organization query param is required!")
+
+        queryset = self.get_queryset().filter(organization__slug=slug)
+        return exports.export_response(queryset, fmt, f"{slug}-boards")
+
+    @action(detail=True, methods=["GET"], url_path="snapshot", url_name="snapshot")
+    def snapshot(self, request: Request, slug: str) -> HttpResponse:
+        """
+        Board with its lists and cards and user permissions on the board.
+
+        Document is precomputed (see `snapshot` module), fixed number of queries.
+        """
+        board = self.get_object()
+        content = get_response_content(request.user, board)
+        return HttpResponse(content, content_type="application/json")
+
+    @action(detail=True, methods=["POST"], url_path="clone", url_name="clone")
+    def clone(self, request: Request, slug: str) -> Response:
+        """
+        Copy the board with its lists and cards (and optionally `view_board`
+        grants) to organization where user is representative (e.g. from template).
+
+        Large boards are filled in background (202), small ones right away (201).
+        """
+        source = self.get_object()
+        serializer = CloneSerializer(
+            data=request.data, context=self.get_serializer_context()
+        )
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        permissions = data["permissions"]
+        if permissions and source.organization.representative_id != request.user.pk:
+            raise PermissionDenied(_("Only representative can copy board grants."))
+
+        title = data.get("title", source.title)
+        board = create_board(source, data["organization"], title, data["public"])
+        record(
+            "board.created",
+            board.organization_id,
+            board.pk,
+            board.slug,
+            {"source": source.slug},
         )
-        # Get all boards that user has permission to view (assume user is member of board's organization)
-        private_permitted_boards = get_objects_for_user(user, "boards.view_board")
 
-        return represented_boards | public_membered_boards | private_permitted_boards
+        if is_large(source):
+            transaction.on_commit(
+                lambda: clone_board_content.delay(source.pk, board.pk, permissions)
+            )
+            status_code = status.HTTP_202_ACCEPTED
+        else:
+            copy_content(source.pk, board.pk, permissions)
+            status_code = status.HTTP_201_CREATED
+
+        data = BoardSerializer(board, context=self.get_serializer_context()).data
+        return Response(data, status=status_code)
+
+    @action(
+        detail=False,
+        methods=["POST", "PATCH", "DELETE"],
+        url_path="bulk",
+        url_name="bulk",
+    )
+    def bulk(self, request: Request) -> Response:
+        """
+        Bulk create (POST), partially update (PATCH) or delete (DELETE) boards.
+
+        - POST: list of boards data
+        - PATCH: list of boards data with `slug` key
+        - DELETE: list of board slugs
+
+        Responds with per item results (multi-status).
+        """
+        items = request.data
+        if not isinstance(items, list):
+            raise ParseError("Expected a list of items.")
+        if len(items) > bulk.BULK_MAX_ITEMS:
+            raise ParseError(f"Expected at most {bulk.BULK_MAX_ITEMS} items.")
+
+        context = self.get_serializer_context()
+        if request.method == "POST":
+            results = bulk.create_boards(items, context)
+        elif request.method == "PATCH":
+            results = bulk.update_boards(items, self.get_queryset(), context)
+        else:
+            results = bulk.delete_boards(items, self.get_queryset(), context)
+
+        return Response(results, status=status.HTTP_207_MULTI_STATUS)
 
     # @action(["POST"], True, "assign/view", "assign_view")
     # def assign_view_permission(self):
@@ -71,3 +338,139 @@ class BoardViewSet(viewsets.ModelViewSet):
     # @action(["GET"], True, "users/view", "users_view")
     # def list_users_have_view_permission(self):
     #     pass
+
+
+class BoardItemViewSet(viewsets.ModelViewSet):
+    """
+    Base ViewSet for items (lists, cards) of the board ordered by rank.
+    """
+
+    # URLconf
+    lookup_field = "pk"
+    lookup_url_kwarg = "pk"
+
+    # Authentication and authorization
+    authentication_classes = [TokenAuthentication]
+    permission_classes = [BoardItemPermission]
+    item_permission = ""
+
+    # Fields saved by move besides rank
+    move_fields: list = []
+
+    def get_board(self) -> Board:
+        if not hasattr(self, "_board"):
+            user = self.request.user
+            boards = Board.objects.all()
+            if not user.is_superuser:
+                boards = boards.filter(visibility__user=user)
+            self._board = get_object_or_404(
+                boards.select_related("organization"), slug=self.kwargs["slug"]
+            )
+        return self._board
+
+    def move_item(self, item) -> Response:
+        """
+        Save new position of the placed item (single row update).
+        """
+        item.save(update_fields=["rank", *self.move_fields, "modified"])
+        moves.schedule_rebalance(item)
+        return Response(self.get_serializer(item).data)
+
+
+class ListViewSet(BoardItemViewSet):
+    """
+    ViewSet for lists of the board.
+    """
+
+    serializer_class = BoardListSerializer
+    item_permission = "add_list"
+
+    def get_queryset(self) -> QuerySet:
+        return List.objects.filter(board=self.get_board())
+
+    def perform_create(self, serializer: BoardListSerializer) -> None:
+        board = self.get_board()
+        serializer.save(
+            board=board, rank=moves.rank_last(List.objects.filter(board=board))
+        )
+
+    def move(self, request: Request, **kwargs) -> Response:
+        board_list = self.get_object()
+        serializer = MoveSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        previous = self.get_sibling(serializer.validated_data["previous"])
+        moves.place_list(board_list, previous)
+        return self.move_item(board_list)
+
+    def get_sibling(self, pk) -> Optional[List]:
+        if pk is None:
+            return None
+        try:
+            return self.get_queryset().get(pk=pk)
+        except List.DoesNotExist:
+            raise NotFound(_("Previous list is not found."))
+
+
+class CardViewSet(BoardItemViewSet):
+    """
+    ViewSet for cards of the board lists.
+    """
+
+    serializer_class = CardSerializer
+    item_permission = "add_card"
+    move_fields = ["list"]
+
+    def get_queryset(self) -> QuerySet:
+        queryset = Card.objects.filter(list__board=self.get_board()).select_related(
+            "list"
+        )
+        if "list_pk" in self.kwargs:
+            queryset = queryset.filter(list_id=self.kwargs["list_pk"])
+        return queryset
+
+    def get_list(self, pk) -> List:
+        try:
+            return List.objects.get(board=self.get_board(), pk=pk)
+        except List.DoesNotExist:
+            raise NotFound(_("List is not found."))
+
+    def perform_create(self, serializer: CardSerializer) -> None:
+        board_list = self.get_list(self.kwargs["list_pk"])
+        serializer.save(
+            list=board_list,
+            rank=moves.rank_last(Card.objects.filter(list=board_list)),
+        )
+
+    def move(self, request: Request, **kwargs) -> Response:
+        card = self.get_object()
+        serializer = MoveSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        list_pk = serializer.validated_data.get("list", card.list_id)
+        if list_pk != card.list_id:
+            card.list = self.get_list(list_pk)
+
+        previous = None
+        if serializer.validated_data["previous"] is not None:
+            try:
+                previous = Card.objects.get(
+                    list_id=card.list_id, pk=serializer.validated_data["previous"]
+                )
+            except Card.DoesNotExist:
+                raise NotFound(_("Previous card is not found."))
+
+        moves.place_card(card, previous)
+        return self.move_item(card)
+
+
+list_list_view = ListViewSet.as_view({"get": "list", "post": "create"})
+list_detail_view = ListViewSet.as_view(
+    {"get": "retrieve", "patch": "partial_update", "delete": "destroy"}
+)
+list_move_view = ListViewSet.as_view({"post": "move"})
+card_list_view = CardViewSet.as_view({"get": "list", "post": "create"})
+card_detail_view = CardViewSet.as_view(
+    {"get": "retrieve", "patch": "partial_update", "delete": "destroy"}
+)
+card_move_view = CardViewSet.as_view({"post": "move"})
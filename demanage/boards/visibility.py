@@ -0,0 +1,141 @@
+"""
+Materialized board visibility.
+
+User can view board when:
+
+1. user is representative of the board organization
+2. board is public and user is member of the board organization
+3. user has `boards.view_board` object permission on the board
+4. user has a role on the board (every role can view it)
+
+Visibility pairs `(user_id, board_id)` are stored in `BoardVisibility` so board
+listing is a single indexed join instead of the union of the rules above.
+"""
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from django.db.models.query import QuerySet
+
+from demanage.members.models import Member
+
+from . import sync
+from .models import (
+    Board,
+    BoardRole,
+    BoardTombstone,
+    BoardUserObjectPermission,
+    BoardVisibility,
+)
+
+Pair = Tuple[int, int]  # (user_id, board_id)
+
+
+def expected_pairs(
+    boards: QuerySet, user_ids: Optional[Iterable[int]] = None
+) -> Set[Pair]:
+    """
+    Compute visibility pairs for the boards (and users) from the source tables.
+    """
+    boards = boards.order_by()
+    user_ids = None if user_ids is None else list(user_ids)
+
+    represented = boards.values_list("organization__representative_id", "id")
+    public_boards = boards.filter(public=True).values_list("id", "organization_id")
+    members = Member.objects.filter(
+        organization__in=boards.values("organization_id")
+    ).values_list("user_id", "organization_id")
+    permitted = BoardUserObjectPermission.objects.filter(
+        permission__codename="view_board", content_object__in=boards.values("id")
+    ).values_list("user_id", "content_object_id")
+    with_role = BoardRole.objects.filter(board__in=boards.values("id")).values_list(
+        "user_id", "board_id"
+    )
+
+    if user_ids is not None:
+        represented = represented.filter(organization__representative_id__in=user_ids)
+        members = members.filter(user_id__in=user_ids)
+        permitted = permitted.filter(user_id__in=user_ids)
+        with_role = with_role.filter(user_id__in=user_ids)
+
+    pairs = set(represented)
+
+    # Join public boards with organization members in memory
+    public_boards_by_organization: Dict[int, List[int]] = defaultdict(list)
+    for board_id, organization_id in public_boards:
+        public_boards_by_organization[organization_id].append(board_id)
+    for user_id, organization_id in members:
+        for board_id in public_boards_by_organization.get(organization_id, []):
+            pairs.add((user_id, board_id))
+
+    pairs |= set(permitted)
+    pairs |= set(with_role)
+    return pairs
+
+
+def stored_pairs(
+    boards: QuerySet, user_ids: Optional[Iterable[int]] = None
+) -> Set[Pair]:
+    """
+    Return visibility pairs currently stored for the boards (and users).
+    """
+    visibility = BoardVisibility.objects.filter(board__in=boards.order_by())
+    if user_ids is not None:
+        visibility = visibility.filter(user_id__in=list(user_ids))
+    return set(visibility.values_list("user_id", "board_id"))
+
+
+def refresh(
+    boards: QuerySet, user_ids: Optional[Iterable[int]] = None
+) -> Tuple[Set[Pair], Set[Pair]]:
+    """
+    Synchronize stored visibility of the boards (and users) with the source tables.
+
+    Return `(added, removed)` pairs, removed pairs are buried (delta sync).
+    """
+    user_ids = None if user_ids is None else list(user_ids)
+    expected = expected_pairs(boards, user_ids)
+    stored = stored_pairs(boards, user_ids)
+
+    added = expected - stored
+    removed = stored - expected
+
+    if removed:
+        # Delete grouped by board or by user (whichever needs fewer queries)
+        by_board: Dict[int, List[int]] = defaultdict(list)
+        by_user: Dict[int, List[int]] = defaultdict(list)
+        for user_id, board_id in removed:
+            by_board[board_id].append(user_id)
+            by_user[user_id].append(board_id)
+
+        if len(by_board) <= len(by_user):
+            for board_id, board_user_ids in by_board.items():
+                BoardVisibility.objects.filter(
+                    board_id=board_id, user_id__in=board_user_ids
+                ).delete()
+        else:
+            for user_id, board_ids in by_user.items():
+                BoardVisibility.objects.filter(
+                    user_id=user_id, board_id__in=board_ids
+                ).delete()
+        sync.bury(removed, BoardTombstone.Reason.REVOKED)
+    if added:
+        BoardVisibility.objects.bulk_create(
+            [
+                BoardVisibility(user_id=user_id, board_id=board_id)
+                for user_id, board_id in added
+            ],
+            ignore_conflicts=True,
+        )
+
+    return added, removed
+
+
+def refresh_board(board_id: int) -> None:
+    refresh(Board.objects.filter(pk=board_id))
+
+
+def refresh_organization(organization_id: int, user_id: Optional[int] = None) -> None:
+    refresh(
+        Board.objects.filter(organization_id=organization_id),
+        None if user_id is None else [user_id],
+    )
@@ -0,0 +1,15 @@
+from django.apps import AppConfig
+from django.utils.translation import gettext_lazy as _
+
+
+class EventsConfig(AppConfig):
+    """
+    Application config for events (real-time board change feed).
+    """
+
+    name = "demanage.events"
+    verbose_name = _("Events")
+    label = "events"
+
+    def ready(self):
+        import demanage.events.signals  # noqa F401
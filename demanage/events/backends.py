@@ -0,0 +1,173 @@
+"""
+Pub/sub backends delivering events to the streams of the worker.
+
+Events are published from sync code (after transaction commit) and consumed by
+asyncio streams. Each backend fans messages of a channel out to subscription
+queues of the worker, so an idle stream costs only a queue (no thread, no
+connection).
+"""
+import abc
+import asyncio
+import json
+import queue
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Optional, Set
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+Message = Dict[str, Any]
+
+SUBSCRIPTION_MAX_SIZE = 100
+
+
+class Subscription:
+    """
+    Queue of messages published to the channels (consumed by one stream).
+
+    Messages of the slow consumer are dropped when the queue is full and
+    `overflowed` is set (stream should tell client to resynchronize).
+    """
+
+    def __init__(self, channels: Iterable[str], maxsize: int = SUBSCRIPTION_MAX_SIZE):
+        self.channels = set(channels)
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self.overflowed = False
+
+    def put(self, message: Message) -> None:
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+    async def get(self) -> Message:
+        return await self.queue.get()
+
+
+class BasePubSub(abc.ABC):
+    """
+    Base backend keeping subscriptions of the worker per channel.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions: Dict[str, Set[Subscription]] = defaultdict(set)
+
+    @abc.abstractmethod
+    def publish(self, channel: str, message: Message) -> None:
+        """
+        Publish the message to subscribers of the channel (in all workers).
+        """
+
+    def subscribe(self, channels: Iterable[str]) -> Subscription:
+        """
+        Subscribe to the channels (must be called from the event loop).
+        """
+        subscription = Subscription(channels)
+        with self._lock:
+            for channel in subscription.channels:
+                if not self._subscriptions[channel]:
+                    self.listen(channel)
+                self._subscriptions[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            for channel in subscription.channels:
+                self._subscriptions[channel].discard(subscription)
+                if not self._subscriptions[channel]:
+                    del self._subscriptions[channel]
+                    self.unlisten(channel)
+
+    def listen(self, channel: str) -> None:
+        """
+        Start receiving messages of the channel (first subscriber).
+
+        Called from the event loop (with the lock held), must not block.
+        """
+
+    def unlisten(self, channel: str) -> None:
+        """
+        Stop receiving messages of the channel (last subscriber left).
+        """
+
+    def dispatch(self, channel: str, message: Message) -> None:
+        """
+        Deliver the message to subscriptions of the channel (from any thread).
+        """
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(channel, ()))
+        for subscription in subscriptions:
+            subscription.loop.call_soon_threadsafe(subscription.put, message)
+
+
+class InProcessPubSub(BasePubSub):
+    """
+    Backend delivering events within the process (development and tests).
+    """
+
+    def publish(self, channel: str, message: Message) -> None:
+        # Serialize as other backends do (subscribers get plain JSON data)
+        self.dispatch(channel, json.loads(json.dumps(message, cls=DjangoJSONEncoder)))
+
+
+class RedisPubSub(BasePubSub):
+    """
+    Backend delivering events between processes with Redis pub/sub.
+
+    Worker holds one Redis connection listening (in a thread) to the channels
+    its streams are subscribed to. Redis `PubSub` is not thread-safe: it is used
+    by the listener thread only, (un)subscriptions of the event loop are passed
+    to the thread as commands.
+    """
+
+    prefix = "events:"
+    # (Un)subscriptions are executed between polls: a new stream must not miss
+    # events published right after it is opened
+    poll_interval = 0.05
+
+    def __init__(self, url: Optional[str] = None):
+        import redis
+
+        super().__init__()
+        self._redis = redis.Redis.from_url(url or settings.EVENTS_REDIS_URL)
+        self._pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        self._commands: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+    def publish(self, channel: str, message: Message) -> None:
+        self._redis.publish(
+            self.prefix + channel, json.dumps(message, cls=DjangoJSONEncoder)
+        )
+
+    def listen(self, channel: str) -> None:
+        self._commands.put(("subscribe", self.prefix + channel))
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def unlisten(self, channel: str) -> None:
+        self._commands.put(("unsubscribe", self.prefix + channel))
+
+    def _run(self) -> None:
+        while True:
+            # Wait for a subscription when not listening to any channel
+            self._execute_commands(block=not self._pubsub.subscribed)
+            message = self._pubsub.get_message(timeout=self.poll_interval)
+            if message is not None and message["type"] == "message":
+                self._handle(message)
+
+    def _execute_commands(self, block: bool) -> None:
+        try:
+            command, channel = self._commands.get(block=block)
+            while True:
+                getattr(self._pubsub, command)(channel)
+                command, channel = self._commands.get_nowait()
+        except queue.Empty:
+            pass
+
+    def _handle(self, message: Dict[str, Any]) -> None:
+        _, _, channel = message["channel"].decode().partition(self.prefix)
+        self.dispatch(channel, json.loads(message["data"]))
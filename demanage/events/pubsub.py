@@ -0,0 +1,50 @@
+"""
+Publishing of events to board and organization channels.
+"""
+from typing import Any, Dict, Iterable, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+from .backends import BasePubSub
+
+_backend: Optional[BasePubSub] = None
+
+
+def get_backend() -> BasePubSub:
+    """
+    Return pub/sub backend of the process (`EVENTS_BACKEND` setting).
+    """
+    global _backend
+    if _backend is None:
+        _backend = import_string(settings.EVENTS_BACKEND)()
+    return _backend
+
+
+def board_channel(board_id: int) -> str:
+    return f"board:{board_id}"
+
+
+def organization_channel(organization_id: int) -> str:
+    return f"organization:{organization_id}"
+
+
+def publish(
+    channel: str,
+    type: str,
+    data: Dict[str, Any],
+    users: Optional[Iterable[int]] = None,
+    recheck: bool = False,
+) -> None:
+    """
+    Publish the event after transaction commit.
+
+    - users: deliver only to these users (and organization representative)
+    - recheck: event can change visibility of the board for subscribers
+    """
+    message = {"type": type, "data": data, "recheck": recheck}
+    if users is not None:
+        message["users"] = list(users)
+
+    transaction.on_commit(lambda: get_backend().publish(channel, message))
@@ -0,0 +1,184 @@
+"""
+Signal receivers publishing board, list, card, membership, permission and role
+changes (see `pubsub` module).
+"""
+from typing import Iterable, Type
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from demanage.boards.bulk import boards_written
+from demanage.boards.models import (
+    Board,
+    BoardRole,
+    BoardUserObjectPermission,
+    Card,
+    List,
+)
+from demanage.boards.serializers import (
+    BoardListSerializer,
+    BoardSerializer,
+    CardSerializer,
+)
+from demanage.boards.signals import is_board_deleting, is_list_deleting
+from demanage.members.api.serializers import MemberSerializer
+from demanage.members.models import Member
+
+from .pubsub import board_channel, organization_channel, publish
+
+
+@receiver(post_save, sender=Board)
+def board_post_save_receiver(
+    sender: Type[Board], instance: Board, created: bool, **kwargs
+):
+    publish_board_change(instance, created)
+
+
+@receiver(boards_written, sender=Board)
+def boards_written_receiver(
+    sender: Type[Board], boards: Iterable[Board], created: bool, **kwargs
+):
+    """
+    Publish changes of boards written in bulk (no `post_save` is sent).
+    """
+    for board in boards:
+        publish_board_change(board, created)
+
+
+def publish_board_change(board: Board, created: bool) -> None:
+    publish(
+        board_channel(board.pk),
+        "board.created" if created else "board.updated",
+        BoardSerializer(board).data,
+        recheck=not created,  # public flag could be changed
+    )
+
+
+@receiver(post_delete, sender=Board)
+def board_post_delete_receiver(sender: Type[Board], instance: Board, **kwargs):
+    publish(board_channel(instance.pk), "board.deleted", {"slug": instance.slug})
+
+
+@receiver(post_save, sender=List)
+def list_post_save_receiver(sender: Type[List], instance: List, **kwargs):
+    publish(
+        board_channel(instance.board_id),
+        "list.saved",
+        BoardListSerializer(instance).data,
+    )
+
+
+@receiver(post_delete, sender=List)
+def list_post_delete_receiver(sender: Type[List], instance: List, **kwargs):
+    """
+    Publish deletion of the list (its cards are deleted with it).
+    """
+    publish(board_channel(instance.board_id), "list.deleted", {"id": instance.pk})
+
+
+@receiver(post_save, sender=Card)
+def card_post_save_receiver(sender: Type[Card], instance: Card, **kwargs):
+    publish(
+        board_channel(instance.list.board_id),
+        "card.saved",
+        CardSerializer(instance).data,
+    )
+
+
+@receiver(post_delete, sender=Card)
+def card_post_delete_receiver(sender: Type[Card], instance: Card, **kwargs):
+    if is_list_deleting(instance.list_id):
+        return  # covered by "list.deleted"
+
+    publish(
+        board_channel(instance.list.board_id),
+        "card.deleted",
+        {"id": instance.pk, "list": instance.list_id},
+    )
+
+
+@receiver(post_save, sender=Member)
+def member_post_save_receiver(
+    sender: Type[Member], instance: Member, created: bool, **kwargs
+):
+    if created:
+        publish(
+            organization_channel(instance.organization_id),
+            "member.joined",
+            MemberSerializer(instance).data,
+            recheck=True,
+        )
+
+
+@receiver(post_delete, sender=Member)
+def member_post_delete_receiver(sender: Type[Member], instance: Member, **kwargs):
+    publish(
+        organization_channel(instance.organization_id),
+        "member.left",
+        MemberSerializer(instance).data,
+        recheck=True,
+    )
+
+
+@receiver(post_save, sender=BoardUserObjectPermission)
+def user_object_permission_post_save_receiver(
+    sender: Type[BoardUserObjectPermission],
+    instance: BoardUserObjectPermission,
+    **kwargs,
+):
+    publish_permission_change(instance, "permission.assigned")
+
+
+@receiver(post_delete, sender=BoardUserObjectPermission)
+def user_object_permission_post_delete_receiver(
+    sender: Type[BoardUserObjectPermission],
+    instance: BoardUserObjectPermission,
+    **kwargs,
+):
+    publish_permission_change(instance, "permission.removed")
+
+
+def publish_permission_change(instance: BoardUserObjectPermission, type: str) -> None:
+    """
+    Publish board permission change to the user it is assigned to.
+    """
+    if is_board_deleting(instance.content_object_id):
+        return  # covered by "board.deleted"
+
+    publish(
+        board_channel(instance.content_object_id),
+        type,
+        {"user": instance.user.username, "permission": instance.permission.codename},
+        users=[instance.user_id],
+        recheck=True,
+    )
+
+
+@receiver(post_save, sender=BoardRole)
+def board_role_post_save_receiver(
+    sender: Type[BoardRole], instance: BoardRole, **kwargs
+):
+    publish_role_change(instance, "role.assigned")
+
+
+@receiver(post_delete, sender=BoardRole)
+def board_role_post_delete_receiver(
+    sender: Type[BoardRole], instance: BoardRole, **kwargs
+):
+    publish_role_change(instance, "role.removed")
+
+
+def publish_role_change(instance: BoardRole, type: str) -> None:
+    """
+    Publish board role change to the user it is assigned to.
+    """
+    if is_board_deleting(instance.board_id):
+        return  # covered by "board.deleted"
+
+    publish(
+        board_channel(instance.board_id),
+        type,
+        {"user": instance.user.username, "role": instance.role},
+        users=[instance.user_id],
+        recheck=True,
+    )
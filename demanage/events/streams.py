@@ -0,0 +1,182 @@
+"""
+Server-Sent Events stream of the board changes (raw ASGI application).
+
+`GET /api/boards/<slug>/events/` authenticated with `Authorization: Token <key>`
+header or `?token=<key>` (`EventSource` can't set headers). Idle stream is a
+coroutine waiting on its subscription queue, it wakes up only to send
+heartbeats, so a worker holds thousands of them.
+"""
+import asyncio
+import json
+import re
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import close_old_connections
+from rest_framework.authtoken.models import Token
+
+from demanage.boards.models import Board
+
+from .backends import Message
+from .pubsub import board_channel, get_backend, organization_channel
+
+PATH_REGEX = re.compile(r"^/api/boards/(?P<slug>[-a-zA-Z0-9_]+)/events/$")
+
+Scope = Dict[str, Any]
+
+
+def match(scope: Scope) -> Optional[str]:
+    """
+    Return board slug if the scope is a request of the board event stream.
+    """
+    if scope["type"] != "http" or scope["method"] != "GET":
+        return None
+    matched = PATH_REGEX.match(scope["path"])
+    return matched["slug"] if matched else None
+
+
+@sync_to_async
+def get_subscriber(key: Optional[str], slug: str) -> Optional[Tuple[Any, Board]]:
+    """
+    Return token user and the board if the user can see it.
+    """
+    close_old_connections()
+    try:
+        token = Token.objects.select_related("user").filter(key=key).first()
+        if token is None or not token.user.is_active:
+            return None
+
+        board = Board.objects.select_related("organization").filter(slug=slug).first()
+        if board is None or not token.user.can_view_board(board):
+            return None
+        return token.user, board
+    finally:
+        close_old_connections()
+
+
+@sync_to_async
+def get_visible_board(user, board_id: int) -> Optional[Board]:
+    """
+    Return the board (fresh) if it still exists and the user can see it.
+    """
+    close_old_connections()
+    try:
+        boards = Board.objects.select_related("organization")
+        board = boards.filter(pk=board_id).first()
+        if board is None or not user.can_view_board(board):
+            return None
+        return board
+    finally:
+        close_old_connections()
+
+
+def get_token(scope: Scope) -> Optional[str]:
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            keyword, _, key = value.decode("latin1").partition(" ")
+            return key.strip() if keyword.lower() == "token" else None
+
+    query = parse_qs(scope["query_string"].decode("latin1"))
+    return query.get("token", [None])[0]
+
+
+def is_audience(message: Message, user, board: Board) -> bool:
+    users = message.get("users")
+    return (
+        users is None
+        or user.pk in users
+        or board.organization.representative_id == user.pk
+    )
+
+
+def encode(type: str, data: Any) -> bytes:
+    payload = json.dumps(data, cls=DjangoJSONEncoder)
+    return f"event: {type}\ndata: {payload}\n\n".encode()
+
+
+async def stream_application(scope: Scope, receive, send) -> None:
+    subscriber = await get_subscriber(get_token(scope), match(scope))
+    if subscriber is None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 404,
+                "headers": [(b"content-type", b"application/json")],
+            }
+        )
+        await send({"type": "http.response.body", "body": b'{"detail":"Not found."}'})
+        return
+
+    user, board = subscriber
+    backend = get_backend()
+    subscription = backend.subscribe(
+        [board_channel(board.pk), organization_channel(board.organization_id)]
+    )
+    disconnect = asyncio.ensure_future(wait_disconnect(receive))
+    try:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"text/event-stream"),
+                    (b"cache-control", b"no-cache"),
+                    (b"x-accel-buffering", b"no"),  # disable proxy buffering
+                ],
+            }
+        )
+        await stream(user, board, subscription, disconnect, send)
+        await send({"type": "http.response.body", "body": b""})
+    finally:
+        backend.unsubscribe(subscription)
+        disconnect.cancel()
+
+
+async def stream(user, board: Board, subscription, disconnect, send) -> None:
+    """
+    Send events visible to the user until client disconnects or loses access.
+    """
+    loop = asyncio.get_running_loop()
+    checked = loop.time()
+
+    async def write(body: bytes):
+        await send({"type": "http.response.body", "body": body, "more_body": True})
+
+    await write(b"retry: 5000\n\n")
+    while not disconnect.done():
+        get = asyncio.ensure_future(subscription.get())
+        done, _ = await asyncio.wait(
+            {get, disconnect},
+            timeout=settings.EVENTS_HEARTBEAT_INTERVAL,
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+        if get not in done:
+            get.cancel()
+            if not disconnect.done():
+                await write(b": heartbeat\n\n")
+            message = None
+        else:
+            message = get.result()
+
+        if subscription.overflowed:
+            await write(encode("stream.reset", {}))  # client should refetch
+            return
+
+        recheck = message is not None and message["recheck"]
+        if recheck or loop.time() - checked > settings.EVENTS_RECHECK_INTERVAL:
+            board = await get_visible_board(user, board.pk)
+            checked = loop.time()
+            if board is None:
+                await write(encode("stream.closed", {}))
+                return
+
+        if message is not None and is_audience(message, user, board):
+            await write(encode(message["type"], message["data"]))
+
+
+async def wait_disconnect(receive) -> None:
+    while (await receive())["type"] != "http.disconnect":
+        pass
@@ -0,0 +1,115 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from demanage.events.backends import BasePubSub, InProcessPubSub, RedisPubSub
+
+
+def test_in_process_pubsub_delivers_to_channel_subscribers():
+    async def run():
+        backend = InProcessPubSub()
+        board = backend.subscribe(["board:1"])
+        other = backend.subscribe(["board:2"])
+
+        backend.publish("board:1", {"type": "board.updated", "data": {}})
+        message = await asyncio.wait_for(board.get(), 1)
+
+        backend.unsubscribe(board)
+        backend.unsubscribe(other)
+        return message, other.queue.empty(), backend._subscriptions
+
+    message, other_empty, subscriptions = asyncio.run(run())
+
+    assert message["type"] == "board.updated"
+    assert other_empty
+    assert not subscriptions
+
+
+def test_subscription_overflow():
+    async def run():
+        backend = InProcessPubSub()
+        subscription = backend.subscribe(["board:1"])
+        subscription.queue = asyncio.Queue(1)
+
+        for _ in range(2):
+            backend.publish("board:1", {"type": "board.updated", "data": {}})
+        await asyncio.sleep(0)
+        return subscription.overflowed
+
+    assert asyncio.run(run())
+
+
+def test_pubsub_backend_must_implement_publish():
+    with pytest.raises(TypeError):
+        BasePubSub()
+
+
+class FakePubSub:
+    """
+    Redis `PubSub` recording (un)subscriptions and the thread executing them.
+    """
+
+    subscribed = False
+
+    def __init__(self):
+        self.calls = []
+        self.executed = threading.Condition()
+
+    def subscribe(self, channel):
+        self.execute("subscribe", channel)
+        self.subscribed = True
+
+    def unsubscribe(self, channel):
+        self.execute("unsubscribe", channel)
+
+    def execute(self, command, channel):
+        with self.executed:
+            self.calls.append((command, channel, threading.get_ident()))
+            self.executed.notify_all()
+
+    def wait(self, count, timeout):
+        with self.executed:
+            return self.executed.wait_for(lambda: len(self.calls) >= count, timeout)
+
+    def get_message(self, timeout):
+        time.sleep(timeout)  # no messages published
+
+
+@pytest.fixture
+def redis_pubsub(mocker):
+    mocker.patch("redis.Redis.from_url")
+    backend = RedisPubSub("redis://")
+    backend._pubsub = FakePubSub()
+    return backend
+
+
+def test_redis_pubsub_subscribes_from_listener_thread(redis_pubsub):
+    async def run():
+        redis_pubsub.unsubscribe(redis_pubsub.subscribe(["board:1"]))
+
+    asyncio.run(run())
+
+    pubsub = redis_pubsub._pubsub
+    assert pubsub.wait(2, timeout=1)
+    assert [call[:2] for call in pubsub.calls] == [
+        ("subscribe", "events:board:1"),
+        ("unsubscribe", "events:board:1"),
+    ]
+    assert {call[2] for call in pubsub.calls} == {redis_pubsub._thread.ident}
+
+
+def test_redis_pubsub_subscribes_while_listening_without_delay(redis_pubsub):
+    pubsub = redis_pubsub._pubsub
+
+    async def run():
+        redis_pubsub.subscribe(["board:1"])
+        assert pubsub.wait(1, timeout=1)
+        await asyncio.sleep(0.01)  # listener is waiting for messages
+        started = time.monotonic()
+        redis_pubsub.subscribe(["board:2"])
+        assert pubsub.wait(2, timeout=1)
+        return time.monotonic() - started
+
+    assert asyncio.run(run()) < 0.2
@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+from guardian.shortcuts import assign_perm, remove_perm
+from rest_framework.authtoken.models import Token
+
+from demanage.boards.bulk import after_bulk_write
+from demanage.boards.models import Board
+from demanage.boards.tests.factories import BoardFactory
+from demanage.events import streams
+from demanage.events.backends import InProcessPubSub
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+@pytest.fixture(autouse=True)
+def backend(settings, monkeypatch):
+    settings.EVENTS_HEARTBEAT_INTERVAL = 0.05
+    backend = InProcessPubSub()
+    monkeypatch.setattr("demanage.events.pubsub._backend", backend)
+    return backend
+
+
+def make_scope(board, user) -> dict:
+    token, _ = Token.objects.get_or_create(user=user)
+    return {
+        "type": "http",
+        "method": "GET",
+        "path": f"/api/boards/{board.slug}/events/",
+        "query_string": f"token={token.key}".encode(),
+        "headers": [],
+    }
+
+
+async def run_stream(scope, action, duration=0.3) -> bytes:
+    """
+    Run the stream, do the (sync) action meanwhile and return response body.
+    """
+    sent = []
+    disconnected = asyncio.Event()
+
+    async def receive():
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    task = asyncio.ensure_future(streams.stream_application(scope, receive, send))
+    await asyncio.sleep(0.1)
+    await asyncio.get_running_loop().run_in_executor(None, action)
+    await asyncio.sleep(duration)
+    disconnected.set()
+    await asyncio.wait_for(task, 1)
+
+    assert sent[0]["status"] == 200
+    return b"".join(message.get("body", b"") for message in sent[1:])
+
+
+def test_match_board_event_stream_path():
+    scope = {"type": "http", "method": "GET", "path": "/api/boards/board/events/"}
+    assert streams.match(scope) == "board"
+    assert streams.match(dict(scope, path="/api/boards/board/")) is None
+
+
+def test_stream_sends_board_changes(organization):
+    board = BoardFactory(organization=organization, title="Old")
+    scope = make_scope(board, organization.representative)
+
+    def update():
+        board.title = "New"
+        board.save()
+
+    body = asyncio.run(run_stream(scope, update))
+
+    assert b"event: board.updated" in body
+    assert b'"title": "New"' in body
+    assert b": heartbeat" in body
+
+
+def test_stream_sends_bulk_board_changes(organization):
+    board = BoardFactory(organization=organization, title="Old")
+    scope = make_scope(board, organization.representative)
+
+    def update():
+        board.title = "New"
+        Board.objects.bulk_update([board], ["title"])
+        after_bulk_write([board])
+
+    body = asyncio.run(run_stream(scope, update))
+
+    assert b"event: board.updated" in body
+    assert b'"title": "New"' in body
+
+
+def test_stream_is_closed_when_user_loses_access(user, organization):
+    board = BoardFactory(organization=organization, public=False)
+    assign_perm("view_board", user, board)
+    scope = make_scope(board, user)
+
+    def revoke():
+        remove_perm("view_board", user, board)
+
+    body = asyncio.run(run_stream(scope, revoke))
+
+    assert b"event: stream.closed" in body
+
+
+def test_stream_of_invisible_board_is_not_found(user):
+    board = BoardFactory(public=False)
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(streams.stream_application(make_scope(board, user), None, send))
+
+    assert sent[0]["status"] == 404
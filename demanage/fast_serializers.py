@@ -0,0 +1,160 @@
+"""
+Fast read-only serialization of `values()` rows.
+
+`CompiledSerializer` is compiled from a bound `ModelSerializer` into a list of
+(field name, model path, converter) columns. Rows are fetched with
+`values(*paths)` and converted with the field `to_representation` so output is
+identical to the serializer, but no model instances and no per field
+`get_attribute` calls are made.
+"""
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from django.db.models import Model
+from django.db.models.query import QuerySet
+from rest_framework import serializers
+from rest_framework.response import Response
+
+from .fieldsets import is_model_path
+
+# Fields which representation of the database value is the value itself
+# (`str` of a string, `bool` of a boolean)
+IDENTITY_FIELDS = (serializers.BooleanField, serializers.CharField)
+
+Column = Tuple[str, Optional[str], Optional[Callable[[Any], Any]]]
+
+
+class CompiledSerializer:
+    """
+    Read-only serializer of `values()` rows (or instances) compiled from the
+    serializer fields.
+    """
+
+    def __init__(self, columns: List[Column], values: Dict[str, Any]):
+        self.columns = columns
+        self.values = values
+
+    @property
+    def paths(self) -> List[str]:
+        return [path for _, path, _ in self.columns if path is not None]
+
+    def to_representation(self, row: Dict[str, Any]) -> OrderedDict:
+        ret = OrderedDict()
+        for name, path, convert in self.columns:
+            value = self.values[name] if path is None else row[path]
+            if value is None or convert is None:
+                ret[name] = value
+            else:
+                ret[name] = convert(value)
+        return ret
+
+    def instance_to_representation(self, instance: Model) -> OrderedDict:
+        return self.to_representation(
+            {path: _get_path(instance, path) for path in self.paths}
+        )
+
+    def serialize(self, rows: Iterable[Dict[str, Any]]) -> List[OrderedDict]:
+        return [self.to_representation(row) for row in rows]
+
+
+def compile_serializer(
+    serializer: serializers.ModelSerializer, values: Optional[Dict[str, Any]] = None
+) -> Optional[CompiledSerializer]:
+    """
+    Compile readable fields of the serializer or return None if any of them
+    isn't a (related) model field.
+
+    `values` are constant representations of the fields (e.g. parent slug).
+    """
+    values = values or {}
+    model = serializer.Meta.model
+    columns: List[Column] = []
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        if name in values:
+            columns.append((name, None, None))
+            continue
+
+        column = _compile_field(name, field)
+        if column is None or not is_model_path(model, column[1]):
+            return None
+        columns.append(column)
+
+    return CompiledSerializer(columns, values)
+
+
+def _compile_field(name: str, field: serializers.Field) -> Optional[Column]:
+    if field.source == "*" or isinstance(
+        field, (serializers.BaseSerializer, serializers.SerializerMethodField)
+    ):
+        return None
+
+    path = field.source.replace(".", "__")
+    if isinstance(field, serializers.SlugRelatedField):
+        return name, f"{path}__{field.slug_field}", None
+    if isinstance(field, serializers.RelatedField):
+        return None
+    if isinstance(field, IDENTITY_FIELDS):
+        return name, path, None
+    return name, path, field.to_representation
+
+
+def _get_path(instance: Model, path: str) -> Any:
+    value = instance
+    for name in path.split("__"):
+        value = getattr(value, name)
+        if value is None:
+            break
+    return value
+
+
+class CompiledSerializerMixin:
+    """
+    View mixin serializing list and retrieve responses with compiled serializer.
+
+    Falls back to the serializer when it can't be compiled.
+    """
+
+    def get_compiled_serializer(self) -> Optional[CompiledSerializer]:
+        return compile_serializer(self.get_serializer())
+
+    def list(self, request, *args, **kwargs) -> Response:
+        compiled = self.get_compiled_serializer()
+        if compiled is None:
+            return super().list(request, *args, **kwargs)
+
+        # Keyset pagination reads ordering values from the rows
+        ordering = [
+            name.lstrip("-") for name in getattr(self.paginator, "ordering", ())
+        ]
+        queryset = self.filter_queryset(self.get_queryset())
+        rows = queryset.values(*dict.fromkeys(compiled.paths + ordering))
+
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(compiled.serialize(page))
+        return Response(compiled.serialize(rows))
+
+    def retrieve(self, request, *args, **kwargs) -> Response:
+        return Response(self.serialize_instance(self.get_object()))
+
+    def serialize_instance(self, instance: Model) -> Dict[str, Any]:
+        compiled = self.get_compiled_serializer()
+        if compiled is None:
+            return self.get_serializer(instance).data
+        return compiled.instance_to_representation(instance)
+
+
+def serialize_values(
+    serializer: serializers.ModelSerializer,
+    queryset: QuerySet,
+    values: Optional[Dict[str, Any]] = None,
+) -> List[Any]:
+    """
+    Serialize the queryset with the compiled serializer (or the serializer).
+    """
+    compiled = compile_serializer(serializer, values)
+    if compiled is None:
+        return serializer.__class__(queryset, many=True).data
+    return compiled.serialize(queryset.values(*compiled.paths))
@@ -0,0 +1,148 @@
+"""
+Sparse fieldsets (`?fields=slug,title` / `?omit=description`) shared by API
+resources.
+
+Serializer mixin drops fields which are not requested from the output, view
+mixin drops their columns from the SQL SELECT with `.only()` (and joins the
+related rows which remaining fields read with `select_related`).
+"""
+from collections import OrderedDict
+from typing import List, Optional, Set
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model
+from django.db.models.query import QuerySet
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+
+def parse_field_names(value: Optional[str]) -> Optional[Set[str]]:
+    if value is None:
+        return None
+    return {name.strip() for name in value.split(",") if name.strip()}
+
+
+class SparseFieldsetsMixin:
+    """
+    Serializer mixin limiting (read) fields to `?fields=` and without `?omit=`.
+
+    Unknown field names are ignored. Nested serializers are not limited.
+    """
+
+    fields_query_param = "fields"
+    omit_query_param = "omit"
+
+    def get_fields(self):
+        fields = super().get_fields()
+        requested = self.get_requested_field_names()
+        if requested is None:
+            return fields
+
+        return OrderedDict(
+            (name, field) for name, field in fields.items() if name in requested
+        )
+
+    def get_requested_field_names(self) -> Optional[Set[str]]:
+        """
+        Return names of fields requested by the query or None (all fields).
+        """
+        request = self.context.get("request")
+        if request is None or request.method not in SAFE_METHODS:
+            return None
+        if not self._is_top_level():
+            return None
+
+        query_params = getattr(request, "query_params", request.GET)
+        include = parse_field_names(query_params.get(self.fields_query_param))
+        omit = parse_field_names(query_params.get(self.omit_query_param))
+        if include is None and not omit:
+            return None
+
+        names = set(self.Meta.fields) if include is None else include
+        return names - (omit or set())
+
+    def get_source_paths(self) -> Optional[List[str]]:
+        """
+        Return model field paths (`user__username`) read by the fields or None
+        if they can't be determined (nested serializers).
+        """
+        paths = []
+        for field in self.fields.values():
+            source = field.source.replace(".", "__") if field.source != "*" else ""
+            if isinstance(field, serializers.BaseSerializer):
+                return None
+            elif isinstance(field, serializers.SlugRelatedField):
+                paths.append(f"{source}__{field.slug_field}")
+            elif isinstance(field, serializers.HyperlinkedIdentityField):
+                paths.append(field.lookup_field)
+            elif isinstance(field, serializers.HyperlinkedRelatedField):
+                paths.append(f"{source}__{field.lookup_field}")
+            elif source:
+                paths.append(source)
+        return paths
+
+    def _is_top_level(self) -> bool:
+        # `many=True` serializer is the child of the root list serializer
+        parent = self.parent
+        return parent is None or (
+            isinstance(parent, serializers.ListSerializer) and parent.parent is None
+        )
+
+
+class SparseFieldsetsViewMixin:
+    """
+    View mixin selecting only columns of the serialized fields (list and retrieve).
+
+    `sparse_required_fields` are always selected (e.g. fields read by
+    permissions or conditional requests), keyset pagination ordering is added.
+    """
+
+    sparse_actions = ("list", "retrieve")
+    sparse_required_fields: List[str] = []
+
+    def filter_queryset(self, queryset: QuerySet) -> QuerySet:
+        queryset = super().filter_queryset(queryset)
+        if self.action not in self.sparse_actions:
+            return queryset
+        return self.sparse_queryset(queryset)
+
+    def sparse_queryset(self, queryset: QuerySet) -> QuerySet:
+        source_paths = self.get_serializer().get_source_paths()
+        if source_paths is None:
+            return queryset
+
+        paths = list(self.sparse_required_fields)
+        paths += [
+            name.lstrip("-") for name in getattr(self.paginator, "ordering", ())
+        ]
+        for path in source_paths:
+            if is_model_path(queryset.model, path):
+                paths.append(path)
+            elif path not in queryset.query.annotations:
+                # Property or method of the model may read any field
+                return queryset
+
+        related = sorted({path.rsplit("__", 1)[0] for path in paths if "__" in path})
+        if related:
+            queryset = queryset.select_related(*related)
+        return queryset.only(*paths)
+
+
+def is_model_path(model: Model, path: str) -> bool:
+    """
+    Return whether the path leads to a concrete field through forward relations.
+    """
+    names = path.split("__")
+    for index, name in enumerate(names):
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return False
+
+        if not field.concrete:
+            return False
+        if index < len(names) - 1:
+            if not (field.many_to_one or field.one_to_one):
+                return False
+            model = field.related_model
+    return True
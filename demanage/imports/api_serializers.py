@@ -0,0 +1,37 @@
+from rest_framework import serializers
+
+from demanage.imports.models import BoardImport
+
+
+class BoardImportSerializer(serializers.ModelSerializer):
+    """
+    Serializer to dict for board import (status and progress).
+
+    - file will be passed with data (validated)
+    - organization and user will be passed as save kwargs (not validated)
+    """
+
+    file = serializers.FileField(write_only=True, allow_empty_file=False)
+    board = serializers.SlugRelatedField(slug_field="slug", read_only=True)
+    progress = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = BoardImport
+        fields = [
+            "id",
+            "file",
+            "status",
+            "progress",
+            "board",
+            "lists_count",
+            "cards_count",
+            "error",
+            "created",
+            "modified",
+        ]
+        read_only_fields = [
+            "status",
+            "lists_count",
+            "cards_count",
+            "error",
+        ]
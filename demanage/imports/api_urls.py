@@ -0,0 +1,12 @@
+from django.urls import path
+
+from demanage.imports.api_views import (
+    board_import_create_view,
+    board_import_detail_view,
+)
+
+app_name = "imports"
+urlpatterns = [
+    path("o/<slug:slug>/imports/", board_import_create_view, name="create"),
+    path("imports/<int:pk>/", board_import_detail_view, name="detail"),
+]
@@ -0,0 +1,65 @@
+from django.db import transaction
+from rest_framework import exceptions, generics, parsers, request, response, status
+from rest_framework.authentication import SessionAuthentication, TokenAuthentication
+from rest_framework.permissions import IsAuthenticated
+
+from demanage.imports.api_serializers import BoardImportSerializer
+from demanage.imports.models import BoardImport
+from demanage.imports.tasks import import_board
+from demanage.organizations.models import Organization
+from demanage.throttles import DemanageBurstThrottle
+
+
+class BoardImportCreateAPIView(generics.CreateAPIView):
+    """
+    Upload Trello board export (multipart `file`) to import into organization.
+
+    Import runs in background, its status is available at import detail.
+    """
+
+    serializer_class = BoardImportSerializer
+    parser_classes = [parsers.MultiPartParser]
+
+    # Authentication and authorization
+    authentication_classes = [SessionAuthentication, TokenAuthentication]
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [DemanageBurstThrottle]
+
+    def get_organization(self) -> Organization:
+        organization = generics.get_object_or_404(
+            Organization, slug=self.kwargs["slug"]
+        )
+        # Only representative creates boards in organization
+        if organization.representative_id != self.request.user.pk:
+            raise exceptions.PermissionDenied()
+        return organization
+
+    def create(self, request: request.Request, *args, **kwargs) -> response.Response:
+        organization = self.get_organization()
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        board_import = serializer.save(organization=organization, user=request.user)
+
+        # Start import after upload is committed
+        transaction.on_commit(lambda: import_board.delay(board_import.pk))
+
+        return response.Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+
+
+class BoardImportRetrieveAPIView(generics.RetrieveAPIView):
+    """
+    Status and progress of the board import (importing user only).
+    """
+
+    serializer_class = BoardImportSerializer
+    authentication_classes = [SessionAuthentication, TokenAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        return BoardImport.objects.filter(user=self.request.user).select_related(
+            "board"
+        )
+
+
+board_import_create_view = BoardImportCreateAPIView.as_view()
+board_import_detail_view = BoardImportRetrieveAPIView.as_view()
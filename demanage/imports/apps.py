@@ -0,0 +1,15 @@
+from django.apps import AppConfig
+
+
+class ImportsConfig(AppConfig):
+    """
+    Application config for imports (boards from other services).
+    """
+
+    name = "demanage.imports"
+    label = "imports"
+    verbose_name = "_(Imports)"
+    default_auto_field = "django.db.models.BigAutoField"
+
+    def ready(self):
+        pass
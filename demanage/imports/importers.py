@@ -0,0 +1,124 @@
+"""
+Import of the board (with lists and cards) from Trello export file.
+
+File is read twice: the first pass reads the board and its lists, the second
+one streams cards and writes them with `bulk_create` in batches. Progress is
+saved after each batch.
+"""
+import io
+from typing import IO, Dict, List
+
+from django.db import transaction
+
+from demanage.activity.log import record
+from demanage.boards import cache, snapshot
+from demanage.boards.models import Board, Card
+from demanage.boards.models import List as BoardList
+from demanage.boards.ranks import rank_from_number
+
+from . import trello
+from .models import BoardImport
+
+IMPORT_BATCH_SIZE = 1000
+
+
+class ProgressFile(io.RawIOBase):
+    """
+    Read-only file wrapper counting bytes read (saved as import progress).
+    """
+
+    def __init__(self, file: IO[bytes]):
+        self.file = file
+        self.read_bytes = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self.file.read(len(buffer))
+        buffer[: len(data)] = data
+        self.read_bytes += len(data)
+        return len(data)
+
+
+def run_import(board_import: BoardImport) -> Board:
+    """
+    Import board from the import file into the import organization.
+    """
+    total = board_import.file.size
+    BoardImport.objects.filter(pk=board_import.pk).update(
+        status=BoardImport.Status.RUNNING, total_bytes=total
+    )
+
+    with board_import.file.open("rb") as file:
+        board_data, lists_data = trello.read_board(ProgressFile(file))
+
+    with transaction.atomic():
+        board = Board.objects.create(
+            organization=board_import.organization,
+            title=(board_data.get("name") or "Trello board")[:50],
+            description=board_data.get("desc") or "",
+            public=board_data.get("permission_level") in ["public", "org"],
+        )
+        lists = BoardList.objects.bulk_create(
+            [
+                BoardList(
+                    board=board,
+                    title=(item.get("name") or "List")[:50],
+                    rank=rank_from_number(float(item.get("pos") or 0)),
+                )
+                for item in lists_data
+            ],
+            batch_size=IMPORT_BATCH_SIZE,
+        )
+    list_ids = {item["id"]: item_list.pk for item, item_list in zip(lists_data, lists)}
+    BoardImport.objects.filter(pk=board_import.pk).update(
+        board=board, lists_count=len(lists), processed_bytes=total
+    )
+
+    board_import.cards_count = 0
+    with board_import.file.open("rb") as file:
+        progress = ProgressFile(file)
+        batch: List[Card] = []
+        for item in trello.iter_cards(progress):
+            list_id = list_ids.get(item.get("idList"))
+            if list_id is None:  # card of closed list
+                continue
+            batch.append(build_card(item, list_id))
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                save_cards(board_import, batch, total, progress)
+                batch = []
+        save_cards(board_import, batch, total, progress)
+
+    # Lists and cards are written without signals
+    snapshot.invalidate(board.pk)
+    cache.bump_organization(board.organization_id)
+    record(
+        "board.imported",
+        board.organization_id,
+        board.pk,
+        board.slug,
+        {"lists": len(lists), "cards": board_import.cards_count},
+        actor=board_import.user,
+    )
+    return board
+
+
+def build_card(item: Dict, list_id: int) -> Card:
+    return Card(
+        list_id=list_id,
+        title=(item.get("name") or "Card")[:100],
+        description=item.get("desc") or "",
+        rank=rank_from_number(float(item.get("pos") or 0)),
+    )
+
+
+def save_cards(
+    board_import: BoardImport, cards: List[Card], total: int, progress: ProgressFile
+) -> None:
+    Card.objects.bulk_create(cards, batch_size=IMPORT_BATCH_SIZE)
+    board_import.cards_count += len(cards)
+    BoardImport.objects.filter(pk=board_import.pk).update(
+        cards_count=board_import.cards_count,
+        processed_bytes=total + progress.read_bytes,
+    )
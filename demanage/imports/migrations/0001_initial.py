@@ -0,0 +1,44 @@
+# Generated by Django 3.1.13 on 2022-01-18 12:00
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django_extensions.db.fields
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('organizations', '0006_organization_name_trigram_index'),
+        ('boards', '0007_list_card'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BoardImport',
+            fields=[
+                ('created', django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name='created')),
+                ('modified', django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name='modified')),
+                ('id', models.BigAutoField(primary_key=True, serialize=False, verbose_name='ID')),
+                ('file', models.FileField(blank=True, upload_to='imports/', verbose_name='File')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('succeeded', 'Succeeded'), ('failed', 'Failed')], default='pending', max_length=10, verbose_name='Status')),
+                ('total_bytes', models.BigIntegerField(default=0, verbose_name='Total bytes')),
+                ('processed_bytes', models.BigIntegerField(default=0, verbose_name='Processed bytes')),
+                ('lists_count', models.PositiveIntegerField(default=0, verbose_name='Lists')),
+                ('cards_count', models.PositiveIntegerField(default=0, verbose_name='Cards')),
+                ('error', models.TextField(blank=True, verbose_name='Error')),
+                ('board', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='boards.board', verbose_name='Board')),
+                ('organization', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='board_imports', to='organizations.organization', verbose_name='Organization')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='board_imports', to=settings.AUTH_USER_MODEL, verbose_name='User importing')),
+            ],
+            options={
+                'verbose_name': 'Board import',
+                'verbose_name_plural': 'Board imports',
+                'ordering': ['-created'],
+                'default_permissions': [],
+            },
+        ),
+    ]
@@ -0,0 +1,69 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+from django_extensions.db.models import TimeStampedModel
+
+
+class BoardImport(TimeStampedModel):
+    """
+    Model representing import of the board from the uploaded export file.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", _("Pending")
+        RUNNING = "running", _("Running")
+        SUCCEEDED = "succeeded", _("Succeeded")
+        FAILED = "failed", _("Failed")
+
+    id = models.BigAutoField(verbose_name="ID", primary_key=True)
+    organization = models.ForeignKey(
+        verbose_name=_("Organization"),
+        to="organizations.Organization",
+        on_delete=models.CASCADE,
+        related_name="board_imports",
+    )
+    user = models.ForeignKey(
+        verbose_name=_("User importing"),
+        to="users.User",
+        on_delete=models.CASCADE,
+        related_name="board_imports",
+    )
+    file = models.FileField(verbose_name=_("File"), upload_to="imports/", blank=True)
+    status = models.CharField(
+        verbose_name=_("Status"),
+        max_length=10,
+        choices=Status.choices,
+        default=Status.PENDING,
+    )
+    board = models.ForeignKey(
+        verbose_name=_("Board"),
+        to="boards.Board",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    total_bytes = models.BigIntegerField(verbose_name=_("Total bytes"), default=0)
+    processed_bytes = models.BigIntegerField(
+        verbose_name=_("Processed bytes"), default=0
+    )
+    lists_count = models.PositiveIntegerField(verbose_name=_("Lists"), default=0)
+    cards_count = models.PositiveIntegerField(verbose_name=_("Cards"), default=0)
+    error = models.TextField(verbose_name=_("Error"), blank=True)
+
+    class Meta:
+        verbose_name = _("Board import")
+        verbose_name_plural = _("Board imports")
+        ordering = ["-created"]
+        default_permissions = []
+
+    def __str__(self):
+        return f"Import {self.pk} to {self.organization} by {self.user}"
+
+    @property
+    def progress(self) -> float:
+        """
+        Share of the file processed (two passes over the file).
+        """
+        if not self.total_bytes:
+            return 1.0 if self.status == self.Status.SUCCEEDED else 0.0
+        return min(1.0, self.processed_bytes / (2 * self.total_bytes))
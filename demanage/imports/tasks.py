@@ -0,0 +1,35 @@
+from config import celery_app
+from demanage.imports.importers import run_import
+from demanage.imports.models import BoardImport
+
+
+# Imports of large exports run longer than default task time limits
+@celery_app.task(soft_time_limit=60 * 60, time_limit=60 * 60 + 60)
+def import_board(board_import_pk):
+    """
+    Import board from the uploaded Trello export.
+
+    Return primary key of the imported board.
+    """
+    board_import = BoardImport.objects.select_related("organization", "user").get(
+        pk=board_import_pk
+    )
+    try:
+        board = run_import(board_import)
+    except Exception as e:
+        # Remove partially imported board
+        board_import.refresh_from_db()
+        if board_import.board is not None:
+            board_import.board.delete()
+        board_import.status = BoardImport.Status.FAILED
+        board_import.error = str(e) or e.__class__.__name__
+        board_import.save(update_fields=["status", "error", "modified"])
+        raise
+    else:
+        board_import.refresh_from_db()
+        board_import.status = BoardImport.Status.SUCCEEDED
+        board_import.save(update_fields=["status", "modified"])
+        return board.pk
+    finally:
+        board_import.file.delete(save=False)
+        BoardImport.objects.filter(pk=board_import.pk).update(file="")
@@ -0,0 +1,46 @@
+import json
+
+from django.core.files.base import ContentFile
+from factory import LazyFunction, SubFactory
+from factory.django import DjangoModelFactory
+
+from demanage.organizations.tests.factories import OrganizationFactory
+from demanage.users.tests.factories import UserFactory
+
+from ..models import BoardImport
+
+TRELLO_EXPORT = {
+    "name": "Imported board",
+    "desc": "From Trello",
+    "prefs": {"permissionLevel": "private"},
+    "actions": [{"type": "createCard", "data": {"text": "x" * 100}}] * 10,
+    "lists": [
+        {"id": "l2", "name": "Done", "pos": 32768, "closed": False},
+        {"id": "l1", "name": "To do", "pos": 16384, "closed": False},
+        {"id": "l3", "name": "Archived", "pos": 49152, "closed": True},
+    ],
+    "cards": [
+        {"id": "c1", "name": "Second", "idList": "l1", "pos": 2.5, "closed": False},
+        {"id": "c2", "name": "First", "idList": "l1", "pos": 1, "closed": False},
+        {"id": "c3", "name": "Shipped", "idList": "l2", "pos": 1, "closed": False},
+        {"id": "c4", "name": "Old", "idList": "l3", "pos": 1, "closed": False},
+        {"id": "c5", "name": "Closed", "idList": "l1", "pos": 3, "closed": True},
+    ],
+}
+
+
+def trello_export_file(data: dict = None) -> ContentFile:
+    return ContentFile(json.dumps(data or TRELLO_EXPORT).encode(), name="trello.json")
+
+
+class BoardImportFactory(DjangoModelFactory):
+    """
+    Factory for board import of the Trello export.
+    """
+
+    organization = SubFactory(OrganizationFactory)
+    user = SubFactory(UserFactory)
+    file = LazyFunction(trello_export_file)
+
+    class Meta:
+        model = BoardImport
@@ -0,0 +1,47 @@
+import pytest
+from django.urls import reverse
+
+from demanage.imports.models import BoardImport
+
+from .factories import BoardImportFactory, trello_export_file
+
+pytestmark = pytest.mark.django_db
+
+
+def test_representative_uploads_import(api_client_factory, organization, mocker):
+    delay = mocker.patch("demanage.imports.api_views.import_board.delay")
+    api_client = api_client_factory(organization.representative)
+    url = reverse("api:imports:create", kwargs={"slug": organization.slug})
+
+    response = api_client.post(url, {"file": trello_export_file()}, format="multipart")
+
+    assert response.status_code == 202
+    assert response.data["status"] == BoardImport.Status.PENDING
+    assert BoardImport.objects.filter(organization=organization).exists()
+    delay.assert_not_called()  # called after commit
+
+
+def test_member_can_not_upload_import(api_client_factory, member):
+    api_client = api_client_factory(member.user)
+    url = reverse("api:imports:create", kwargs={"slug": member.organization.slug})
+
+    response = api_client.post(url, {"file": trello_export_file()}, format="multipart")
+
+    assert response.status_code == 403
+
+
+def test_import_status_is_visible_to_importing_user(api_client_factory, user):
+    board_import = BoardImportFactory(user=user)
+    other_import = BoardImportFactory()
+    api_client = api_client_factory(user)
+
+    response = api_client.get(
+        reverse("api:imports:detail", kwargs={"pk": board_import.pk})
+    )
+    other_response = api_client.get(
+        reverse("api:imports:detail", kwargs={"pk": other_import.pk})
+    )
+
+    assert response.status_code == 200
+    assert response.data["progress"] == 0.0
+    assert other_response.status_code == 404
@@ -0,0 +1,44 @@
+import pytest
+from django.core.files.base import ContentFile
+
+from demanage.boards.models import Board
+from demanage.imports.models import BoardImport
+from demanage.imports.tasks import import_board
+
+from .factories import BoardImportFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_import_board(settings):
+    settings.CELERY_TASK_ALWAYS_EAGER = True
+    board_import = BoardImportFactory()
+
+    task_result = import_board.delay(board_import.pk)
+
+    board_import.refresh_from_db()
+    board = board_import.board
+    assert task_result.result == board.pk
+    assert board_import.status == BoardImport.Status.SUCCEEDED
+    assert board_import.progress == 1.0
+    assert board.title == "Imported board"
+    assert not board.public
+    assert [board_list.title for board_list in board.lists.all()] == ["To do", "Done"]
+    to_do = board.lists.get(title="To do")
+    assert [card.title for card in to_do.cards.all()] == ["First", "Second"]
+    assert board_import.cards_count == 3  # cards of archived list are skipped
+    assert not board_import.file
+
+
+def test_import_of_invalid_file_fails(settings):
+    settings.CELERY_TASK_ALWAYS_EAGER = True
+    file = ContentFile(b'{"name": "Broken", "lists": [{"id": "l1"', name="t.json")
+    board_import = BoardImportFactory(file=file)
+
+    with pytest.raises(Exception):
+        import_board.delay(board_import.pk).get()
+
+    board_import.refresh_from_db()
+    assert board_import.status == BoardImport.Status.FAILED
+    assert board_import.error
+    assert not Board.objects.filter(organization=board_import.organization).exists()
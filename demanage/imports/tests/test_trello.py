@@ -0,0 +1,27 @@
+import io
+import json
+
+from demanage.imports import trello
+
+from .factories import TRELLO_EXPORT
+
+
+def test_read_board_skips_other_data():
+    file = io.BytesIO(json.dumps(TRELLO_EXPORT).encode())
+
+    board, lists = trello.read_board(file)
+
+    assert board == {
+        "name": "Imported board",
+        "desc": "From Trello",
+        "permission_level": "private",
+    }
+    assert [item["id"] for item in lists] == ["l2", "l1"]
+
+
+def test_iter_cards_yields_open_cards():
+    file = io.BytesIO(json.dumps(TRELLO_EXPORT).encode())
+
+    cards = list(trello.iter_cards(file))
+
+    assert [card["id"] for card in cards] == ["c1", "c2", "c3", "c4"]
@@ -0,0 +1,72 @@
+"""
+Incremental parsing of Trello board export (JSON).
+
+Export is parsed with `ijson` event by event: only the requested items are
+built in memory, everything else (e.g. `actions`, usually most of the file) is
+skipped. Memory used is bounded by the largest single item.
+"""
+from typing import IO, Any, Dict, Iterable, Iterator, Tuple
+
+import ijson
+
+# Board fields read in the first pass (prefix -> name)
+BOARD_FIELDS = {
+    "name": "name",
+    "desc": "desc",
+    "prefs.permissionLevel": "permission_level",
+}
+
+
+def iter_items(file: IO[bytes], prefixes: Iterable[str]) -> Iterator[Tuple[str, Any]]:
+    """
+    Yield `(prefix, value)` of the values at the prefixes in one pass.
+
+    Prefix is `ijson` path, e.g. `lists.item` is each item of `lists` array.
+    """
+    prefixes = set(prefixes)
+    events = ijson.parse(file)
+    for prefix, event, value in events:
+        if prefix not in prefixes:
+            continue
+        if event in ("start_map", "start_array"):
+            yield prefix, _build(event, value, events)
+        elif event not in ("end_map", "end_array", "map_key"):
+            yield prefix, value
+
+
+def read_board(file: IO[bytes]) -> Tuple[Dict[str, Any], list]:
+    """
+    Return board fields and its (open) lists sorted by position.
+    """
+    board: Dict[str, Any] = {}
+    lists = []
+    for prefix, value in iter_items(file, [*BOARD_FIELDS, "lists.item"]):
+        if prefix == "lists.item":
+            if not value.get("closed"):
+                lists.append(value)
+        else:
+            board[BOARD_FIELDS[prefix]] = value
+    return board, lists
+
+
+def iter_cards(file: IO[bytes]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield open cards of the board.
+    """
+    for _, card in iter_items(file, ["cards.item"]):
+        if not card.get("closed"):
+            yield card
+
+
+def _build(event: str, value: Any, events: Iterator) -> Any:
+    builder = ijson.ObjectBuilder()
+    builder.event(event, value)
+    depth = 1
+    while depth:
+        _, event, value = next(events)
+        if event in ("start_map", "start_array"):
+            depth += 1
+        elif event in ("end_map", "end_array"):
+            depth -= 1
+        builder.event(event, value)
+    return builder.value
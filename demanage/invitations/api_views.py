@@ -2,9 +2,9 @@ from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db.utils import IntegrityError
 from rest_framework import decorators, exceptions, request, response, status, views
 from rest_framework.authentication import SessionAuthentication, TokenAuthentication
-from rest_framework.generics import get_object_or_404
 from rest_framework.permissions import IsAuthenticated
 
+from demanage.activity.log import record
 from demanage.invitations.api_exceptions import InviteError
 from demanage.invitations.api_permissions import InvitationPermission
 from demanage.invitations.api_serializers import InvitationSerializer
@@ -14,6 +14,7 @@ from demanage.invitations.tasks import send_invitation
 from demanage.members.api.serializers import MemberSerializer
 from demanage.members.models import Member
 from demanage.organizations.models import Organization
+from demanage.utils.resolvers import resolve_object
 
 
 class InviteAPIView(views.APIView):
@@ -40,13 +41,17 @@ class InviteAPIView(views.APIView):
         except IntegrityError:  # unique_together fail
             raise InviteError()
 
+        record("invitation.created", organization.pk, target=invitation.email)
+
         # Send invite, returns task
         task = send_invitation.delay(invitation.pk)  # noqa
 
         return response.Response(data=serializer.data, status=status.HTTP_201_CREATED)
 
     def get_organization(self) -> Organization:
-        organization = get_object_or_404(Organization, slug=self.kwargs["slug"])
+        organization = resolve_object(
+            self.request, Organization, slug=self.kwargs["slug"]
+        )
 
         # Public organizations are found
         if organization.public:
@@ -77,7 +82,9 @@ def invitation_join_view(request):
     if invitation_uid is None:
         raise exceptions.ParseError("invite query param is required!")
 
-    invitation = get_object_or_404(Invitation, uid=invitation_uid)
+    invitation = resolve_object(
+        request, Invitation, select_related=["organization", "user"], uid=invitation_uid
+    )
 
     if request.user.email != invitation.email:
         raise exceptions.ParseError(
@@ -101,6 +108,12 @@ def invitation_join_view(request):
 
     # Delete invitation
     invitation.delete()
+    record(
+        "invitation.accepted",
+        invitation.organization_id,
+        target=invitation.email,
+        data={"invited_by": invitation.user.username},
+    )
 
     # Return created member data
     serializer = MemberSerializer(instance=member)
@@ -10,6 +10,8 @@ View functionality include all others functionality together:
 """
 # Invite
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIRequestFactory
 
 from demanage.invitations.api_views import invitation_invite_view, invitation_join_view
@@ -34,6 +36,23 @@ def test_invitation_invite_201_post(api_rf, organization):
     assert response.data["email"] == "test@email.com"
 
 
+def test_invitation_invite_fetches_organization_once(api_rf, organization_factory):
+    organization = organization_factory(public=False)
+    request = api_rf.post("/mock-request/", data={"email": "test@email.com"})
+    request.user = organization.representative
+
+    with CaptureQueriesContext(connection) as captured:
+        response = invitation_invite_view(request, slug=organization.slug)
+
+    assert response.status_code == 201
+    organization_queries = [
+        q
+        for q in captured.captured_queries
+        if 'FROM "organizations_organization"' in q["sql"]
+    ]
+    assert len(organization_queries) == 1
+
+
 # Join
 
 
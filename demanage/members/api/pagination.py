@@ -1,5 +1,7 @@
 from rest_framework import pagination
 
+from demanage.pagination import KeysetPagination
+
 
 class MemberPagination(pagination.PageNumberPagination):
     """
@@ -10,3 +12,13 @@ class MemberPagination(pagination.PageNumberPagination):
     max_page_size = 50
     page_query_param = "page"
     page_size_query_param = "page_size"
+
+
+class MemberCursorPagination(KeysetPagination):
+    """
+    Response data cursor (keyset) pagination for member.
+    """
+
+    ordering = ("join_time", "id")
+    page_size = 20
+    max_page_size = 50
@@ -1,9 +1,10 @@
 from rest_framework import serializers
 
+from demanage.fieldsets import SparseFieldsetsMixin
 from demanage.members.models import Member
 
 
-class MemberSerializer(serializers.ModelSerializer):
+class MemberSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
     """
     Serializer to dict for member.
     """
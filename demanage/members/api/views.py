@@ -1,16 +1,24 @@
 from django.db.models.query import QuerySet
 from rest_framework import viewsets
-from rest_framework.generics import get_object_or_404
 
-from demanage.members.api.pagination import MemberPagination
+from demanage.fast_serializers import CompiledSerializerMixin
+from demanage.fieldsets import SparseFieldsetsViewMixin
+from demanage.members.api.pagination import MemberCursorPagination, MemberPagination
 from demanage.members.api.permissions import MemberPermission
 from demanage.members.api.serializers import MemberSerializer
 from demanage.members.models import Member
 from demanage.organizations.models import Organization
+from demanage.pagination import CursorPaginationMixin
 from demanage.throttles import DemanageBurstThrottle
+from demanage.utils.resolvers import resolve_object
 
 
-class MemberViewSet(viewsets.ReadOnlyModelViewSet):
+class MemberViewSet(
+    SparseFieldsetsViewMixin,
+    CompiledSerializerMixin,
+    CursorPaginationMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """
     ViewSet for member model.
     """
@@ -27,9 +35,11 @@ class MemberViewSet(viewsets.ReadOnlyModelViewSet):
 
     # Result correction
     pagination_class = MemberPagination
+    cursor_pagination_class = MemberCursorPagination
 
     def get_organization(self) -> Organization:
-        return get_object_or_404(Organization, slug=self.kwargs["slug"])
+        # Shared with the permission check (fetched once per request)
+        return resolve_object(self.request, Organization, slug=self.kwargs["slug"])
 
     def get_queryset(self) -> QuerySet:
         organization = self.get_organization()
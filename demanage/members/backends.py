@@ -0,0 +1,51 @@
+from typing import Set
+
+from demanage.members.models import (
+    MEMBER_PERMISSIONS,
+    MEMBERSHIP_CACHE_ATTRIBUTE,
+    Member,
+)
+from demanage.organizations.models import Organization
+
+
+class MembershipPermissionBackend:
+    """
+    Authorization backend answering membership permissions for organizations.
+
+    Member permissions (`MEMBER_PERMISSIONS`) are implied by `Member` rows and
+    are not stored as guardian object permissions. Organization IDs of the user
+    are fetched once and cached on the user object (per request) like
+    `ModelBackend` caches model permissions.
+    """
+
+    def authenticate(self, request, **credentials):
+        return None
+
+    def has_perm(self, user_obj, perm: str, obj=None) -> bool:
+        if "." not in perm and obj is not None:
+            perm = f"{obj._meta.app_label}.{perm}"
+        return perm in self.get_all_permissions(user_obj, obj)
+
+    def get_all_permissions(self, user_obj, obj=None) -> Set[str]:
+        if (
+            not isinstance(obj, Organization)
+            or not user_obj.is_active
+            or user_obj.is_anonymous
+        ):
+            return set()
+        if obj.pk in self.get_organization_ids(user_obj):
+            return set(MEMBER_PERMISSIONS)
+        return set()
+
+    def get_organization_ids(self, user_obj) -> Set[int]:
+        if not hasattr(user_obj, MEMBERSHIP_CACHE_ATTRIBUTE):
+            setattr(
+                user_obj,
+                MEMBERSHIP_CACHE_ATTRIBUTE,
+                set(
+                    Member.objects.filter(user=user_obj).values_list(
+                        "organization_id", flat=True
+                    )
+                ),
+            )
+        return getattr(user_obj, MEMBERSHIP_CACHE_ATTRIBUTE)
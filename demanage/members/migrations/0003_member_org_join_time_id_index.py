@@ -0,0 +1,20 @@
+# Generated by Django 3.1.13 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("members", "0002_auto_20211116_2105"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="member",
+            index=models.Index(
+                fields=["organization", "join_time", "id"],
+                name="members_org_join_time_id_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,75 @@
+# Generated by Django 3.1.13 on 2026-10-18 12:00
+
+from django.apps.registry import Apps
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.models.functions import Cast
+
+MEMBER_CODENAMES = ["view_organization", "view_member"]
+BATCH_SIZE = 5000
+
+
+def get_member_permissions(apps: Apps):
+    UserObjectPermission = apps.get_model("guardian", "UserObjectPermission")
+    Member = apps.get_model("members", "Member")
+
+    members = Member.objects.annotate(
+        organization_pk=Cast("organization_id", models.CharField())
+    ).filter(
+        user_id=models.OuterRef("user_id"),
+        organization_pk=models.OuterRef("object_pk"),
+    )
+    return UserObjectPermission.objects.filter(
+        content_type__app_label="organizations",
+        content_type__model="organization",
+        permission__codename__in=MEMBER_CODENAMES,
+    ).filter(models.Exists(members))
+
+
+def remove_member_permissions(apps: Apps, schema_editor: BaseDatabaseSchemaEditor):
+    """
+    Remove guardian rows implied by membership (`MembershipPermissionBackend`).
+    """
+    get_member_permissions(apps).delete()
+
+
+def assign_member_permissions(apps: Apps, schema_editor: BaseDatabaseSchemaEditor):
+    UserObjectPermission = apps.get_model("guardian", "UserObjectPermission")
+    Permission = apps.get_model("auth", "Permission")
+    Member = apps.get_model("members", "Member")
+
+    permissions = Permission.objects.filter(
+        content_type__app_label="organizations",
+        content_type__model="organization",
+        codename__in=MEMBER_CODENAMES,
+    )
+    grants = (
+        UserObjectPermission(
+            content_type_id=permission.content_type_id,
+            permission_id=permission.pk,
+            user_id=user_id,
+            object_pk=str(organization_id),
+        )
+        for user_id, organization_id in Member.objects.values_list(
+            "user_id", "organization_id"
+        ).iterator(chunk_size=BATCH_SIZE)
+        for permission in permissions
+    )
+    UserObjectPermission.objects.bulk_create(
+        grants, batch_size=BATCH_SIZE, ignore_conflicts=True
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "__latest__"),
+        ("contenttypes", "__latest__"),
+        ("guardian", "0002_generic_permissions_index"),
+        ("organizations", "0009_organization_filter_indexes"),
+        ("members", "0003_member_org_join_time_id_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_member_permissions, assign_member_permissions),
+    ]
@@ -6,7 +6,14 @@ from django.db.models.signals import post_delete
 from django.dispatch import receiver
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
-from guardian.shortcuts import assign_perm, remove_perm
+
+# Members can view organization they are in (detail) and it's members (granted
+# by `members.backends.MembershipPermissionBackend`, not stored)
+MEMBER_PERMISSIONS = [
+    "organizations.view_organization",
+    "organizations.view_member",
+]
+MEMBERSHIP_CACHE_ATTRIBUTE = "_membership_cache"
 
 
 class Member(models.Model):
@@ -34,6 +41,13 @@ class Member(models.Model):
         verbose_name_plural = "Members"
         ordering = ["join_time"]
         unique_together = [["user", "organization"]]
+        indexes = [
+            # Cursor pagination keyset (members are listed per organization)
+            models.Index(
+                fields=["organization", "join_time", "id"],
+                name="members_org_join_time_id_idx",
+            ),
+        ]
         default_permissions: List[str] = []
         permissions: List[Tuple[str, str]] = []
 
@@ -48,17 +62,10 @@ class Member(models.Model):
 
     def save(self, *args, **kwargs):
         """
-        Assign member user permissions for organization and member models/objects (post save).
-
-        - members can view organization they are in (detail)
-        - members can view members in organization they are in (detail/list)
+        Membership permissions of the (cached) user are changed.
         """
-        if self._state.adding:
-            super().save(*args, **kwargs)
-            assign_perm("organizations.view_organization", self.user, self.organization)
-            assign_perm("organizations.view_member", self.user, self.organization)
-        else:
-            super().save(*args, **kwargs)
+        super().save(*args, **kwargs)
+        clear_membership_cache(self)
 
     def __str__(self):
         return f"{self.user} in {self.organization}"
@@ -77,8 +84,11 @@ class Member(models.Model):
 @receiver(post_delete, sender=Member)
 def member_post_delete_receiver(sender: Type[Member], instance: Member, **kwargs):
     """
-    Remove organization/member assigned permission after member have been deleted.
+    Membership permissions of the (cached) user are changed.
     """
+    clear_membership_cache(instance)
+
 
-    remove_perm("organizations.view_organization", instance.user, instance.organization)
-    remove_perm("organizations.view_member", instance.user, instance.organization)
+def clear_membership_cache(member: Member) -> None:
+    if Member.user.is_cached(member):
+        member.user.__dict__.pop(MEMBERSHIP_CACHE_ATTRIBUTE, None)
@@ -6,7 +6,9 @@ Serializers are responsible for:
 - validating data when creating/updating instance
 """
 import pytest
+from rest_framework.renderers import JSONRenderer
 
+from demanage.fast_serializers import compile_serializer
 from demanage.members.api.serializers import MemberSerializer
 from demanage.members.models import Member
 from demanage.members.tests.factories import MemberFactory
@@ -34,3 +36,18 @@ def test_serialize_member_object_list(member_factory: MemberFactory):
     assert len(serializer.data) == 3
     assert serializer.data[0]["username"] == members[0].user.username
     assert "join_time" in serializer.data[0]
+
+
+def test_compiled_member_serializer_output_is_identical(
+    member_factory: MemberFactory,
+):
+    member_factory.create_batch(3)
+    members = Member.objects.order_by("id")
+
+    compiled = compile_serializer(MemberSerializer())
+    data = compiled.serialize(members.values(*compiled.paths))
+
+    renderer = JSONRenderer()
+    assert renderer.render(data) == renderer.render(
+        MemberSerializer(members, many=True).data
+    )
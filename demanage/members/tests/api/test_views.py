@@ -12,6 +12,7 @@ from django.contrib.auth import get_user_model
 from django.core.handlers.wsgi import WSGIRequest
 from django.db.transaction import TransactionManagementError
 from django.test import RequestFactory
+from django.urls import reverse
 from pytest import MonkeyPatch
 
 from demanage.members.api.serializers import MemberSerializer
@@ -446,3 +447,68 @@ def test_burst_throttle_7_request_per_second(
         member_retrive_view(
             request_get, slug=member.organization.slug, username=member.user.username
         )
+
+
+def test_member_cursor_pagination_2_pages(
+    mock_permissions,
+    rf: RequestFactory,
+    organization: Organization,
+    member_factory: MemberFactory,
+):
+    for _ in range(25):
+        member_factory(organization=organization)
+
+    request = rf.get("/mocked-request/?pagination=cursor")
+    response = member_list_view(request, slug=organization.slug)
+
+    assert "count" not in response.data
+    assert len(response.data["results"]) == 20
+    assert response.data["previous"] is None
+
+    request = rf.get(response.data["next"])
+    response = member_list_view(request, slug=organization.slug)
+
+    assert len(response.data["results"]) == 5
+    assert response.data["next"] is None
+    assert response.data["previous"] is not None
+
+
+def test_member_list_sparse_fieldsets(
+    mock_permissions,
+    rf: RequestFactory,
+    organization: Organization,
+    member_factory: MemberFactory,
+):
+    member = member_factory(organization=organization)
+
+    request = rf.get("/mocked-request/", {"fields": "username"})
+    response = member_list_view(request, slug=organization.slug)
+
+    assert response.data["results"] == [{"username": member.user.username}]
+
+
+def organization_queries(captured) -> list:
+    return [q for q in captured if 'FROM "organizations_organization"' in q["sql"]]
+
+
+def test_member_list_fetches_organization_once(
+    api_client,
+    organization_factory,
+    member_factory: MemberFactory,
+    django_assert_max_num_queries,
+):
+    organization = organization_factory(public=True)
+    member_factory.create_batch(3, organization=organization)
+    url = reverse("organizations:members:list", kwargs={"slug": organization.slug})
+
+    # Organization, count and page (with usernames)
+    with django_assert_max_num_queries(3) as captured:
+        response = api_client.get(url)
+
+    assert response.status_code == 200
+    assert len(organization_queries(captured.captured_queries)) == 1
+
+
+def test_member_list_of_missing_organization_is_not_found(api_client):
+    url = reverse("organizations:members:list", kwargs={"slug": "missing"})
+    assert api_client.get(url).status_code == 404
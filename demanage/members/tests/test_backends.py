@@ -0,0 +1,58 @@
+import pytest
+from django.contrib.auth.models import AnonymousUser
+
+from demanage.members.backends import MembershipPermissionBackend
+from demanage.members.models import Member
+from demanage.organizations.models import OrganizationUserObjectPermission
+from demanage.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+def test_member_has_membership_permissions(member: Member):
+    user = User.objects.get(pk=member.user.pk)
+
+    assert user.has_perm("organizations.view_organization", member.organization)
+    assert user.has_perm("view_member", member.organization)
+    assert not user.has_perm("organizations.kick_member", member.organization)
+
+
+def test_membership_permissions_are_not_stored(member: Member):
+    permissions = OrganizationUserObjectPermission.objects.filter(user=member.user)
+    assert not permissions.exists()
+
+
+def test_memberships_are_fetched_once_per_user(
+    organization_factory, member_factory, django_assert_num_queries
+):
+    organizations = organization_factory.create_batch(3)
+    member = member_factory(organization=organizations[0])
+    user = User.objects.get(pk=member.user.pk)
+    backend = MembershipPermissionBackend()
+
+    with django_assert_num_queries(1):
+        assert [
+            backend.has_perm(user, "organizations.view_member", o)
+            for o in organizations
+        ] == [True, False, False]
+
+
+def test_membership_cache_is_cleared_on_join_and_leave(
+    organization_factory, user: User
+):
+    organization = organization_factory()
+    backend = MembershipPermissionBackend()
+    assert not backend.has_perm(user, "organizations.view_member", organization)
+
+    member = Member.objects.create(user=user, organization=organization)
+    assert backend.has_perm(user, "organizations.view_member", organization)
+
+    member.delete()
+    assert not backend.has_perm(user, "organizations.view_member", organization)
+
+
+def test_anonymous_user_has_no_membership_permissions(organization):
+    backend = MembershipPermissionBackend()
+    assert not backend.has_perm(
+        AnonymousUser(), "organizations.view_organization", organization
+    )
@@ -6,3 +6,9 @@ from demanage.organizations.models import Organization
 @admin.register(Organization)
 class OrganizationAdmin(admin.ModelAdmin):
     prepopulated_fields = {"slug": ["name"]}
+    readonly_fields = [
+        "boards_count",
+        "public_boards_count",
+        "members_count",
+        "invitations_count",
+    ]
@@ -0,0 +1,22 @@
+from django_filters import rest_framework as filters
+
+from demanage.organizations.models import Organization
+
+
+class OrganizationFilter(filters.FilterSet):
+    """
+    Filter set for organization API (`?location=<country code>&verified=true`).
+    """
+
+    location = filters.CharFilter(method="filter_location")
+
+    class Meta:
+        model = Organization
+        fields = {
+            "verified": ["exact"],
+            "public": ["exact"],
+        }
+
+    def filter_location(self, queryset, name, value):
+        # Country codes are stored upper case (exact lookup uses the index)
+        return queryset.filter(location=value.upper())
@@ -0,0 +1,11 @@
+from demanage.pagination import KeysetPagination
+
+
+class OrganizationCursorPagination(KeysetPagination):
+    """
+    Response data cursor (keyset) pagination for organization.
+    """
+
+    ordering = ("name", "id")
+    page_size = 20
+    max_page_size = 50
@@ -0,0 +1,24 @@
+from django_countries.serializers import CountryFieldMixin
+from rest_framework import serializers
+
+from demanage.organizations.models import Organization
+
+
+class OrganizationSerializer(CountryFieldMixin, serializers.ModelSerializer):
+    """
+    Serializer to dict for organization.
+    """
+
+    class Meta:
+        model = Organization
+        fields = [
+            "slug",
+            "name",
+            "public",
+            "verified",
+            "website",
+            "location",
+            "public_boards_count",
+            "members_count",
+        ]
+        read_only_fields = fields
@@ -0,0 +1,70 @@
+from django.db.models.query import QuerySet
+from django_filters.rest_framework.backends import DjangoFilterBackend
+from rest_framework import permissions, viewsets
+from rest_framework.decorators import action
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from demanage.organizations.api.filters import OrganizationFilter
+from demanage.organizations.api.pagination import OrganizationCursorPagination
+from demanage.organizations.api.serializers import OrganizationSerializer
+from demanage.organizations.cache import cached_public_response
+from demanage.organizations.models import Organization
+
+SUGGEST_MAX_RESULTS = 10
+
+
+class OrganizationViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    ViewSet for organization.
+
+    Filterable by `location` (country code), `verified` and `public`, lists of
+    anonymous users are cached.
+    """
+
+    # Queryset and serialization
+    queryset = Organization.objects.all()
+    serializer_class = OrganizationSerializer
+
+    # URLconf
+    lookup_field = "slug"
+    lookup_url_kwarg = "slug"
+    lookup_value_regex = r"[-a-zA-Z0-9_]+"  # slug regex
+
+    # Authorization
+    permission_classes = [permissions.AllowAny]
+
+    # Result correction
+    pagination_class = OrganizationCursorPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = OrganizationFilter
+
+    def get_queryset(self) -> QuerySet:
+        """
+        1. Return all public organizations.
+        2. Return organizations where user is representative or member.
+        """
+        return Organization.objects.visible_to(self.request.user)
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        build = super().list
+        return cached_public_response(request, lambda: build(request, *args, **kwargs))
+
+    @action(detail=False, methods=["GET"], url_path="suggest", url_name="suggest")
+    def suggest(self, request: Request) -> Response:
+        """
+        Typeahead of organization names (`?q=` name prefix).
+
+        Prefix lookup is backed by trigram GIN index on `UPPER(name)`.
+        """
+        query = request.query_params.get("q", "").strip()[:50]
+        if not query:
+            return Response([])
+
+        organizations = (
+            self.get_queryset()
+            .filter(name__istartswith=query)
+            .order_by("name")
+            .values("slug", "name")[:SUGGEST_MAX_RESULTS]
+        )
+        return Response(list(organizations))
@@ -5,3 +5,6 @@ from django.utils.translation import gettext_lazy as _
 class OrganizationsConfig(AppConfig):
     name = "demanage.organizations"
     verbose_name = _("Organizations")
+
+    def ready(self):
+        import demanage.organizations.signals  # noqa F401
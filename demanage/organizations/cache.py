@@ -0,0 +1,67 @@
+"""
+Versioned cache of the public organizations listing (anonymous users).
+
+Rendered page fragments, the number of public organizations and API list
+responses are keyed by the listing version, any organization save or delete
+bumps it (see `signals`).
+"""
+import hashlib
+from typing import Callable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from demanage.utils.cache import bump_version, get_versions
+
+PUBLIC_LIST_VERSION_KEY = "organizations:version:public-list"
+PUBLIC_COUNT_KEY = "organizations:public-count:{version}"
+PUBLIC_RESPONSE_KEY = "organizations:response:{version}:{digest}"
+
+
+def get_public_list_version() -> int:
+    return get_versions([PUBLIC_LIST_VERSION_KEY])[PUBLIC_LIST_VERSION_KEY]
+
+
+def bump_public_list() -> None:
+    bump_version(PUBLIC_LIST_VERSION_KEY)
+
+
+class PublicListPaginator(Paginator):
+    """
+    Paginator of public organizations with cached (versioned) count.
+    """
+
+    @cached_property
+    def count(self) -> int:
+        key = PUBLIC_COUNT_KEY.format(version=get_public_list_version())
+        count = cache.get(key)
+        if count is None:
+            count = super().count
+            cache.set(key, count, settings.ORGANIZATIONS_LIST_CACHE_TIMEOUT)
+        return count
+
+
+def cached_public_response(request: Request, build: Callable[[], Response]) -> Response:
+    """
+    Return cached response data of anonymous request or build (and cache) it.
+    """
+    if request.user.is_authenticated:
+        return build()
+
+    digest = hashlib.md5(request.get_full_path().encode("utf-8")).hexdigest()
+    key = PUBLIC_RESPONSE_KEY.format(version=get_public_list_version(), digest=digest)
+    data = cache.get(key)
+    if data is not None:
+        response = Response(data)
+        response["X-Cache"] = "HIT"
+        return response
+
+    response = build()
+    if response.status_code == 200:
+        cache.set(key, response.data, settings.ORGANIZATIONS_LIST_CACHE_TIMEOUT)
+    response["X-Cache"] = "MISS"
+    return response
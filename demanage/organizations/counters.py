@@ -0,0 +1,72 @@
+"""
+Denormalized organization counters (boards, public boards, members, pending
+invitations).
+
+Counters are changed atomically with `F()` expressions in the save and delete
+paths (see `demanage.organizations.signals`), writes bypassing signals (bulk
+writes) recount affected organizations. Drift is repaired periodically by
+`reconcile_organization_counters` task. Counters are written without signals
+so the public organizations listing cache is invalidated here.
+"""
+from typing import Iterable, Optional
+
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Greatest
+
+from . import cache
+from .models import COUNTERS, Organization
+
+
+def change(organization_id: int, **deltas: int) -> None:
+    """
+    Add the deltas to the organization counters (e.g. `boards_count=1`).
+
+    Counters don't go below zero (drift is repaired by reconciliation).
+    """
+    deltas = {name: delta for name, delta in deltas.items() if delta}
+    if deltas:
+        Organization.objects.filter(pk=organization_id).update(
+            **{name: Greatest(F(name) + delta, 0) for name, delta in deltas.items()}
+        )
+        cache.bump_public_list()
+
+
+def reconcile(organization_ids: Optional[Iterable[int]] = None) -> int:
+    """
+    Recount drifted counters of the organizations (all by default).
+
+    Return number of repaired organizations.
+    """
+    from demanage.boards.models import Board
+    from demanage.invitations.models import Invitation
+    from demanage.members.models import Member
+
+    def subquery(queryset):
+        counted = (
+            queryset.filter(organization=OuterRef("pk"))
+            .order_by()
+            .values("organization")
+            .annotate(count=Count("*"))
+            .values("count")
+        )
+        return Coalesce(Subquery(counted, output_field=IntegerField()), 0)
+
+    organizations = Organization.objects.annotate(
+        actual_boards_count=subquery(Board.objects.all()),
+        actual_public_boards_count=subquery(Board.objects.filter(public=True)),
+        actual_members_count=subquery(Member.objects.all()),
+        actual_invitations_count=subquery(Invitation.objects.all()),
+    ).exclude(**{name: F(f"actual_{name}") for name in COUNTERS})
+    if organization_ids is not None:
+        organizations = organizations.filter(pk__in=list(organization_ids))
+
+    repaired = 0
+    actual_names = [f"actual_{name}" for name in COUNTERS]
+    for actual in organizations.values("pk", *actual_names):
+        Organization.objects.filter(pk=actual["pk"]).update(
+            **{name: actual[f"actual_{name}"] for name in COUNTERS}
+        )
+        repaired += 1
+    if repaired:
+        cache.bump_public_list()
+    return repaired
@@ -0,0 +1,87 @@
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+
+from demanage.members.models import Member
+from demanage.organizations.cache import bump_public_list
+from demanage.organizations.models import Organization
+from demanage.organizations.views import organization_list_view
+from demanage.users.models import User
+from demanage.utils.benchmark import format_result, measure
+
+PREFIX = "bench-organization-list"
+
+
+class Command(BaseCommand):
+    """
+    Measure organization list page for anonymous (cold and cached fragments)
+    and authenticated member users.
+
+    Example: `manage.py bench_organization_list --organizations 100000`
+    """
+
+    help = "Benchmark organization list view on seeded organizations."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--organizations", type=int, default=100000)
+        parser.add_argument("--memberships", type=int, default=50)
+        parser.add_argument("--page", type=int, default=1)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(
+        self,
+        *args,
+        organizations: int,
+        memberships: int,
+        page: int,
+        repeat: int,
+        **options,
+    ):
+        member = self.seed(organizations, memberships)
+        factory = RequestFactory()
+
+        def get(user):
+            request = factory.get("/organizations/", {"page": page})
+            request.user = user
+            response = organization_list_view(request)
+            response.render()
+            assert response.status_code == 200, response.status_code
+
+        def get_anonymous_cold():
+            bump_public_list()
+            get(AnonymousUser())
+
+        self.stdout.write(f"{Organization.objects.count()} organizations, page {page}")
+        for name, func in [
+            ("anonymous (cold)", get_anonymous_cold),
+            ("anonymous (cached)", lambda: get(AnonymousUser())),
+            (f"member of {memberships}", lambda: get(member)),
+        ]:
+            self.stdout.write(format_result(name, measure(func, repeat)))
+
+    def seed(self, count: int, memberships: int, batch_size: int = 5000) -> User:
+        existing = Organization.objects.filter(slug__startswith=PREFIX).count()
+        for offset in range(existing, count, batch_size):
+            numbers = range(offset, min(offset + batch_size, count))
+            users = User.objects.bulk_create(
+                User(username=f"{PREFIX}-{number}") for number in numbers
+            )
+            Organization.objects.bulk_create(
+                Organization(
+                    name=f"{PREFIX} {number:07d}",
+                    slug=f"{PREFIX}-{number}",
+                    public=bool(number % 2),
+                    representative=user,
+                )
+                for number, user in zip(numbers, users)
+            )
+
+        member, _ = User.objects.get_or_create(username=f"{PREFIX}-member")
+        Member.objects.filter(user=member).delete()
+        Member.objects.bulk_create(
+            Member(user=member, organization=organization)
+            for organization in Organization.objects.filter(
+                slug__startswith=PREFIX
+            ).order_by("?")[:memberships]
+        )
+        return member
@@ -0,0 +1,21 @@
+# Generated by Django 3.1.13 on 2026-10-18 12:00
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("organizations", "0005_auto_20211116_2105"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        # Expression index matches `name__istartswith` (UPPER("name"::text) LIKE ...)
+        migrations.RunSQL(
+            "CREATE INDEX organizations_name_trgm_idx ON organizations_organization "
+            "USING gin (UPPER(name::text) gin_trgm_ops);",
+            "DROP INDEX IF EXISTS organizations_name_trgm_idx;",
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 3.1.13 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("organizations", "0006_organization_name_trigram_index"),
+        ("boards", "0007_list_card"),
+        ("members", "0003_member_org_join_time_id_index"),
+        ("invitations", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="organization",
+            name="boards_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Boards"
+            ),
+        ),
+        migrations.AddField(
+            model_name="organization",
+            name="public_boards_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Public boards"
+            ),
+        ),
+        migrations.AddField(
+            model_name="organization",
+            name="members_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Members"
+            ),
+        ),
+        migrations.AddField(
+            model_name="organization",
+            name="invitations_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Pending invitations"
+            ),
+        ),
+        # Initial counters
+        migrations.RunSQL(
+            sql="""
+            UPDATE organizations_organization organization SET
+                boards_count = (
+                    SELECT COUNT(*) FROM boards_board board
+                    WHERE board.organization_id = organization.id
+                ),
+                public_boards_count = (
+                    SELECT COUNT(*) FROM boards_board board
+                    WHERE board.organization_id = organization.id AND board.public
+                ),
+                members_count = (
+                    SELECT COUNT(*) FROM members_member member
+                    WHERE member.organization_id = organization.id
+                ),
+                invitations_count = (
+                    SELECT COUNT(*) FROM invitations_invitation invitation
+                    WHERE invitation.organization_id = organization.id
+                );
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 3.1.13 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("organizations", "0007_organization_counters"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="organization",
+            index=models.Index(
+                condition=models.Q(public=True),
+                fields=["name"],
+                name="organizations_public_name_idx",
+            ),
+        ),
+    ]
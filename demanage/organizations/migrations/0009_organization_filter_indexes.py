@@ -0,0 +1,29 @@
+# Generated by Django 3.1.13 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("organizations", "0008_organization_public_name_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="organization",
+            index=models.Index(
+                condition=models.Q(public=True),
+                fields=["location", "name", "id"],
+                name="organizations_public_loc_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="organization",
+            index=models.Index(
+                condition=models.Q(("public", True), ("verified", True)),
+                fields=["name", "id"],
+                name="organizations_verified_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,102 @@
+# Generated by Django 3.1.13 on 2026-10-18 12:00
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+COPY_ORGANIZATION_PERMISSIONS = """
+INSERT INTO organizations_organizationuserobjectpermission
+    (user_id, permission_id, content_object_id)
+SELECT p.user_id, p.permission_id, o.id
+FROM guardian_userobjectpermission p
+JOIN django_content_type ct ON ct.id = p.content_type_id
+JOIN organizations_organization o ON p.object_pk = o.id::text
+WHERE ct.app_label = 'organizations' AND ct.model = 'organization'
+ON CONFLICT DO NOTHING;
+
+DELETE FROM guardian_userobjectpermission p
+USING django_content_type ct
+WHERE ct.id = p.content_type_id
+    AND ct.app_label = 'organizations'
+    AND ct.model = 'organization';
+"""
+
+RESTORE_ORGANIZATION_PERMISSIONS = """
+INSERT INTO guardian_userobjectpermission
+    (user_id, permission_id, content_type_id, object_pk)
+SELECT p.user_id, p.permission_id, ct.id, p.content_object_id::text
+FROM organizations_organizationuserobjectpermission p
+CROSS JOIN django_content_type ct
+WHERE ct.app_label = 'organizations' AND ct.model = 'organization'
+ON CONFLICT DO NOTHING;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("guardian", "0002_generic_permissions_index"),
+        # Membership rows are removed from the generic table first
+        ("members", "0004_remove_member_object_permissions"),
+        ("organizations", "0009_organization_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OrganizationUserObjectPermission",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "content_object",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="user_permissions",
+                        to="organizations.organization",
+                        verbose_name="Organization",
+                    ),
+                ),
+                (
+                    "permission",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="auth.permission",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Organization user permission",
+                "verbose_name_plural": "Organization user permissions",
+                "abstract": False,
+                "default_permissions": [],
+                "unique_together": {("user", "permission", "content_object")},
+            },
+        ),
+        migrations.AddIndex(
+            model_name="organizationuserobjectpermission",
+            index=models.Index(
+                fields=["content_object", "permission"],
+                name="organizations_userperm_org_idx",
+            ),
+        ),
+        migrations.RunSQL(
+            COPY_ORGANIZATION_PERMISSIONS, RESTORE_ORGANIZATION_PERMISSIONS
+        ),
+    ]
@@ -1,9 +1,47 @@
 from typing import List
 
 from django.db import models
+from django.db.models import Q
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 from django_countries.fields import CountryField
+from guardian.models import UserObjectPermissionBase
+
+from demanage.members.models import Member
+
+
+class OrganizationQuerySet(models.QuerySet):
+    def public(self) -> "OrganizationQuerySet":
+        return self.filter(public=True)
+
+    def for_user(self, user) -> "OrganizationQuerySet":
+        """
+        Organizations where user is representative or member.
+        """
+        memberships = Member.objects.filter(user=user).values("organization_id")
+        return self.filter(Q(representative=user) | Q(pk__in=memberships))
+
+    def visible_to(self, user) -> "OrganizationQuerySet":
+        """
+        Public organizations and organizations where user is representative or
+        member (only public ones for anonymous user).
+        """
+        if not user.is_authenticated:
+            return self.public()
+
+        memberships = Member.objects.filter(user=user).values("organization_id")
+        return self.filter(
+            Q(public=True) | Q(representative=user) | Q(pk__in=memberships)
+        )
+
+
+# Denormalized counters (see `counters` module)
+COUNTERS = [
+    "boards_count",
+    "public_boards_count",
+    "members_count",
+    "invitations_count",
+]
 
 
 class Organization(models.Model):
@@ -21,16 +59,63 @@ class Organization(models.Model):
         on_delete=models.CASCADE,
         related_name="organization",
     )
+    # Denormalized counters (see `counters` module)
+    boards_count = models.PositiveIntegerField(
+        _("Boards"), default=0, editable=False
+    )
+    public_boards_count = models.PositiveIntegerField(
+        _("Public boards"), default=0, editable=False
+    )
+    members_count = models.PositiveIntegerField(
+        _("Members"), default=0, editable=False
+    )
+    invitations_count = models.PositiveIntegerField(
+        _("Pending invitations"), default=0, editable=False
+    )
+
+    objects = OrganizationQuerySet.as_manager()
 
     def clean(self):
         pass
 
+    def save(self, *args, **kwargs):
+        """
+        Counters are changed by `F()` updates only, stale counters of the instance
+        are not written back (unless the fields are updated explicitly).
+        """
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in COUNTERS
+            ]
+        super().save(*args, **kwargs)
+
     class Meta:
         verbose_name = _("Organization")
         verbose_name_plural = _("Organizations")
         ordering = ["name"]
         get_latest_by = "id"
         unique_together: List[str] = []
+        indexes = [
+            # Public organizations listing (ordered by name)
+            models.Index(
+                fields=["name"],
+                name="organizations_public_name_idx",
+                condition=Q(public=True),
+            ),
+            # API filters on public organizations (keyset ordered by name, id)
+            models.Index(
+                fields=["location", "name", "id"],
+                name="organizations_public_loc_idx",
+                condition=Q(public=True),
+            ),
+            models.Index(
+                fields=["name", "id"],
+                name="organizations_verified_idx",
+                condition=Q(public=True, verified=True),
+            ),
+        ]
         default_permissions = ["add", "change", "delete", "view"]
         # Organization level permissions
         permissions = [
@@ -44,3 +129,28 @@ class Organization(models.Model):
 
     def get_absolute_url(self):
         return reverse("organizations:detail", kwargs={"slug": self.slug})
+
+
+class OrganizationUserObjectPermission(UserObjectPermissionBase):
+    """
+    Model representing user object permission on the organization (direct
+    foreign key instead of guardian's generic `object_pk`).
+    """
+
+    content_object = models.ForeignKey(
+        verbose_name=_("Organization"),
+        to=Organization,
+        on_delete=models.CASCADE,
+        related_name="user_permissions",
+    )
+
+    class Meta(UserObjectPermissionBase.Meta):
+        verbose_name = _("Organization user permission")
+        verbose_name_plural = _("Organization user permissions")
+        indexes = [
+            models.Index(
+                fields=["content_object", "permission"],
+                name="organizations_userperm_org_idx",
+            ),
+        ]
+        default_permissions = []
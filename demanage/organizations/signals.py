@@ -0,0 +1,83 @@
+"""
+Signal receivers keeping organization counters up to date (see `counters`) and
+invalidating public organizations listing cache (see `cache`).
+"""
+from typing import Type
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from demanage.boards.models import Board
+from demanage.invitations.models import Invitation
+from demanage.members.models import Member
+
+from . import cache, counters
+from .models import Organization
+
+
+@receiver(post_save, sender=Board)
+def board_post_save_receiver(
+    sender: Type[Board], instance: Board, created: bool, update_fields=None, **kwargs
+):
+    if created:
+        counters.change(
+            instance.organization_id,
+            boards_count=1,
+            public_boards_count=int(instance.public),
+        )
+        return
+
+    if update_fields is not None and "public" not in update_fields:
+        return
+
+    saved_public = getattr(instance, "saved_public", None)
+    if saved_public is not None and saved_public != instance.public:
+        counters.change(
+            instance.organization_id,
+            public_boards_count=1 if instance.public else -1,
+        )
+
+
+@receiver(post_delete, sender=Board)
+def board_post_delete_receiver(sender: Type[Board], instance: Board, **kwargs):
+    counters.change(
+        instance.organization_id,
+        boards_count=-1,
+        public_boards_count=-int(instance.public),
+    )
+
+
+@receiver(post_save, sender=Member)
+def member_post_save_receiver(
+    sender: Type[Member], instance: Member, created: bool, **kwargs
+):
+    if created:
+        counters.change(instance.organization_id, members_count=1)
+
+
+@receiver(post_delete, sender=Member)
+def member_post_delete_receiver(sender: Type[Member], instance: Member, **kwargs):
+    counters.change(instance.organization_id, members_count=-1)
+
+
+@receiver(post_save, sender=Invitation)
+def invitation_post_save_receiver(
+    sender: Type[Invitation], instance: Invitation, created: bool, **kwargs
+):
+    if created:
+        counters.change(instance.organization_id, invitations_count=1)
+
+
+@receiver(post_delete, sender=Invitation)
+def invitation_post_delete_receiver(
+    sender: Type[Invitation], instance: Invitation, **kwargs
+):
+    counters.change(instance.organization_id, invitations_count=-1)
+
+
+@receiver(post_save, sender=Organization)
+@receiver(post_delete, sender=Organization)
+def organization_list_cache_receiver(
+    sender: Type[Organization], instance: Organization, **kwargs
+):
+    cache.bump_public_list()
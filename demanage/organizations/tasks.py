@@ -0,0 +1,13 @@
+from config import celery_app
+
+from . import counters
+
+
+@celery_app.task()
+def reconcile_organization_counters():
+    """
+    Repair drift of denormalized organization counters.
+
+    Return number of repaired organizations.
+    """
+    return counters.reconcile()
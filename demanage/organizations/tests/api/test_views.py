@@ -0,0 +1,96 @@
+import pytest
+from django.urls import reverse
+
+from demanage.organizations.tests.factories import OrganizationFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_suggest_public_organization_names_by_prefix(api_client):
+    OrganizationFactory(name="Acme corp", public=True)
+    OrganizationFactory(name="Acme private", public=False)
+    OrganizationFactory(name="Globex", public=True)
+
+    response = api_client.get(reverse("api:organization-suggest"), {"q": "acm"})
+
+    assert response.status_code == 200
+    assert response.data == [{"slug": "acme-corp", "name": "Acme corp"}]
+
+
+def test_suggest_includes_private_organization_of_member(api_client_factory, member):
+    member.organization.public = False
+    member.organization.save()
+    api_client = api_client_factory(member.user)
+
+    response = api_client.get(
+        reverse("api:organization-suggest"), {"q": member.organization.name[:3]}
+    )
+
+    assert member.organization.slug in [o["slug"] for o in response.data]
+
+
+def test_suggest_empty_query(api_client):
+    response = api_client.get(reverse("api:organization-suggest"))
+    assert response.data == []
+
+
+def test_list_public_organizations_filtered(api_client):
+    OrganizationFactory(name="Acme", public=True, location="US", verified=True)
+    OrganizationFactory(name="Globex", public=True, location="US", verified=False)
+    OrganizationFactory(name="Initech", public=True, location="DE", verified=True)
+    OrganizationFactory(name="Private", public=False, location="US", verified=True)
+
+    response = api_client.get(
+        reverse("api:organization-list"), {"location": "us", "verified": "true"}
+    )
+
+    assert response.status_code == 200
+    assert [o["name"] for o in response.data["results"]] == ["Acme"]
+    assert response.data["results"][0]["location"] == "US"
+
+
+def test_list_organizations_keyset_pages(api_client):
+    OrganizationFactory.create_batch(25, public=True)
+
+    response = api_client.get(reverse("api:organization-list"))
+    first_page = response.data["results"]
+    response = api_client.get(response.data["next"])
+    second_page = response.data["results"]
+
+    assert len(first_page) == 20
+    assert len({o["slug"] for o in first_page + second_page}) == 25
+    assert response.data["next"] is None
+
+
+def test_list_includes_private_organization_of_member(api_client_factory, member):
+    member.organization.public = False
+    member.organization.save()
+    api_client = api_client_factory(member.user)
+
+    response = api_client.get(reverse("api:organization-list"))
+
+    assert member.organization.slug in [o["slug"] for o in response.data["results"]]
+
+
+def test_retrieve_private_organization_is_not_found(api_client):
+    organization = OrganizationFactory(public=False)
+
+    response = api_client.get(
+        reverse("api:organization-detail", kwargs={"slug": organization.slug})
+    )
+
+    assert response.status_code == 404
+
+
+def test_anonymous_list_is_cached_until_organization_changes(api_client):
+    organization = OrganizationFactory(public=True)
+    url = reverse("api:organization-list")
+
+    assert api_client.get(url)["X-Cache"] == "MISS"
+    assert api_client.get(url)["X-Cache"] == "HIT"
+
+    organization.name = "Renamed"
+    organization.save()
+    response = api_client.get(url)
+    assert response["X-Cache"] == "MISS"
+    assert response.data["results"][0]["name"] == "Renamed"
@@ -0,0 +1,93 @@
+import pytest
+
+from demanage.boards.models import Board
+from demanage.boards.tests.factories import BoardFactory
+from demanage.invitations.tests.factories import InvitationFactory
+from demanage.members.tests.factories import MemberFactory
+from demanage.organizations import cache, counters
+from demanage.organizations.models import Organization
+from demanage.organizations.tasks import reconcile_organization_counters
+
+pytestmark = pytest.mark.django_db
+
+
+def test_board_counters(organization: Organization):
+    board = BoardFactory(organization=organization, public=True)
+    BoardFactory(organization=organization, public=False)
+    organization.refresh_from_db()
+    assert organization.boards_count == 2
+    assert organization.public_boards_count == 1
+
+    board.public = False
+    board.save()
+    organization.refresh_from_db()
+    assert organization.public_boards_count == 0
+
+    board.delete()
+    organization.refresh_from_db()
+    assert organization.boards_count == 1
+
+
+def test_public_board_counter_with_deferred_public_flag(organization: Organization):
+    board = BoardFactory(organization=organization, public=True)
+
+    deferred = Board.objects.only("id", "title").get(pk=board.pk)
+    deferred.public = False
+    deferred.save()
+
+    organization.refresh_from_db()
+    assert organization.public_boards_count == 0
+
+
+def test_counter_change_invalidates_public_list(organization: Organization):
+    version = cache.get_public_list_version()
+
+    counters.change(organization.pk, boards_count=1)
+
+    assert cache.get_public_list_version() != version
+
+
+def test_saving_stale_organization_keeps_counters(organization: Organization):
+    stale = Organization.objects.get(pk=organization.pk)
+    BoardFactory(organization=organization)
+
+    stale.name = "Renamed"
+    stale.save()
+
+    organization.refresh_from_db()
+    assert organization.name == "Renamed"
+    assert organization.boards_count == 1
+
+
+def test_member_and_invitation_counters(organization: Organization):
+    member = MemberFactory(organization=organization)
+    invitation = InvitationFactory(organization=organization)
+    organization.refresh_from_db()
+    assert organization.members_count == 1
+    assert organization.invitations_count == 1
+
+    member.delete()
+    invitation.delete()
+    organization.refresh_from_db()
+    assert organization.members_count == 0
+    assert organization.invitations_count == 0
+
+
+def test_counters_do_not_go_below_zero(organization: Organization):
+    counters.change(organization.pk, members_count=-1)
+    organization.refresh_from_db()
+    assert organization.members_count == 0
+
+
+def test_reconcile_repairs_drift(organization: Organization):
+    BoardFactory.create_batch(3, organization=organization, public=True)
+    Organization.objects.filter(pk=organization.pk).update(
+        boards_count=10, public_boards_count=0
+    )
+
+    repaired = reconcile_organization_counters()
+
+    organization.refresh_from_db()
+    assert repaired == 1
+    assert organization.boards_count == 3
+    assert organization.public_boards_count == 3
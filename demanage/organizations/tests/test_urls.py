@@ -56,3 +56,18 @@ def test_delete_organization_url(organization: Organization):
         reverse("organizations:delete", kwargs={"slug": organization.slug})
         == f"/o/{organization.slug}/delete/"
     )
+
+
+def test_organization_suggest():
+    assert reverse("api:organization-suggest") == "/api/organizations/suggest/"
+
+
+def test_api_organization_list():
+    assert reverse("api:organization-list") == "/api/organizations/"
+
+
+def test_api_organization_detail(organization: Organization):
+    assert (
+        reverse("api:organization-detail", kwargs={"slug": organization.slug})
+        == f"/api/organizations/{organization.slug}/"
+    )
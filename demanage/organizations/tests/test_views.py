@@ -535,6 +535,52 @@ class TestListView:
         - objects - list of objects
         """
         request = rf.get("/dsjfls")
+        request.user = AnonymousUser()
         response = organization_list_view(request)
         assert response.status_code == HttpResponse.status_code
         assert "organizations/organization_list.html" in response.template_name
+
+    def test_anonymous_user_lists_public_organizations_paginated(
+        self, rf: RequestFactory, organization_factory: OrganizationFactory
+    ):
+        public = organization_factory.create_batch(21, public=True)
+        organization_factory(public=False)
+        request = rf.get("/organizations/")
+        request.user = AnonymousUser()
+
+        response = organization_list_view(request)
+
+        assert response.context_data["paginator"].count == 21
+        assert list(response.context_data["object_list"]) == sorted(
+            public, key=lambda organization: organization.name
+        )[:20]
+
+    def test_user_lists_represented_and_membered_organizations(
+        self,
+        rf: RequestFactory,
+        organization_factory: OrganizationFactory,
+        member_factory,
+    ):
+        member = member_factory()
+        organization_factory(public=True)  # not member
+        request = rf.get("/organizations/")
+        request.user = member.user
+
+        response = organization_list_view(request)
+
+        assert list(response.context_data["object_list"]) == [member.organization]
+
+    def test_public_list_fragment_is_invalidated(
+        self, rf: RequestFactory, organization_factory: OrganizationFactory
+    ):
+        organization = organization_factory(public=True)
+
+        def render() -> str:
+            request = rf.get("/organizations/")
+            request.user = AnonymousUser()
+            return organization_list_view(request).render().content.decode()
+
+        assert organization.name in render()
+        organization.name = "Renamed organization"
+        organization.save()
+        assert "Renamed organization" in render()
@@ -1,7 +1,9 @@
+from django.conf import settings
 from django.contrib.auth.mixins import (
     PermissionRequiredMixin as ModelPermissionRequiredMixin,
 )
 from django.core.exceptions import PermissionDenied
+from django.db.models.query import QuerySet
 from django.db.utils import IntegrityError
 from django.forms import BaseModelForm
 from django.urls import reverse_lazy
@@ -13,13 +15,14 @@ from django.views.generic import (
     UpdateView,
 )
 from guardian.mixins import PermissionRequiredMixin
-from guardian.shortcuts import assign_perm
 
+from demanage.organizations.cache import PublicListPaginator, get_public_list_version
 from demanage.organizations.forms import (
     OrganizationChangeForm,
     OrganizationCreationForm,
 )
 from demanage.organizations.models import Organization
+from demanage.permissions.shortcuts import bulk_assign_perms
 
 
 class OrganizationListView(ListView):
@@ -28,9 +31,33 @@ class OrganizationListView(ListView):
 
     - authenticated: list organization where user is member
     - un authenticated: list all public organizations
+
+    Public listing pages are cached as template fragments (see `cache` module).
     """
 
     model = Organization
+    paginate_by = 20
+
+    def is_public_listing(self) -> bool:
+        return not self.request.user.is_authenticated
+
+    def get_queryset(self) -> QuerySet:
+        organizations = Organization.objects.only("name", "slug")
+        if self.is_public_listing():
+            return organizations.public().order_by("name")
+        return organizations.for_user(self.request.user).order_by("name")
+
+    def get_paginator(self, *args, **kwargs):
+        if self.is_public_listing():
+            return PublicListPaginator(*args, **kwargs)
+        return super().get_paginator(*args, **kwargs)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        if self.is_public_listing():
+            context["cache_timeout"] = settings.ORGANIZATIONS_LIST_CACHE_TIMEOUT
+            context["cache_version"] = get_public_list_version()
+        return context
 
 
 organization_list_view = OrganizationListView.as_view()
@@ -86,17 +113,20 @@ class OrganizationCreateView(ModelPermissionRequiredMixin, CreateView):
             # Raise exception to respond with 403 error status
             raise PermissionDenied("You can not create more than one organization.")
 
-        for perm in [
-            # Organization management
-            "organizations.view_organization",
-            "organizations.change_organization",
-            "organizations.delete_organization",
-            # Member management
-            "organizations.view_member",
-            "organizations.invite_member",
-            "organizations.kick_member",
-        ]:
-            assign_perm(perm, self.request.user, self.object)
+        bulk_assign_perms(
+            [
+                # Organization management
+                "organizations.view_organization",
+                "organizations.change_organization",
+                "organizations.delete_organization",
+                # Member management
+                "organizations.view_member",
+                "organizations.invite_member",
+                "organizations.kick_member",
+            ],
+            Organization,
+            [(self.request.user.pk, self.object.pk)],
+        )
 
         return super().form_valid(form)  # redirect
 
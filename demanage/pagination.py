@@ -0,0 +1,242 @@
+"""
+Keyset (cursor) pagination shared by API resources.
+
+Unlike page number pagination it doesn't run `COUNT(*)` and doesn't scan skipped
+rows with `OFFSET`: page position is a `(value, id)` key of the last row and the
+next page is filtered with `WHERE (value, id) > (last_value, last_id)`.
+"""
+import json
+from base64 import b64decode, b64encode
+from binascii import Error as BinasciiError
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from django.db.models.query import QuerySet
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.filters import OrderingFilter
+from rest_framework.pagination import BasePagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+from rest_framework.views import APIView
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset pagination over `ordering` = (field, unique tie breaker field).
+
+    Direction of the ordering can be changed with the view `OrderingFilter`
+    (only by the first ordering field), other requested orderings are rejected.
+    """
+
+    ordering: Tuple[str, str] = ("-created", "-id")
+    page_size = 10
+    max_page_size = 30
+    page_size_query_param = "page_size"
+    cursor_query_param = "cursor"
+    invalid_cursor_message = _("Invalid cursor")
+    invalid_ordering_message = _(
+        "Only ordering by {field} is supported with cursor pagination."
+    )
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request: Request, view: Optional[APIView] = None
+    ) -> Optional[List[Any]]:
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.fields = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+
+        # Previous page is fetched in reversed order and reversed back
+        reverse = bool(self.cursor and self.cursor["r"])
+        fields = [self._invert(f) for f in self.fields] if reverse else self.fields
+
+        queryset = queryset.order_by(*fields)
+        if self.cursor:
+            position = self._to_python(queryset, self.cursor["p"])
+            queryset = queryset.filter(self._after(fields, position))
+
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+        if reverse:
+            results.reverse()
+
+        if reverse:
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, self.cursor is not None
+
+        self.page = results
+        return results
+
+    def get_paginated_response(self, data) -> Response:
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_paginated_response_schema(self, schema: dict) -> dict:
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "nullable": True},
+                "previous": {"type": "string", "nullable": True},
+                "results": schema,
+            },
+        }
+
+    def get_page_size(self, request: Request) -> int:
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_ordering(
+        self, request: Request, queryset: QuerySet, view: Optional[APIView]
+    ) -> List[str]:
+        """
+        Apply direction requested with the ordering filter to the keyset fields.
+
+        Raise `ValidationError` if other ordering is requested (the keyset
+        can't follow it).
+        """
+        field, tie_breaker = self.ordering
+        for backend in getattr(view, "filter_backends", []):
+            if not issubclass(backend, OrderingFilter):
+                continue
+            param = request.query_params.get(backend.ordering_param)
+            if not param:
+                continue
+
+            terms = [term.strip() for term in param.split(",") if term.strip()]
+            names = [term.lstrip("-") for term in terms]
+            if names[:1] != [field.lstrip("-")] or any(
+                name != tie_breaker.lstrip("-") for name in names[1:]
+            ):
+                message = self.invalid_ordering_message.format(field=field.lstrip("-"))
+                raise ValidationError({backend.ordering_param: [message]})
+            descending = terms[0].startswith("-")
+            return [
+                ("-" if descending else "") + name.lstrip("-")
+                for name in (field, tie_breaker)
+            ]
+        return [field, tie_breaker]
+
+    def get_next_link(self) -> Optional[str]:
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self) -> Optional[str]:
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(
+                self.request.build_absolute_uri(), self.cursor_query_param
+            )
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def encode_cursor(self, item: Any, reverse: bool) -> str:
+        position = [
+            self._serialize(self._value(item, name.lstrip("-"))) for name in self.fields
+        ]
+        cursor = json.dumps({"p": position, "r": int(reverse)}, separators=(",", ":"))
+        encoded = b64encode(cursor.encode("ascii")).decode("ascii")
+        return replace_query_param(
+            self.request.build_absolute_uri(), self.cursor_query_param, encoded
+        )
+
+    def decode_cursor(self, request: Request) -> Optional[dict]:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+
+        try:
+            cursor = json.loads(b64decode(encoded.encode("ascii")).decode("ascii"))
+            assert isinstance(cursor["p"], list) and len(cursor["p"]) == 2
+            assert cursor["r"] in (0, 1)
+        except (AssertionError, BinasciiError, KeyError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+        return cursor
+
+    @staticmethod
+    def _invert(field: str) -> str:
+        return field[1:] if field.startswith("-") else f"-{field}"
+
+    @staticmethod
+    def _serialize(value: Any) -> str:
+        if hasattr(value, "isoformat"):
+            return value.isoformat()
+        return str(value)
+
+    @staticmethod
+    def _value(item: Any, name: str) -> Any:
+        if isinstance(item, dict):
+            return item[name]
+        return getattr(item, name)
+
+    def _to_python(self, queryset: QuerySet, position: List[str]) -> List[Any]:
+        try:
+            return [
+                queryset.model._meta.get_field(name.lstrip("-")).to_python(value)
+                for name, value in zip(self.fields, position)
+            ]
+        except DjangoValidationError:
+            raise NotFound(self.invalid_cursor_message)
+
+    @staticmethod
+    def _after(fields: List[str], position: List[Any]) -> Q:
+        """
+        Build `(field, tie_breaker) > (value, id)` for the direction of the fields.
+        """
+        (field, tie_breaker), (value, key) = fields, position
+        field_op = "lt" if field.startswith("-") else "gt"
+        tie_op = "lt" if tie_breaker.startswith("-") else "gt"
+        field, tie_breaker = field.lstrip("-"), tie_breaker.lstrip("-")
+
+        # Redundant range condition lets the planner use (field, id) index range
+        return Q(**{f"{field}__{field_op}e": value}) & (
+            Q(**{f"{field}__{field_op}": value})
+            | Q(**{field: value, f"{tie_breaker}__{tie_op}": key})
+        )
+
+
+class CursorPaginationMixin:
+    """
+    View mixin switching to `cursor_pagination_class` per request.
+
+    Cursor pagination is selected with `?pagination=cursor` (or with `?cursor=`).
+    """
+
+    cursor_pagination_class = KeysetPagination
+    pagination_mode_query_param = "pagination"
+
+    def uses_cursor_pagination(self) -> bool:
+        query_params = self.request.query_params
+        return (
+            query_params.get(self.pagination_mode_query_param) == "cursor"
+            or "cursor" in query_params
+        )
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator"):
+            if self.uses_cursor_pagination():
+                self._paginator = self.cursor_pagination_class()
+            else:
+                return super().paginator
+        return self._paginator
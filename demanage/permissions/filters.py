@@ -1,7 +1,8 @@
 import django
 import django_filters
 from django.contrib.auth.models import User
-from guardian.models import UserObjectPermission
+
+from demanage.boards.models import BoardRole, BoardUserObjectPermission
 
 
 class UserBoardPermissionFilter(django_filters.FilterSet):
@@ -11,5 +12,13 @@ class UserBoardPermissionFilter(django_filters.FilterSet):
     )
 
     class Meta:
-        model = UserObjectPermission
+        model = BoardUserObjectPermission
         fields = []
+
+
+class BoardRoleFilter(django_filters.FilterSet):
+    user = django_filters.CharFilter(field_name="user__username", lookup_expr="exact")
+
+    class Meta:
+        model = BoardRole
+        fields = ["role"]
@@ -1,10 +1,10 @@
 from django.contrib.auth.models import Permission
 from django.db.models import query
-from guardian.models import UserObjectPermission
 from rest_framework import serializers
 from rest_framework.fields import HiddenField
 
-from demanage.boards.models import Board
+from demanage.boards import roles
+from demanage.boards.models import Board, BoardRole, BoardUserObjectPermission
 from demanage.users.api.serializers import User
 
 
@@ -33,7 +33,7 @@ class UserBoardPermissionDeserializer(serializers.ModelSerializer):
     )
 
     class Meta:
-        model = UserObjectPermission
+        model = BoardUserObjectPermission
         fields = ["slug", "code", "username"]
 
 
@@ -45,5 +45,20 @@ class UserBoardPermissionSerializer(serializers.ModelSerializer):
     user = serializers.SlugRelatedField(slug_field="username", read_only=True)
 
     class Meta:
-        model = UserObjectPermission
+        model = BoardUserObjectPermission
         fields = ["board", "permission", "user"]
+
+
+class BoardRoleSerializer(serializers.ModelSerializer):
+    username = serializers.SlugRelatedField(
+        source="user", slug_field="username", queryset=User.objects.all()
+    )
+    permissions = serializers.SerializerMethodField()
+
+    class Meta:
+        model = BoardRole
+        fields = ["username", "role", "permissions"]
+
+    def get_permissions(self, obj: BoardRole) -> list:
+        """Permission codenames bundled by the role."""
+        return roles.get_permissions(obj.role)
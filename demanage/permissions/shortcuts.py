@@ -0,0 +1,127 @@
+"""
+Bulk object permission grants/revokes (guardian `UserObjectPermission` or
+direct foreign key permission model of the object, e.g. `BoardUserObjectPermission`).
+
+Unlike `guardian.shortcuts.assign_perm`/`remove_perm` (permission and content
+type lookup and a write per call) permissions are resolved from in-process
+cache and all grants are written with one query.
+
+Grants are written without `post_save`/`post_delete` signals: call
+`boards.bulk.after_bulk_write` after granting/revoking board permissions.
+"""
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Set, Tuple, Type
+
+from django.contrib.auth.models import Permission
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Model, Q
+from django.db.models.signals import post_migrate
+from django.dispatch import receiver
+from guardian.exceptions import WrongAppError
+from guardian.utils import get_user_obj_perms_model
+
+Grant = Tuple[int, Any]  # (user_id, object_pk)
+
+_permission_ids: Dict[Tuple[int, str], int] = {}
+
+
+def get_permission_ids(content_type: ContentType, perms: Iterable[str]) -> List[int]:
+    """
+    Return IDs of the permissions (`codename` or `app_label.codename`)
+    of the content type.
+    """
+    codenames = []
+    for perm in perms:
+        app_label, _, codename = perm.rpartition(".")
+        if app_label and app_label != content_type.app_label:
+            raise WrongAppError(
+                f"Given permission {perm} is for other app than {content_type}"
+            )
+        codenames.append(codename)
+
+    missing = {c for c in codenames if (content_type.pk, c) not in _permission_ids}
+    if missing:
+        for pk, codename in Permission.objects.filter(
+            content_type=content_type, codename__in=missing
+        ).values_list("pk", "codename"):
+            _permission_ids[content_type.pk, codename] = pk
+
+    try:
+        return [_permission_ids[content_type.pk, c] for c in codenames]
+    except KeyError as e:
+        raise Permission.DoesNotExist(f"Permission {e.args[0][1]} does not exist")
+
+
+def clear_permission_cache() -> None:
+    _permission_ids.clear()
+
+
+@receiver(post_migrate)
+def permission_cache_receiver(**kwargs):
+    """
+    Permissions may be recreated by migrations (e.g. test database).
+    """
+    clear_permission_cache()
+
+
+def bulk_assign_perms(
+    perms: Iterable[str], model: Type[Model], grants: Iterable[Grant]
+) -> List[Model]:
+    """
+    Grant permissions for the model objects to users by `(user_id, object_pk)`
+    pairs. Existing grants are ignored.
+    """
+    content_type = ContentType.objects.get_for_model(model)
+    permission_ids = get_permission_ids(content_type, perms)
+    permission_model = get_user_obj_perms_model(model)
+    return permission_model.objects.bulk_create(
+        [
+            permission_model(
+                permission_id=permission_id,
+                user_id=user_id,
+                **_object_fields(permission_model, content_type, object_pk),
+            )
+            for user_id, object_pk in set(grants)
+            for permission_id in permission_ids
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def bulk_remove_perms(
+    perms: Iterable[str], model: Type[Model], grants: Iterable[Grant]
+) -> int:
+    """
+    Revoke permissions for the model objects from users by `(user_id, object_pk)`
+    pairs. Return number of revoked grants.
+    """
+    by_object: Dict[Any, Set[int]] = defaultdict(set)
+    for user_id, object_pk in grants:
+        by_object[object_pk].add(user_id)
+    if not by_object:
+        return 0
+
+    content_type = ContentType.objects.get_for_model(model)
+    permission_model = get_user_obj_perms_model(model)
+    condition = Q()
+    for object_pk, user_ids in by_object.items():
+        condition |= Q(
+            user_id__in=user_ids,
+            **_object_fields(permission_model, content_type, object_pk),
+        )
+    deleted, _ = permission_model.objects.filter(
+        condition, permission_id__in=get_permission_ids(content_type, perms)
+    ).delete()
+    return deleted
+
+
+def _object_fields(
+    permission_model: Type[Model], content_type: ContentType, object_pk: Any
+) -> Dict[str, Any]:
+    """
+    Return object fields of generic (`UserObjectPermission`) or direct foreign key
+    (e.g. `BoardUserObjectPermission`) permission model.
+    """
+    if permission_model.objects.is_generic():
+        return {"content_type": content_type, "object_pk": str(object_pk)}
+    return {"content_object_id": object_pk}
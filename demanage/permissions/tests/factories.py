@@ -1,11 +1,8 @@
 from django.contrib.auth.models import Permission
-
-# from django.contrib.contenttypes.models import ContentType
 from factory import LazyAttribute, SubFactory
 from factory.django import DjangoModelFactory
-from guardian.models import UserObjectPermission
 
-# from demanage.boards.models import Board
+from demanage.boards.models import BoardUserObjectPermission
 from demanage.boards.tests.factories import BoardFactory
 from demanage.users.tests.factories import UserFactory
 
@@ -16,12 +13,9 @@ class UserObjectPermissionFactory(DjangoModelFactory):
     """
 
     content_object = SubFactory(BoardFactory)
-    # content_object does the same as:
-    # content_type = ContentType.objects.get_for_model(Board)
-    # object_pk = BoardFactory.create().pk
     # permission = Permission.objects.get(codename="view_board")
     permission = LazyAttribute(lambda o: Permission.objects.get(codename="view_board"))
     user = SubFactory(UserFactory)
 
     class Meta:
-        model = UserObjectPermission
+        model = BoardUserObjectPermission
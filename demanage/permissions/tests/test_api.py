@@ -2,6 +2,8 @@ import pytest
 from django.contrib.auth.models import Permission
 from django.urls import reverse
 
+from demanage.boards.models import BoardRole
+
 pytestmark = pytest.mark.django_db
 
 
@@ -91,3 +93,66 @@ def test_remove_user_board_object_permission_positive(
     assert response.status_code == 200
     with pytest.raises(perm1.DoesNotExist):
         perm1.refresh_from_db()
+
+
+def test_list_permissions_query_budget(
+    board, make_user_board_perm, api_client_factory, django_assert_max_num_queries
+):
+    make_user_board_perm(content_object=board)
+    make_user_board_perm(content_object=board)
+    api_client = api_client_factory(board.organization.representative)
+    url = reverse("api:board-permission-list", kwargs={"slug": board.slug})
+
+    # Token, board with organization, visibility and permissions
+    with django_assert_max_num_queries(5):
+        response = api_client.get(url)
+
+    assert response.status_code == 200
+
+
+def test_assign_and_change_board_role(member, make_board, api_client_factory):
+    board = make_board(organization=member.organization, public=False)
+    api_client = api_client_factory(member.organization.representative)
+    url = reverse("api:board-role-list", kwargs={"slug": board.slug})
+
+    data = {"username": member.user.username, "role": "viewer"}
+    response = api_client.post(url, data)
+    assert response.status_code == 201
+    assert response.data["permissions"] == ["view_board"]
+
+    response = api_client.post(url, {**data, "role": "admin"})
+    assert response.status_code == 200
+    assert BoardRole.objects.get(board=board, user=member.user).role == "admin"
+
+    response = api_client.get(url, {"role": "admin"})
+    assert [r["username"] for r in response.data] == [member.user.username]
+
+
+def test_board_admin_can_manage_roles(member_factory, make_board, api_client_factory):
+    admin = member_factory()
+    board = make_board(organization=admin.organization, public=False)
+    BoardRole.objects.create(user=admin.user, board=board, role="admin")
+    other = member_factory(organization=admin.organization)
+    BoardRole.objects.create(user=other.user, board=board, role="editor")
+    api_client = api_client_factory(admin.user)
+
+    response = api_client.delete(
+        reverse(
+            "api:board-role-detail",
+            kwargs={"slug": board.slug, "username": other.user.username},
+        )
+    )
+
+    assert response.status_code == 200
+    assert not BoardRole.objects.filter(user=other.user).exists()
+
+
+def test_editor_can_not_manage_roles(member, make_board, api_client_factory):
+    board = make_board(organization=member.organization, public=False)
+    BoardRole.objects.create(user=member.user, board=board, role="editor")
+    api_client = api_client_factory(member.user)
+
+    url = reverse("api:board-role-list", kwargs={"slug": board.slug})
+    response = api_client.get(url)
+
+    assert response.status_code == 403
@@ -1,5 +1,8 @@
 import pytest
+from rest_framework.renderers import JSONRenderer
 
+from demanage.boards.models import BoardUserObjectPermission
+from demanage.fast_serializers import serialize_values
 from demanage.permissions.serializers import (
     UserBoardPermissionDeserializer,
     UserBoardPermissionSerializer,
@@ -30,3 +33,20 @@ def test_list_serialize_user_board_perm_to_dict(make_user_board_perm):
 
     serializer = UserBoardPermissionSerializer(instance=[perm1, perm2], many=True)
     assert len(serializer.data) == 2
+
+
+def test_serialize_values_output_is_identical(board, make_user_board_perm):
+    make_user_board_perm(content_object=board)
+    make_user_board_perm(content_object=board)
+    permissions = BoardUserObjectPermission.objects.filter(
+        content_object=board
+    ).order_by("id")
+
+    data = serialize_values(
+        UserBoardPermissionSerializer(), permissions, {"board": board.slug}
+    )
+
+    renderer = JSONRenderer()
+    assert renderer.render(data) == renderer.render(
+        UserBoardPermissionSerializer(permissions, many=True).data
+    )
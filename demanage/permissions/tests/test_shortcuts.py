@@ -0,0 +1,46 @@
+import pytest
+from django.contrib.auth.models import Permission
+from guardian.exceptions import WrongAppError
+
+from demanage.organizations.models import Organization
+from demanage.permissions.shortcuts import bulk_assign_perms, bulk_remove_perms
+from demanage.users.tests.factories import UserFactory
+
+pytestmark = pytest.mark.django_db
+
+PERMS = ["organizations.view_organization", "view_member"]
+
+
+def test_bulk_assign_perms(organization, django_assert_max_num_queries):
+    users = UserFactory.create_batch(3)
+    grants = [(user.pk, organization.pk) for user in users]
+    bulk_assign_perms(PERMS, Organization, grants)
+
+    # Permissions are cached, grants are written with one query
+    with django_assert_max_num_queries(1):
+        bulk_assign_perms(PERMS, Organization, grants)  # existing are ignored
+
+    for user in users:
+        assert user.has_perm("organizations.view_organization", organization)
+        assert user.has_perm("organizations.view_member", organization)
+
+
+def test_bulk_remove_perms(organization_factory):
+    first, second = organization_factory.create_batch(2)
+    user = UserFactory()
+    grants = [(user.pk, first.pk), (user.pk, second.pk)]
+    bulk_assign_perms(PERMS, Organization, grants)
+
+    assert bulk_remove_perms(PERMS, Organization, grants[:1]) == 2
+
+    user = type(user).objects.get(pk=user.pk)
+    assert not user.has_perm("organizations.view_member", first)
+    assert user.has_perm("organizations.view_member", second)
+    assert bulk_remove_perms(PERMS, Organization, []) == 0
+
+
+def test_bulk_assign_unknown_perm(organization):
+    with pytest.raises(Permission.DoesNotExist):
+        bulk_assign_perms(["fly_organization"], Organization, [(1, organization.pk)])
+    with pytest.raises(WrongAppError):
+        bulk_assign_perms(["boards.view_member"], Organization, [(1, organization.pk)])
@@ -3,25 +3,56 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Permission
 from django.contrib.contenttypes.models import ContentType
 from django.utils.translation import gettext_lazy as _
-from guardian.models import UserObjectPermission
 from guardian.shortcuts import remove_perm
 from rest_framework import status
 from rest_framework.authentication import TokenAuthentication
 from rest_framework.exceptions import NotFound, PermissionDenied
-from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response
 from rest_framework.viewsets import ViewSet
 
-from demanage.boards.models import Board
+from demanage.activity.log import record
+from demanage.boards.models import Board, BoardRole, BoardUserObjectPermission
+from demanage.fast_serializers import serialize_values
+from demanage.utils.resolvers import resolve_object
 
-from .filters import UserBoardPermissionFilter
+from .filters import BoardRoleFilter, UserBoardPermissionFilter
 from .permissions import BoardUserPermissionPermission
-from .serializers import UserBoardPermissionDeserializer, UserBoardPermissionSerializer
+from .serializers import (
+    BoardRoleSerializer,
+    UserBoardPermissionDeserializer,
+    UserBoardPermissionSerializer,
+)
 
 User = get_user_model()
 
 
-class BoardUserPermissionViewSet(ViewSet):
+class BoardAdministrationMixin:
+    """
+    Board of the URL (`slug`) administrated by its organization representative
+    or board admin (`manage_board` role permission).
+    """
+
+    def get_board(self) -> Board:
+        slug = self.kwargs["slug"]
+        # Check if board exists (organization is needed to check representative)
+        board = resolve_object(
+            self.request, Board, select_related=["organization"], slug=slug
+        )
+
+        # Check if board is visible
+        if not self.request.user.can_view_board(board):
+            raise NotFound(_("Board is not found"))  # or change to generic message
+
+        # Check can do operations with permission on board
+        if board.organization.representative_id != self.request.user.pk and (
+            not self.request.user.has_perm("boards.manage_board", board)
+        ):
+            raise PermissionDenied
+
+        return board
+
+
+class BoardUserPermissionViewSet(BoardAdministrationMixin, ViewSet):
     """
     View set (resource) for administrating board permissions.
     """
@@ -38,6 +69,13 @@ class BoardUserPermissionViewSet(ViewSet):
 
         serializer.is_valid(raise_exception=True)
         user_board_permission = serializer.save()
+        record(
+            "permission.assigned",
+            board.organization_id,
+            board.pk,
+            user_board_permission.user.username,
+            {"permission": user_board_permission.permission.codename},
+        )
 
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
@@ -50,17 +88,18 @@ class BoardUserPermissionViewSet(ViewSet):
         - filter by permission: `?permission=view_board`
         """
         board = self.get_board()
-        board_permissions = UserObjectPermission.objects.filter(
-            content_type=ContentType.objects.get_for_model(Board), object_pk=board.pk
+        board_permissions = BoardUserObjectPermission.objects.filter(
+            content_object=board
         )
 
         filter = UserBoardPermissionFilter(request.query_params, board_permissions)
         board_permissions = filter.qs
 
-        serializer = UserBoardPermissionSerializer(
-            instance=board_permissions, many=True
+        # All permissions are on the board (compiled without generic relation)
+        data = serialize_values(
+            UserBoardPermissionSerializer(), board_permissions, {"board": board.slug}
         )
-        return Response(serializer.data)
+        return Response(data)
 
     def destroy(self, request, slug, code, username):
         """Remove permission on board for the user."""
@@ -78,29 +117,80 @@ class BoardUserPermissionViewSet(ViewSet):
             raise NotFound("Permission with specified code not found.")
 
         remove_perm(permission, user, board)
+        record(
+            "permission.removed",
+            board.organization_id,
+            board.pk,
+            user.username,
+            {"permission": permission.codename},
+        )
 
         return Response({"detail": "Permission was removed for the user."})
 
-    def get_board(self) -> Board:
-        slug = self.kwargs["slug"]
-        # Check if board exists
-        board = get_object_or_404(Board, slug=slug)
 
-        # Check if board is visible
-        if not self.request.user.can_view_board(board):
-            raise NotFound(_("Board is not found"))  # or change to generic message
+class BoardRoleViewSet(BoardAdministrationMixin, ViewSet):
+    """
+    View set (resource) for administrating board roles (one role per user).
+    """
 
-        # Check can do operations with permission on board
-        if not board.organization.representative == self.request.user:
-            raise PermissionDenied
+    authentication_classes = [TokenAuthentication]
+    permission_classes = [BoardUserPermissionPermission]
 
-        return board
+    def list(self, request, **kwargs):
+        """List roles on the board with permissions they bundle.
+
+        - filter by user: `?user=egor`
+        - filter by role: `?role=editor`
+        """
+        board = self.get_board()
+        board_roles = BoardRole.objects.filter(board=board).select_related("user")
+        filter = BoardRoleFilter(request.query_params, board_roles.order_by("id"))
+        return Response(BoardRoleSerializer(filter.qs, many=True).data)
+
+    def create(self, request, **kwargs):
+        """Assign (or change) role of the user on the board."""
+        board = self.get_board()
+        serializer = BoardRoleSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        user = serializer.validated_data["user"]
+        board_role, created = BoardRole.objects.update_or_create(
+            user=user, board=board, defaults={"role": serializer.validated_data["role"]}
+        )
+        record(
+            "role.assigned",
+            board.organization_id,
+            board.pk,
+            user.username,
+            {"role": board_role.role},
+        )
+
+        return Response(
+            BoardRoleSerializer(board_role).data,
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+        )
+
+    def destroy(self, request, slug, username):
+        """Remove role of the user on the board."""
+        board = self.get_board()
+        board_role = BoardRole.objects.filter(
+            board=board, user__username=username
+        ).first()
+        if board_role is None:
+            raise NotFound("User with specified username has no role on the board.")
+
+        board_role.delete()
+        record("role.removed", board.organization_id, board.pk, username)
+
+        return Response({"detail": "Role was removed for the user."})
 
 
 board_permission_list_view = BoardUserPermissionViewSet.as_view(
     {"get": "list", "post": "create"}
 )
 board_permission_detail_view = BoardUserPermissionViewSet.as_view({"delete": "destroy"})
+board_role_list_view = BoardRoleViewSet.as_view({"get": "list", "post": "create"})
+board_role_detail_view = BoardRoleViewSet.as_view({"delete": "destroy"})
 
 # class PermissionViewSet(viewsets.ModelViewSet):
 #     """
@@ -1,10 +1,12 @@
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
+from demanage.fieldsets import SparseFieldsetsMixin
+
 User = get_user_model()
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ["username", "name", "url"]
@@ -27,13 +27,7 @@ class User(AbstractUser):
         """
         Check whether the user is able to view the board.
         """
-        if board.organization.representative == self:
+        if self.is_superuser:
             return True
 
-        if board.public and self in board.organization.members:
-            return True
-
-        if self.has_perm("view_board", board):
-            return True
-
-        return False
+        return board.visibility.filter(user=self).exists()
@@ -31,3 +31,14 @@ class TestUserViewSet:
             "name": user.name,
             "url": f"http://testserver/api/users/{user.username}/",
         }
+
+    def test_me_sparse_fieldsets(self, user: User, rf: RequestFactory):
+        view = UserViewSet()
+        request = rf.get("/fake-url/", {"omit": "url"})
+        request.user = user
+
+        view.request = request
+
+        response = view.me(request)
+
+        assert response.data == {"username": user.username, "name": user.name}
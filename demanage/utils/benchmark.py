@@ -0,0 +1,39 @@
+"""
+Helpers for management command benchmarks (`bench_*` commands).
+"""
+import statistics
+import time
+from typing import Callable, Dict
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def measure(func: Callable[[], object], repeat: int = 20) -> Dict[str, float]:
+    """
+    Call the function `repeat` times (after one warm up call) and return
+    latency percentiles (ms) and number of queries of the last call.
+    """
+    func()  # warm up caches and connection
+
+    timings = []
+    for _ in range(repeat):
+        with CaptureQueriesContext(connection) as context:
+            start = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - start) * 1000)
+
+    timings.sort()
+    return {
+        "p50": statistics.median(timings),
+        "p95": timings[min(len(timings) - 1, int(len(timings) * 0.95))],
+        "mean": statistics.mean(timings),
+        "queries": len(context.captured_queries),
+    }
+
+
+def format_result(name: str, result: Dict[str, float]) -> str:
+    return (
+        f"{name:<32} p50 {result['p50']:9.2f} ms  p95 {result['p95']:9.2f} ms  "
+        f"mean {result['mean']:9.2f} ms  queries {result['queries']:.0f}"
+    )
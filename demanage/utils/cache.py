@@ -0,0 +1,43 @@
+"""
+Version counters for O(1) cache invalidation.
+
+Cached values are keyed by the version of the data they depend on, bumping the
+version makes all of them unreachable (they expire by timeout).
+"""
+from typing import Dict, Iterable
+
+from django.core.cache import cache
+from django.db import transaction
+
+VERSION_TIMEOUT = None  # version counters never expire
+
+
+def get_versions(keys: Iterable[str]) -> Dict[str, int]:
+    """
+    Return current version of each key (missing versions are initialized).
+    """
+    keys = list(keys)
+    versions = cache.get_many(keys)
+    missing = {key: 1 for key in keys if key not in versions}
+    if missing:
+        cache.set_many(missing, VERSION_TIMEOUT)
+        versions.update(missing)
+    return versions
+
+
+def bump_version(key: str) -> None:
+    """
+    Increment version of the key now and once more after transaction commit.
+
+    Second bump invalidates values cached by concurrent requests which have
+    read the data before the transaction was committed.
+    """
+
+    def bump():
+        try:
+            cache.incr(key)
+        except ValueError:  # not set yet
+            cache.set(key, 2, VERSION_TIMEOUT)
+
+    bump()
+    transaction.on_commit(bump)
@@ -0,0 +1,40 @@
+"""
+Request-scoped memoization of object lookups.
+
+Permission classes and views of one request often look up the same object
+(e.g. organization by the URL slug). `resolve_object` fetches it once per
+request (with the relations permission checks need) and keeps it on the request.
+"""
+from typing import Iterable, Type, TypeVar
+
+from django.db.models import Model
+from django.http import Http404
+from rest_framework.generics import get_object_or_404
+
+ModelT = TypeVar("ModelT", bound=Model)
+
+RESOLVED_ATTRIBUTE = "_resolved_objects"
+
+
+def resolve_object(
+    request, model: Type[ModelT], select_related: Iterable[str] = (), **lookup
+) -> ModelT:
+    """
+    Return object matching the lookup (raise 404) fetched once per request.
+    """
+    http_request = getattr(request, "_request", request)  # DRF request wraps it
+    resolved = http_request.__dict__.setdefault(RESOLVED_ATTRIBUTE, {})
+
+    select_related = tuple(select_related)
+    key = (model._meta.label, select_related, tuple(sorted(lookup.items())))
+    if key not in resolved:
+        queryset = model._default_manager.select_related(*select_related)
+        try:
+            resolved[key] = get_object_or_404(queryset, **lookup)
+        except Http404 as e:
+            resolved[key] = e
+
+    result = resolved[key]
+    if isinstance(result, Http404):
+        raise result
+    return result